@@ -0,0 +1,221 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Measures the throughput of exchanging mesh vertex coordinates between Blender and a notebook client.
+
+A fresh, background Blender runs `bpy_jupyter.headless`, and creates meshes of increasing vertex count.
+Then, a `jupyter_client` client on the same machine gets their vertex coordinates as a `numpy` array:
+
+- **`buffers`**: With `bpy_jupyter.utils.binary_buffers.send_foreach()`, as a raw binary message buffer.
+- **`json`**: With `foreach_get()`, then `json.dumps(array.tolist())` in `user_expressions`, as a JSON string in `execute_reply`.
+- **`shared`**: With `bpy_jupyter.utils.shared_array_comm`, by mapping a shared memory segment filled with `foreach_get`, then copying it.
+
+Throughput is the number of bytes of the array, divided by the time from sending the request until the client holds the array.
+Finally, **`shared write`** is the throughput of the reverse direction: Writing into shared memory in the client, then into the mesh with `foreach_set`.
+
+Usage:
+	```bash
+	python benchmarks/binary_buffers.py --blender /path/to/blender
+	```
+
+	The extension must already be installed in Blender (ex. by dropping a `uv run blext build` `.zip` into Blender).
+	If it isn't installed into the `user_default` repository, pass its module name with `--module`.
+
+Exit Codes:
+	`0` when the arrays received with all methods were identical.
+	`1` otherwise.
+"""
+
+import argparse
+import ast
+import collections.abc as cabc
+import functools
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import jupyter_client
+import numpy as np
+from headless_kernel import add_blender_arguments, headless_client
+
+sys.path.append(
+	str(Path(__file__).resolve().parent.parent / 'bpy_jupyter' / 'standalone')
+)
+import bpy_jupyter_buffers
+import bpy_jupyter_shared
+
+####################
+# - Constants
+####################
+VERTEX_COUNTS = (10**4, 10**5, 10**6, 4 * 10**6)
+
+SETUP_CODE = """
+import importlib
+import json
+import bpy
+import numpy as np
+binary_buffers = importlib.import_module({module!r} + '.utils.binary_buffers')
+shared_arrays = importlib.import_module({module!r} + '.utils.shared_array_comm').current_exchange()
+
+def make_mesh(num_verts):
+	for mesh in list(bpy.data.meshes):
+		bpy.data.meshes.remove(mesh)
+	mesh = bpy.data.meshes.new('benchmark')
+	mesh.vertices.add(num_verts)
+	mesh.vertices.foreach_set('co', np.random.default_rng(0).random(3 * num_verts, dtype='<f4'))
+	return mesh
+"""
+
+
+####################
+# - Measurements
+####################
+def get_buffers(client: jupyter_client.BlockingKernelClient) -> np.ndarray:
+	"""Get vertex coordinates of `mesh`, as a raw binary message buffer."""
+	arrays = bpy_jupyter_buffers.execute_arrays(
+		client,
+		"binary_buffers.send_foreach(mesh.vertices, 'co', components=3)",
+		timeout=600,
+	)
+	return arrays['co']
+
+
+def get_json(client: jupyter_client.BlockingKernelClient) -> np.ndarray:
+	"""Get vertex coordinates of `mesh`, as a JSON string in `execute_reply`."""
+	reply = client.execute_interactive(
+		'',
+		user_expressions={
+			'co': "json.dumps(binary_buffers.foreach_get(mesh.vertices, 'co', components=3).tolist())"
+		},
+		timeout=600,
+	)
+	expression = reply['content']['user_expressions']['co']
+	return np.array(
+		json.loads(ast.literal_eval(expression['data']['text/plain'])), dtype='<f4'
+	)
+
+
+def get_shared(
+	client: jupyter_client.BlockingKernelClient,
+	*,
+	shared: bpy_jupyter_shared.SharedArrayClient,
+) -> np.ndarray:
+	"""Get vertex coordinates of `mesh`, by mapping shared memory, then copying it."""
+	_ = client.execute_interactive(
+		"shared_arrays.publish_foreach(mesh.vertices, 'co', components=3)",
+		timeout=600,
+	)
+	with shared.acquire('co') as co:
+		return co.copy()
+
+
+def set_shared(
+	client: jupyter_client.BlockingKernelClient,
+	*,
+	shared: bpy_jupyter_shared.SharedArrayClient,
+	array: np.ndarray,
+) -> np.ndarray:
+	"""Set vertex coordinates of `mesh`, by writing into shared memory, then using `foreach_set`."""
+	with shared.allocate('positions', array.shape, array.dtype) as positions:
+		positions[...] = array
+	_ = client.execute_interactive(
+		"shared_arrays.foreach_set(mesh.vertices, 'co', key='positions')",
+		timeout=600,
+	)
+	return array
+
+
+def best_mb_s(
+	client: jupyter_client.BlockingKernelClient,
+	get_array: cabc.Callable[[jupyter_client.BlockingKernelClient], np.ndarray],
+	*,
+	repeats: int,
+) -> tuple[float, np.ndarray]:
+	"""Best throughput, in MB/s, of getting the vertex coordinates over `repeats` attempts."""
+	best_sec = float('inf')
+	array = np.empty(0)
+	for _ in range(repeats):
+		time_start = time.perf_counter()
+		array = get_array(client)
+		best_sec = min(best_sec, time.perf_counter() - time_start)
+	return array.nbytes / best_sec / 1e6, array
+
+
+####################
+# - Main
+####################
+def main() -> int:
+	"""Run the benchmark, returning the process exit code."""
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	add_blender_arguments(parser)
+	parser.add_argument(
+		'--repeats',
+		type=int,
+		default=3,
+		help='Number of transfers per vertex count, of which the fastest is kept.',
+	)
+	args = parser.parse_args()
+
+	mismatch = False
+	with (
+		tempfile.TemporaryDirectory(prefix='bpy_jupyter-') as tmp_dir,
+		headless_client(args, Path(tmp_dir)) as client,
+	):
+		_ = client.execute_interactive(SETUP_CODE.format(module=args.module))
+		shared = bpy_jupyter_shared.SharedArrayClient(client)
+
+		print(
+			f'{"vertices":>10} | {"MB":>8} | {"buffers [MB/s]":>14} | {"json [MB/s]":>12}'
+			f' | {"shared [MB/s]":>13} | {"shared write [MB/s]":>19}'
+		)
+		for num_verts in VERTEX_COUNTS:
+			_ = client.execute_interactive(
+				f'mesh = make_mesh({num_verts})', timeout=600
+			)
+			buffers_mb_s, buffers_array = best_mb_s(
+				client, get_buffers, repeats=args.repeats
+			)
+			json_mb_s, json_array = best_mb_s(client, get_json, repeats=args.repeats)
+			shared_mb_s, shared_array = best_mb_s(
+				client,
+				functools.partial(get_shared, shared=shared),
+				repeats=args.repeats,
+			)
+			write_mb_s, _ = best_mb_s(
+				client,
+				functools.partial(set_shared, shared=shared, array=shared_array[::-1]),
+				repeats=args.repeats,
+			)
+			mismatch |= not np.array_equal(buffers_array, json_array)
+			mismatch |= not np.array_equal(buffers_array, shared_array)
+
+			print(
+				f'{len(buffers_array):>10} | {buffers_array.nbytes / 1e6:>8.1f} |'
+				f' {buffers_mb_s:>14.1f} | {json_mb_s:>12.1f} |'
+				f' {shared_mb_s:>13.1f} | {write_mb_s:>19.1f}'
+			)
+
+		shared.close()
+
+	if mismatch:
+		print('FAIL: Arrays received with different methods differ.')
+	return 1 if mismatch else 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
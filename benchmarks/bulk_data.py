@@ -0,0 +1,182 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Measures reading and writing `bpy` data with the `bulk` accessors, against plain Python loops.
+
+A fresh, background Blender runs `bpy_jupyter.headless`, and creates a mesh and many empties, with keyframes and custom properties.
+Then, a `jupyter_client` client has the kernel time each case both ways, in the same cell:
+
+- **`loop`**: With a Python loop over `bpy` objects, ex. `[v.co[:] for v in mesh.vertices]`.
+- **`bulk`**: With `bpy_jupyter.utils.bulk_data.BulkData`, which is named `bulk` in the kernel's namespace.
+
+Each time is the fastest of `--repeats` runs; results are sent back as JSON in `user_expressions`.
+
+Usage:
+	```bash
+	python benchmarks/bulk_data.py --blender /path/to/blender
+	```
+
+	The extension must already be installed in Blender (ex. by dropping a `uv run blext build` `.zip` into Blender).
+	If it isn't installed into the `user_default` repository, pass its module name with `--module`.
+
+Exit Codes:
+	`0` when both ways read the same data in every case.
+	`1` otherwise.
+"""
+
+import argparse
+import ast
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+from headless_kernel import add_blender_arguments, headless_client
+
+####################
+# - Constants
+####################
+SETUP_CODE = """
+import json
+import timeit
+import bpy
+import numpy as np
+
+mesh = bpy.data.meshes.new('benchmark')
+mesh.vertices.add({num_verts})
+mesh.vertices.foreach_set('co', np.random.default_rng(0).random(3 * {num_verts}, dtype='<f4'))
+mesh.update()
+
+for _ in range({num_objects}):
+	obj = bpy.data.objects.new('benchmark', None)
+	obj['weight'] = 1.0
+objects = bpy.data.objects
+
+action = bpy.data.actions.new('benchmark')
+fcurve = action.fcurves.new('location', index=0)
+fcurve.keyframe_points.add({num_keyframes})
+fcurve.keyframe_points.foreach_set('co', np.arange(2 * {num_keyframes}, dtype='<f4'))
+
+CASES = {{
+	'vertex positions (read)': (
+		lambda: np.array([v.co[:] for v in mesh.vertices], dtype='<f4'),
+		lambda: bulk.vertex_positions(mesh, reuse=True),
+	),
+	'vertex positions (write)': (
+		lambda: [setattr(v, 'co', v.co) for v in mesh.vertices],
+		lambda: bulk.set_vertex_positions(mesh, bulk.vertex_positions(mesh, reuse=True)),
+	),
+	'locations (read)': (
+		lambda: np.array([obj.location[:] for obj in objects], dtype='<f4'),
+		lambda: bulk.locations(objects, reuse=True),
+	),
+	'matrices (read)': (
+		lambda: np.array([obj.matrix_world for obj in objects], dtype='<f4'),
+		lambda: bulk.matrices(objects, reuse=True),
+	),
+	'custom property (read)': (
+		lambda: np.array([obj.get('weight', np.nan) for obj in objects]),
+		lambda: bulk.custom_property(objects, 'weight'),
+	),
+	'keyframes (read)': (
+		lambda: np.array([kp.co[:] for kp in fcurve.keyframe_points], dtype='<f4'),
+		lambda: bulk.keyframes(fcurve, reuse=True),
+	),
+}}
+
+def run_case(name, repeats):
+	loop, vectorized = CASES[name]
+	same = bool(np.array_equal(np.asarray(loop()), np.asarray(vectorized()))) if '(read)' in name else True
+	return json.dumps({{
+		'loop': min(timeit.repeat(loop, number=1, repeat=repeats)),
+		'bulk': min(timeit.repeat(vectorized, number=1, repeat=repeats)),
+		'same': same,
+	}})
+"""
+
+
+####################
+# - Main
+####################
+def main() -> int:
+	"""Run the benchmark, returning the process exit code."""
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	add_blender_arguments(parser)
+	parser.add_argument(
+		'--vertices', type=int, default=10**6, help='Number of mesh vertices.'
+	)
+	parser.add_argument('--objects', type=int, default=10**4, help='Number of objects.')
+	parser.add_argument(
+		'--keyframes', type=int, default=10**5, help='Number of keyframes.'
+	)
+	parser.add_argument(
+		'--repeats',
+		type=int,
+		default=3,
+		help='Number of runs per case, of which the fastest is kept.',
+	)
+	args = parser.parse_args()
+
+	mismatch = False
+	with (
+		tempfile.TemporaryDirectory(prefix='bpy_jupyter-') as tmp_dir,
+		headless_client(args, Path(tmp_dir)) as client,
+	):
+		_ = client.execute_interactive(
+			SETUP_CODE.format(
+				num_verts=args.vertices,
+				num_objects=args.objects,
+				num_keyframes=args.keyframes,
+			),
+			timeout=600,
+		)
+		reply = client.execute_interactive(
+			'', user_expressions={'names': 'json.dumps(list(CASES))'}
+		)
+		names = json.loads(
+			ast.literal_eval(
+				reply['content']['user_expressions']['names']['data']['text/plain']
+			)
+		)
+
+		print(f'{"case":>26} | {"loop [ms]":>10} | {"bulk [ms]":>10} | {"speedup":>8}')
+		for name in names:
+			reply = client.execute_interactive(
+				'',
+				user_expressions={'result': f'run_case({name!r}, {args.repeats})'},
+				timeout=600,
+			)
+			expression = reply['content']['user_expressions']['result']
+			if expression['status'] != 'ok':
+				print(f'{name:>26} | FAILED: {expression["evalue"]}')
+				mismatch = True
+				continue
+
+			result = json.loads(ast.literal_eval(expression['data']['text/plain']))
+			mismatch |= not result['same']
+			print(
+				f'{name:>26} | {1000 * result["loop"]:>10.1f} |'
+				f' {1000 * result["bulk"]:>10.2f} |'
+				f' {result["loop"] / result["bulk"]:>7.0f}x'
+			)
+
+	if mismatch:
+		print('FAIL: Loops and bulk accessors read different data.')
+	return 1 if mismatch else 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,124 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Shared by benchmarks that talk to a kernel in a fresh, background Blender.
+
+Notes:
+	Not a benchmark itself.
+	Benchmarks import this module by name, since `python benchmarks/<name>.py` puts `benchmarks/` on `sys.path`.
+"""
+
+import argparse
+import collections.abc as cabc
+import contextlib
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import jupyter_client
+
+START_TIMEOUT_SEC = 60.0
+STOP_TIMEOUT_SEC = 30.0
+
+BLENDER_SCRIPT = """
+import importlib, sys
+headless = importlib.import_module({module!r} + '.headless')
+sys.exit(headless.main(['--connection-file', {path_connection_file!r}, '--transport', {transport!r}]))
+"""
+
+
+def add_blender_arguments(parser: argparse.ArgumentParser) -> None:
+	"""Add the `--blender` and `--module` arguments, used by `headless_client()`."""
+	parser.add_argument('--blender', default='blender', help='Blender executable.')
+	parser.add_argument(
+		'--module',
+		default='bl_ext.user_default.bpy_jupyter',
+		help='Module name of the installed extension.',
+	)
+
+
+@contextlib.contextmanager
+def headless_client(
+	args: argparse.Namespace,
+	path_dir: Path,
+	*,
+	transport: str = 'tcp',
+) -> cabc.Iterator[jupyter_client.BlockingKernelClient]:
+	"""Run `bpy_jupyter.headless` in a fresh, background Blender, yielding a client connected to its kernel.
+
+	Notes:
+		When the `with` block ends, the kernel is shut down by the client, after which Blender exits.
+		If Blender exits with an error, the end of its output is printed to `stderr`.
+
+	Parameters:
+		args: Parsed arguments, including those of `add_blender_arguments()`.
+		path_dir: Directory for the connection file, and the output of Blender.
+		transport: Transport of the kernel.
+
+	Raises:
+		RuntimeError: If Blender didn't start a kernel.
+	"""
+	path_connection_file = path_dir / f'connection-{transport}.json'
+	path_log = path_dir / f'blender-{transport}.log'
+	with path_log.open('w') as log:
+		blender = subprocess.Popen(
+			[
+				args.blender,
+				'--background',
+				'--factory-startup',
+				'--online-mode',
+				'--python-expr',
+				BLENDER_SCRIPT.format(
+					module=args.module,
+					path_connection_file=str(path_connection_file),
+					transport=transport,
+				),
+			],
+			stdout=log,
+			stderr=subprocess.STDOUT,
+		)
+		try:
+			time_start = time.perf_counter()
+			while not path_connection_file.is_file():
+				if (
+					blender.poll() is not None
+					or time.perf_counter() - time_start > START_TIMEOUT_SEC
+				):
+					msg = f'Blender failed to start a kernel with "{transport}" transport.'
+					raise RuntimeError(msg)
+				time.sleep(0.05)
+
+			client = jupyter_client.BlockingKernelClient(
+				connection_file=str(path_connection_file)
+			)
+			client.load_connection_file()
+			client.start_channels()
+			try:
+				client.wait_for_ready(timeout=START_TIMEOUT_SEC)
+				yield client
+			finally:
+				_ = client.shutdown()
+				client.stop_channels()
+		finally:
+			try:
+				_ = blender.wait(timeout=STOP_TIMEOUT_SEC)
+			except subprocess.TimeoutExpired:
+				blender.kill()
+				_ = blender.wait()
+
+	if blender.returncode != 0:
+		print(path_log.read_text()[-4000:], file=sys.stderr)
@@ -0,0 +1,210 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Measures what enabling `bpy_jupyter` imports, and what is deferred until a kernel starts.
+
+Runs a fresh, background Blender with `PYTHONPROFILEIMPORTTIME=1` (the environment variable equivalent of `python -X importtime`).
+Then, the extension is enabled, after which the modules needed to start a kernel are imported.
+Blender's own startup imports are excluded, by splitting the `importtime` report on markers written around each phase.
+
+Usage:
+	```bash
+	python benchmarks/import_time.py --blender /path/to/blender
+	```
+
+	The extension must already be installed in Blender (ex. by dropping a `uv run blext build` `.zip` into Blender).
+	If it isn't installed into the `user_default` repository, pass its module name with `--module`.
+
+Exit Codes:
+	`0` when no forbidden module was imported by enabling the extension, and the total import time of enabling it stays within `--budget-ms`.
+	`1` otherwise.
+"""
+
+import argparse
+import dataclasses
+import os
+import subprocess
+import sys
+
+####################
+# - Constants
+####################
+MARKER = '@@bpy_jupyter.import_time@@'
+PHASES = ('register', 'kernel')
+
+FORBIDDEN_AT_REGISTER = (
+	'IPython',
+	'asyncio',
+	'ipykernel',
+	'jupyter_client',
+	'multiprocessing',
+	'pydantic',
+	'pyperclipfix',
+	'zmq',
+)
+
+BLENDER_SCRIPT = """
+import importlib, sys
+import bpy
+
+def marker(phase, edge):
+	sys.stderr.flush()
+	sys.stderr.write('{marker} ' + phase + ' ' + edge + '\\n')
+	sys.stderr.flush()
+
+marker('register', 'begin')
+bpy.ops.preferences.addon_enable(module={module!r})
+marker('register', 'end')
+
+marker('kernel', 'begin')
+importlib.import_module({module!r} + '.services.async_event_loop')
+importlib.import_module({module!r} + '.services.process_pool')
+importlib.import_module({module!r} + '.utils.ipykernel')
+marker('kernel', 'end')
+"""
+
+
+####################
+# - Parsing
+####################
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class ImportTime:
+	"""One line of an `importtime` report.
+
+	Attributes:
+		name: Fully qualified name of the imported module.
+		depth: Nesting depth of the import; `0` for imports not triggered by another import.
+		self_us: Time spent executing only this module.
+		cumulative_us: Time spent executing this module, and all that it imported.
+	"""
+
+	name: str
+	depth: int
+	self_us: int
+	cumulative_us: int
+
+
+def parse_phases(stderr: str) -> dict[str, list[ImportTime]]:
+	"""Split an `importtime` report into the imports made during each phase."""
+	phases: dict[str, list[ImportTime]] = {}
+	current: list[ImportTime] | None = None
+	for line in stderr.splitlines():
+		if line.startswith(MARKER):
+			_, phase, edge = line.split()
+			current = phases.setdefault(phase, []) if edge == 'begin' else None
+
+		elif current is not None and line.startswith('import time:'):
+			fields = line.removeprefix('import time:').split('|')
+			if not fields[0].strip().isdigit():
+				continue  ## Header Line
+
+			name_field = fields[2].removeprefix(' ')
+			current.append(
+				ImportTime(
+					name=name_field.strip(),
+					depth=(len(name_field) - len(name_field.lstrip())) // 2,
+					self_us=int(fields[0]),
+					cumulative_us=int(fields[1]),
+				)
+			)
+
+	return phases
+
+
+####################
+# - Reporting
+####################
+def report_phase(phase: str, imports: list[ImportTime], *, top: int) -> float:
+	"""Print the slowest imports of a phase, returning its total import time in `ms`."""
+	total_ms = sum(imp.cumulative_us for imp in imports if imp.depth == 0) / 1000
+	print(f'## Phase: {phase} ({len(imports)} modules, {total_ms:.1f} ms)')
+	print(f'{"self [ms]":>10} | {"cumulative [ms]":>15} | module')
+	for imp in sorted(imports, key=lambda imp: imp.cumulative_us, reverse=True)[:top]:
+		print(
+			f'{imp.self_us / 1000:>10.1f} | {imp.cumulative_us / 1000:>15.1f} | '
+			+ '  ' * imp.depth
+			+ imp.name
+		)
+	print()
+	return total_ms
+
+
+def forbidden_imports(imports: list[ImportTime]) -> list[str]:
+	"""Names of all forbidden top-level packages that were imported."""
+	return sorted(imp.name for imp in imports if imp.name in FORBIDDEN_AT_REGISTER)
+
+
+####################
+# - Main
+####################
+def main() -> int:
+	"""Run the benchmark, returning the process exit code."""
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	parser.add_argument('--blender', default='blender', help='Blender executable.')
+	parser.add_argument(
+		'--module',
+		default='bl_ext.user_default.bpy_jupyter',
+		help='Module name of the installed extension.',
+	)
+	parser.add_argument(
+		'--top', type=int, default=15, help='Number of slowest imports to show.'
+	)
+	parser.add_argument(
+		'--budget-ms',
+		type=float,
+		default=150.0,
+		help='Maximum total import time of enabling the extension.',
+	)
+	args = parser.parse_args()
+
+	result = subprocess.run(
+		[
+			args.blender,
+			'--background',
+			'--factory-startup',
+			'--python-use-system-env',
+			'--python-exit-code',
+			'1',
+			'--python-expr',
+			BLENDER_SCRIPT.format(marker=MARKER, module=args.module),
+		],
+		env=os.environ | {'PYTHONPROFILEIMPORTTIME': '1'},
+		capture_output=True,
+		text=True,
+		check=False,
+	)
+	phases = parse_phases(result.stderr)
+	if result.returncode != 0 or any(phase not in phases for phase in PHASES):
+		print(result.stderr[-4000:], file=sys.stderr)
+		print('Blender failed to enable the extension.', file=sys.stderr)
+		return 1
+
+	register_ms = report_phase('register', phases['register'], top=args.top)
+	report_phase('kernel', phases['kernel'], top=args.top)
+
+	forbidden = forbidden_imports(phases['register'])
+	if forbidden:
+		print(f'FAIL: Enabling the extension imported {", ".join(forbidden)}.')
+	if register_ms > args.budget_ms:
+		print(
+			f'FAIL: Enabling the extension took {register_ms:.1f} ms of imports'
+			f' (budget: {args.budget_ms:.1f} ms).'
+		)
+	return 1 if forbidden or register_ms > args.budget_ms else 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,540 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Soaks `IPyKernel` with thousands of start/stop cycles, failing when resources leak or lifecycle operations get slow.
+
+Stopping an embedded kernel relies on many workarounds (see `IPyKernel.stop()`), which an upgrade of `ipykernel`, `pyzmq` or `IPython` may silently break.
+So, without Blender, this runs the kernel of `bpy_jupyter.services.jupyter_kernel` in this process, against a stand-in `bpy` module.
+
+Each cycle:
+
+1. **`start`**: Starts the kernel.
+2. **`execute`**: Every `--execute-every` cycles, a `jupyter_client` client connects, and runs a cell that fills the namespace and `Out`.
+3. **`restart`**: Restarts the kernel warmly, `--warm-restarts` times.
+4. **`stop`**: Stops the kernel, after which the event loop runs until its memory is reclaimed (**`reclaim`**).
+
+Then, the process's open file descriptors, threads (of Python and of the OS), resident memory, and open `zmq` contexts and sockets are sampled.
+
+## Leak Detection
+The first `--warmup` cycles are ignored, since imports and caches allocate once.
+Of the remaining cycles, the median of the last tenth is compared to the median of the first tenth.
+Any growth beyond the tolerance (by default `0`, except for resident memory) is a leak.
+
+Usage:
+	```bash
+	python benchmarks/kernel_soak.py --cycles 2000
+	```
+
+	Run it with the environment of the extension (ex. `uv run`), since `ipykernel` et al. are imported from it.
+	To keep every sample, for plotting, pass `--csv path/to/samples.csv`.
+
+Notes:
+	While the cycles run, everything written to `stdout` (ex. the connection banner of each start) is discarded, except for the progress.
+
+	File descriptors and resident memory are only measured where `/proc/self` (Linux) or `/dev/fd` (macOS) exist.
+	On other platforms, they're reported as `n/a` and never fail.
+
+Exit Codes:
+	`0` when no resource grew beyond its tolerance, and the `p95` latency of every phase stayed within its budget.
+	`1` otherwise.
+"""
+
+import argparse
+import asyncio
+import collections.abc as cabc
+import concurrent.futures
+import contextlib
+import csv
+import dataclasses
+import gc
+import importlib
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import types
+import typing as typ
+from pathlib import Path
+
+import jupyter_client
+import zmq
+
+####################
+# - Constants
+####################
+PATH_PACKAGE = Path(__file__).resolve().parent.parent / 'bpy_jupyter'
+VERSIONED_PACKAGES = ('ipykernel', 'IPython', 'jupyter_client', 'zmq', 'tornado')
+
+EXECUTE_CODE = """
+data = list(range(100_000))
+table = {i: str(i) for i in range(10_000)}
+sum(data)
+"""
+CLIENT_TIMEOUT_SEC = 30.0
+
+PHASES = ('start', 'execute', 'restart', 'stop', 'reclaim', 'reclaim_step')
+RESOURCES = ('fds', 'threads', 'os_threads', 'rss_mb', 'zmq_contexts', 'zmq_sockets')
+
+
+####################
+# - Stand-In bpy
+####################
+def stand_in_bpy() -> types.ModuleType:
+	"""A module with just those attributes of `bpy`, that running a kernel (without a UI) uses."""
+	bpy = types.ModuleType('bpy')
+	bpy.app = types.SimpleNamespace(background=True, online_access=True)  # pyright: ignore[reportAttributeAccessIssue]
+	bpy.context = types.SimpleNamespace(window_manager=None, view_layer=None)  # pyright: ignore[reportAttributeAccessIssue]
+	bpy.data = types.SimpleNamespace(filepath='', objects=[])  # pyright: ignore[reportAttributeAccessIssue]
+	return bpy
+
+
+def import_jupyter_kernel(path_package: Path) -> types.ModuleType:
+	"""Import `bpy_jupyter.services.jupyter_kernel` against a stand-in `bpy`, without registering the extension.
+
+	Notes:
+		The package's `__init__` registers operators and panels, which would need the real `bpy`.
+		So, the package is created empty, after which its modules are imported from `path_package`.
+	"""
+	_ = sys.modules.setdefault('bpy', stand_in_bpy())
+
+	package = types.ModuleType('bpy_jupyter')
+	package.__path__ = [str(path_package)]
+	sys.modules['bpy_jupyter'] = package
+	return importlib.import_module('bpy_jupyter.services.jupyter_kernel')
+
+
+@contextlib.contextmanager
+def stdout_to_devnull() -> cabc.Iterator[typ.TextIO]:
+	"""Discard everything written to `stdout`, ex. the connection banner that `ipykernel` prints on each start.
+
+	Notes:
+		The file descriptor itself is redirected, since the banner is printed to `sys.__stdout__`.
+		Kernels also echo output that's written to the file descriptor.
+
+	Yields:
+		A stream to the original `stdout`, for reporting progress.
+	"""
+	sys.stdout.flush()
+	fd_stdout = os.dup(1)
+	fd_devnull = os.open(os.devnull, os.O_WRONLY)
+	_ = os.dup2(fd_devnull, 1)
+	os.close(fd_devnull)
+	try:
+		with os.fdopen(os.dup(fd_stdout), 'w') as progress:
+			yield progress
+	finally:
+		sys.stdout.flush()
+		_ = os.dup2(fd_stdout, 1)
+		os.close(fd_stdout)
+
+
+####################
+# - Resources
+####################
+def _count_fds() -> int | None:
+	"""Number of open file descriptors of this process, if the platform lists them."""
+	for path_fds in ('/proc/self/fd', '/dev/fd'):
+		if Path(path_fds).is_dir():
+			## Listing opens one more, which is the same for every sample.
+			return len(list(Path(path_fds).iterdir()))
+	return None
+
+
+def _count_os_threads() -> int | None:
+	"""Number of threads of this process, including those not made by Python (ex. `zmq` I/O threads)."""
+	path_tasks = Path('/proc/self/task')
+	if path_tasks.is_dir():
+		return len(list(path_tasks.iterdir()))
+	return None
+
+
+def _rss_mb() -> float | None:
+	"""Resident memory of this process in MiB, if the platform reports it."""
+	path_statm = Path('/proc/self/statm')
+	if not path_statm.is_file():
+		return None
+	resident_pages = int(path_statm.read_text().split()[1])
+	return resident_pages * os.sysconf('SC_PAGE_SIZE') / 2**20
+
+
+def _count_zmq() -> tuple[int, int]:
+	"""Number of `zmq` contexts and sockets that weren't closed, and are still alive."""
+	contexts = 0
+	sockets = 0
+	for obj in gc.get_objects():
+		if isinstance(obj, zmq.Context) and not obj.closed:
+			contexts += 1
+		elif isinstance(obj, zmq.Socket) and not obj.closed:
+			sockets += 1
+	return contexts, sockets
+
+
+####################
+# - Cycles
+####################
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class CycleSample:
+	"""Latency of each phase of one cycle, and the resources held after it.
+
+	Attributes:
+		cycle: Index of the cycle, starting at `0`.
+		start: Milliseconds taken by `IPyKernel.start()`.
+		execute: Milliseconds from connecting a client until its cell was executed.
+			_`None` in cycles without a client._
+		restart: Milliseconds taken by the slowest warm `IPyKernel.restart()`.
+			_`None` without warm restarts._
+		stop: Milliseconds taken by `IPyKernel.stop()`, during which the event loop is blocked.
+		reclaim: Milliseconds spent reclaiming memory, summed over all steps.
+		reclaim_step: Milliseconds taken by the longest step of reclaiming memory.
+		fds: Open file descriptors.
+		threads: Running Python threads.
+		os_threads: Threads of the process, including those not made by Python.
+		rss_mb: Resident memory, in MiB.
+		zmq_contexts: Open `zmq` contexts.
+		zmq_sockets: Open `zmq` sockets.
+	"""
+
+	cycle: int
+	start: float
+	execute: float | None
+	restart: float | None
+	stop: float
+	reclaim: float
+	reclaim_step: float
+	fds: int | None
+	threads: int
+	os_threads: int | None
+	rss_mb: float | None
+	zmq_contexts: int
+	zmq_sockets: int
+
+
+def _execute_in_client(path_connection_file: Path) -> float:
+	"""Connect a client to the kernel, execute a cell, and disconnect, returning the seconds this took.
+
+	Notes:
+		Runs in a worker thread, while the event loop runs the kernel.
+
+	Raises:
+		RuntimeError: If the cell didn't execute successfully.
+	"""
+	time_start = time.perf_counter()
+	client = jupyter_client.BlockingKernelClient(
+		connection_file=str(path_connection_file)
+	)
+	client.load_connection_file()
+	client.start_channels()
+	try:
+		client.wait_for_ready(timeout=CLIENT_TIMEOUT_SEC)
+		reply = client.execute_interactive(
+			EXECUTE_CODE, output_hook=lambda _msg: None, timeout=CLIENT_TIMEOUT_SEC
+		)
+	finally:
+		client.stop_channels()
+
+	if reply['content']['status'] != 'ok':
+		msg = f'The soaked kernel failed to execute a cell: {reply["content"]}'
+		raise RuntimeError(msg)
+	return time.perf_counter() - time_start
+
+
+def run_cycle(
+	jupyter_kernel: types.ModuleType,
+	loop: asyncio.AbstractEventLoop,
+	executor: concurrent.futures.Executor,
+	*,
+	cycle: int,
+	execute: bool,
+	warm_restarts: int,
+) -> CycleSample:
+	"""Start, use, restart and stop the default kernel once, then sample the resources held by the process."""
+	kernel = jupyter_kernel.IPYKERNEL
+	kernel.start()
+	start_ms = kernel.timings.start_sec * 1000
+
+	execute_ms = None
+	if execute:
+		execute_ms = 1000 * loop.run_until_complete(
+			loop.run_in_executor(
+				executor, _execute_in_client, kernel.path_connection_file
+			)
+		)
+
+	restart_ms = None
+	for _ in range(warm_restarts):
+		kernel.restart(warm=True)
+		restart_ms = max(restart_ms or 0.0, kernel.timings.restart_sec * 1000)
+
+	kernel.stop()
+	stop_ms = kernel.timings.stop_sec * 1000
+	if kernel.pending_reclaim is not None:
+		_ = loop.run_until_complete(kernel.pending_reclaim)
+	## Lets callbacks scheduled by the stop run, ex. recording the reclaim.
+	loop.run_until_complete(asyncio.sleep(0))
+	reclaim = kernel.timings.reclaim
+
+	zmq_contexts, zmq_sockets = _count_zmq()
+	return CycleSample(
+		cycle=cycle,
+		start=start_ms,
+		execute=execute_ms,
+		restart=restart_ms,
+		stop=stop_ms,
+		reclaim=(reclaim.drop_sec + reclaim.gc_sec) * 1000,
+		reclaim_step=reclaim.max_step_sec * 1000,
+		fds=_count_fds(),
+		threads=threading.active_count(),
+		os_threads=_count_os_threads(),
+		rss_mb=_rss_mb(),
+		zmq_contexts=zmq_contexts,
+		zmq_sockets=zmq_sockets,
+	)
+
+
+####################
+# - Analysis
+####################
+def _values(samples: list[CycleSample], name: str) -> list[float]:
+	"""All measured values of a phase or resource, skipping cycles where it wasn't measured."""
+	return [value for sample in samples if (value := getattr(sample, name)) is not None]
+
+
+def _p95(values: list[float]) -> float:
+	"""95th percentile of some values."""
+	if len(values) < 2:  # noqa: PLR2004
+		return values[0]
+	return statistics.quantiles(values, n=100, method='inclusive')[94]
+
+
+def check_latency(
+	samples: list[CycleSample], budgets_ms: dict[str, float]
+) -> list[str]:
+	"""Print the latency of each phase, returning a failure for each whose `p95` exceeds its budget."""
+	failures: list[str] = []
+	print(
+		f'{"phase":<14} | {"p50 [ms]":>10} | {"p95 [ms]":>10} | {"max [ms]":>10} | {"budget [ms]":>11}'
+	)
+	for phase in PHASES:
+		values = _values(samples, phase)
+		if not values:
+			continue
+
+		p95 = _p95(values)
+		print(
+			f'{phase:<14} | {statistics.median(values):>10.2f} | {p95:>10.2f}'
+			f' | {max(values):>10.2f} | {budgets_ms[phase]:>11.1f}'
+		)
+		if p95 > budgets_ms[phase]:
+			failures.append(
+				f'{phase} took {p95:.2f} ms at p95 (budget: {budgets_ms[phase]:.1f} ms).'
+			)
+	print()
+	return failures
+
+
+def check_growth(samples: list[CycleSample], tolerances: dict[str, float]) -> list[str]:
+	"""Print how much each resource grew over the soak, returning a failure for each that grew beyond its tolerance."""
+	window = max(1, len(samples) // 10)
+	failures: list[str] = []
+	print(
+		f'{"resource":<14} | {"first":>10} | {"last":>10} | {"growth":>10} | {"tolerance":>11}'
+	)
+	for resource in RESOURCES:
+		values = _values(samples, resource)
+		if len(values) < len(samples):
+			print(f'{resource:<14} | {"n/a":>10} | {"n/a":>10} | {"n/a":>10} |')
+			continue
+
+		first = statistics.median(values[:window])
+		last = statistics.median(values[-window:])
+		growth = last - first
+		print(
+			f'{resource:<14} | {first:>10.1f} | {last:>10.1f} | {growth:>+10.1f}'
+			f' | {tolerances[resource]:>11.1f}'
+		)
+		if growth > tolerances[resource]:
+			failures.append(
+				f'{resource} grew by {growth:.1f} over {len(samples)} cycles'
+				f' (tolerance: {tolerances[resource]:.1f}).'
+			)
+	print()
+	return failures
+
+
+def write_csv(path_csv: Path, samples: list[CycleSample]) -> None:
+	"""Write every sample to a `.csv` file, with one row per cycle."""
+	with path_csv.open('w', newline='') as f:
+		writer = csv.DictWriter(
+			f, fieldnames=[field.name for field in dataclasses.fields(CycleSample)]
+		)
+		writer.writeheader()
+		writer.writerows(dataclasses.asdict(sample) for sample in samples)
+
+
+def _versions() -> str:
+	"""Versions of the packages whose upgrades this soak guards against."""
+	versions = []
+	for name in VERSIONED_PACKAGES:
+		module = importlib.import_module(name)
+		version = getattr(module, '__version__', getattr(module, 'version', '?'))
+		versions.append(f'{name} {version}')
+	return ', '.join(versions)
+
+
+####################
+# - Main
+####################
+def main() -> int:
+	"""Run the soak, returning the process exit code."""
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	parser.add_argument(
+		'--cycles', type=int, default=1000, help='Number of measured cycles.'
+	)
+	parser.add_argument(
+		'--warmup',
+		type=int,
+		default=20,
+		help='Number of cycles to run before measuring.',
+	)
+	parser.add_argument(
+		'--transport', choices=('tcp', 'ipc'), default='tcp', help='Kernel transport.'
+	)
+	parser.add_argument(
+		'--execute-every',
+		type=int,
+		default=10,
+		help='Connect a client and execute a cell every this many cycles; 0 never does.',
+	)
+	parser.add_argument(
+		'--warm-restarts',
+		type=int,
+		default=1,
+		help='Number of warm restarts per cycle.',
+	)
+	parser.add_argument(
+		'--stable-connection',
+		action='store_true',
+		help='Reuse the ports and key of the previous cycle, like the "Stable Connection" preference.',
+	)
+	parser.add_argument(
+		'--package',
+		type=Path,
+		default=PATH_PACKAGE,
+		help='Directory of the bpy_jupyter package to soak.',
+	)
+	parser.add_argument('--csv', type=Path, default=None, help='Write all samples.')
+	for phase, budget_ms in (
+		('start', 500.0),
+		('execute', 1000.0),
+		('restart', 100.0),
+		('stop', 100.0),
+		('reclaim', 500.0),
+		('reclaim-step', 100.0),
+	):
+		parser.add_argument(
+			f'--max-{phase}-ms',
+			type=float,
+			default=budget_ms,
+			help=f'Budget for the p95 latency of "{phase}".',
+		)
+	for resource, tolerance in (
+		('fds', 0.0),
+		('threads', 0.0),
+		('os-threads', 0.0),
+		('rss-mb', 64.0),
+		('zmq-contexts', 0.0),
+		('zmq-sockets', 0.0),
+	):
+		parser.add_argument(
+			f'--max-{resource}-growth',
+			type=float,
+			default=tolerance,
+			help=f'Tolerated growth of "{resource}" over the soak.',
+		)
+	args = parser.parse_args()
+
+	jupyter_kernel = import_jupyter_kernel(args.package)
+	loop = asyncio.new_event_loop()
+	asyncio.set_event_loop(loop)
+
+	print(f'Soaking {args.warmup} + {args.cycles} cycles with {_versions()}.\n')
+	samples: list[CycleSample] = []
+	with (
+		tempfile.TemporaryDirectory(prefix='bpy_jupyter-soak-') as dir_tmp,
+		concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor,
+		stdout_to_devnull() as progress,
+	):
+		path_connections = Path(dir_tmp)
+		kernel_registry = importlib.import_module(
+			'bpy_jupyter.services.kernel_registry'
+		)
+		jupyter_kernel.init(
+			path_connection_file=(
+				kernel_registry.path_process_dir(path_connections)
+				/ jupyter_kernel.connection_file_name()
+			),
+			transport=args.transport,
+			path_registry=kernel_registry.path_registry(path_connections),
+			stable_connection_file=(
+				path_connections / jupyter_kernel.stable_connection_file_name()
+				if args.stable_connection
+				else None
+			),
+		)
+
+		time_start = time.perf_counter()
+		for cycle in range(args.warmup + args.cycles):
+			sample = run_cycle(
+				jupyter_kernel,
+				loop,
+				executor,
+				cycle=cycle,
+				execute=args.execute_every > 0 and cycle % args.execute_every == 0,
+				warm_restarts=args.warm_restarts,
+			)
+			if cycle >= args.warmup:
+				samples.append(sample)
+			if (cycle + 1) % 100 == 0:
+				print(
+					f'{cycle + 1:>6} cycles, {time.perf_counter() - time_start:>7.1f} s:'
+					f' {sample.fds} fds, {sample.os_threads} threads,'
+					f' {sample.zmq_sockets} sockets, {sample.rss_mb or 0:.1f} MiB',
+					file=progress,
+					flush=True,
+				)
+	loop.close()
+	print()
+
+	if args.csv is not None:
+		write_csv(args.csv, samples)
+
+	failures = check_latency(
+		samples,
+		{phase: getattr(args, f'max_{phase}_ms') for phase in PHASES},
+	)
+	failures += check_growth(
+		samples,
+		{resource: getattr(args, f'max_{resource}_growth') for resource in RESOURCES},
+	)
+	for failure in failures:
+		print(f'FAIL: {failure}')
+	return 1 if failures else 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
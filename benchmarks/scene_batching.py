@@ -0,0 +1,149 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Measures the speedup of `%%batch` for cells that edit thousands of objects.
+
+A fresh, background Blender runs `bpy_jupyter.headless`.
+Then, a `jupyter_client` client runs each cell twice, plainly and with `%%batch` from `bpy_jupyter.utils.scene_batching`:
+
+- **`operators`**: Adds objects with `bpy.ops.object.empty_add()`, each of which evaluates the view layer before and after.
+- **`properties`**: Moves every object by writing its `location`.
+- **`async`**: Moves every object within `with batch():`, in a cell that `await`s between slices of objects.
+
+The wall time of each cell is taken from the `bpy_jupyter` metadata of its `execute_reply`.
+Between runs, the added objects are removed again.
+
+Notes:
+	Background Blender neither redraws, nor pumps the event loop with timers.
+	So, the `async` cell only shows the overhead of batching; its benefit shows in a Blender with a UI.
+
+Usage:
+	```bash
+	python benchmarks/scene_batching.py --blender /path/to/blender
+	```
+
+	The extension must already be installed in Blender (ex. by dropping a `uv run blext build` `.zip` into Blender).
+	If it isn't installed into the `user_default` repository, pass its module name with `--module`.
+
+Exit Codes:
+	`0` when every cell succeeded.
+	`1` otherwise.
+"""
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+import jupyter_client
+from headless_kernel import add_blender_arguments, headless_client
+
+####################
+# - Constants
+####################
+RESET_CODE = """
+import bpy
+for obj in list(bpy.data.objects):
+	bpy.data.objects.remove(obj)
+"""
+
+CELLS = {
+	'operators': """
+for i in range({num_objects}):
+	bpy.ops.object.empty_add(location=(i, 0, 0))
+""",
+	'properties': """
+for i in range({num_objects}):
+	bpy.data.objects.new('benchmark', None)
+for obj in bpy.data.objects:
+	obj.location.z += 1
+""",
+	'async': """
+import asyncio
+for i in range({num_objects}):
+	bpy.data.objects.new('benchmark', None)
+with {batch}:
+	for i, obj in enumerate(bpy.data.objects):
+		obj.location.z += 1
+		if i % 100 == 0:
+			await asyncio.sleep(0)
+""",
+}
+
+
+####################
+# - Measurements
+####################
+def wall_ms(client: jupyter_client.BlockingKernelClient, code: str) -> float | None:
+	"""Run a cell after removing all objects, returning its wall time in milliseconds, or `None` if it failed."""
+	_ = client.execute_interactive(RESET_CODE, timeout=600)
+	reply = client.execute_interactive(code, timeout=600)
+	if reply['content']['status'] != 'ok':
+		print(f'Cell failed: {reply["content"].get("evalue")}', file=sys.stderr)
+		return None
+	return reply['metadata']['bpy_jupyter']['wall_ms']
+
+
+####################
+# - Main
+####################
+def main() -> int:
+	"""Run the benchmark, returning the process exit code."""
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	add_blender_arguments(parser)
+	parser.add_argument(
+		'--objects',
+		type=int,
+		default=2_000,
+		help='Number of objects edited by each cell.',
+	)
+	args = parser.parse_args()
+
+	failed = False
+	with (
+		tempfile.TemporaryDirectory(prefix='bpy_jupyter-') as tmp_dir,
+		headless_client(args, Path(tmp_dir)) as client,
+	):
+		print(
+			f'{"cell":>12} | {"plain [ms]":>11} | {"batch [ms]":>11} | {"speedup":>8}'
+		)
+		for name, cell in CELLS.items():
+			if name == 'async':
+				plain_code = cell.format(
+					num_objects=args.objects, batch='contextlib.nullcontext()'
+				)
+				plain_code = 'import contextlib\n' + plain_code
+				batch_code = cell.format(num_objects=args.objects, batch='batch()')
+			else:
+				plain_code = cell.format(num_objects=args.objects)
+				batch_code = '%%batch\n' + plain_code
+
+			plain_ms = wall_ms(client, plain_code)
+			batch_ms = wall_ms(client, batch_code)
+			if plain_ms is None or batch_ms is None:
+				failed = True
+				continue
+
+			print(
+				f'{name:>12} | {plain_ms:>11.1f} | {batch_ms:>11.1f} |'
+				f' {plain_ms / batch_ms:>7.1f}x'
+			)
+
+	return 1 if failed else 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,136 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Measures how long a cell that moves many objects blocks Blender, with and without time slicing.
+
+A fresh, background Blender runs `bpy_jupyter.headless`, and creates a scene of many empties.
+Then, a `jupyter_client` client runs a cell that moves every object:
+
+- **`plain`**: With a plain `for` loop.
+- **`sliced`**: With `async for` over `bpy_jupyter.utils.time_slicing.sliced()`, for each `--budget-ms`.
+
+For each, the wall time of the cell and the longest time it held Blender's main thread is taken from the `bpy_jupyter` metadata of its `execute_reply`.
+
+Usage:
+	```bash
+	python benchmarks/time_slicing.py --blender /path/to/blender
+	```
+
+	The extension must already be installed in Blender (ex. by dropping a `uv run blext build` `.zip` into Blender).
+	If it isn't installed into the `user_default` repository, pass its module name with `--module`.
+
+Exit Codes:
+	`0` when every sliced loop blocked Blender for less time than the plain loop.
+	`1` otherwise.
+"""
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+import jupyter_client
+from headless_kernel import add_blender_arguments, headless_client
+
+####################
+# - Constants
+####################
+SETUP_CODE = """
+import bpy
+for _ in range({num_objects}):
+	bpy.data.objects.new('benchmark', None)
+objects = list(bpy.data.objects)
+"""
+
+PLAIN_CODE = """
+for obj in objects:
+	obj.location.z += 1
+	obj.rotation_euler.x += 0.1
+"""
+
+SLICED_CODE = """
+async for obj in sliced(objects, budget_ms={budget_ms}):
+	obj.location.z += 1
+	obj.rotation_euler.x += 0.1
+"""
+
+
+####################
+# - Measurements
+####################
+def run_timed(
+	client: jupyter_client.BlockingKernelClient, code: str
+) -> tuple[float, float]:
+	"""Run a cell, returning its wall time and longest blocking step in milliseconds."""
+	reply = client.execute_interactive(code, timeout=600)
+	if reply['content']['status'] != 'ok':
+		msg = f'Cell failed: {reply["content"].get("evalue")}'
+		raise RuntimeError(msg)
+	timing = reply['metadata']['bpy_jupyter']
+	return timing['wall_ms'], timing['max_blocking_ms']
+
+
+####################
+# - Main
+####################
+def main() -> int:
+	"""Run the benchmark, returning the process exit code."""
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	add_blender_arguments(parser)
+	parser.add_argument(
+		'--objects',
+		type=int,
+		default=100_000,
+		help='Number of objects moved by each cell.',
+	)
+	parser.add_argument(
+		'--budget-ms',
+		type=float,
+		nargs='+',
+		default=[2.0, 8.0, 16.0],
+		help='Time slice budgets to measure.',
+	)
+	args = parser.parse_args()
+
+	with (
+		tempfile.TemporaryDirectory(prefix='bpy_jupyter-') as tmp_dir,
+		headless_client(args, Path(tmp_dir)) as client,
+	):
+		_ = client.execute_interactive(
+			SETUP_CODE.format(num_objects=args.objects), timeout=600
+		)
+
+		print(f'{"loop":>16} | {"wall [ms]":>10} | {"longest block [ms]":>18}')
+		plain_wall_ms, plain_block_ms = run_timed(client, PLAIN_CODE)
+		print(f'{"plain":>16} | {plain_wall_ms:>10.1f} | {plain_block_ms:>18.1f}')
+
+		worse = False
+		for budget_ms in args.budget_ms:
+			wall_ms, block_ms = run_timed(
+				client, SLICED_CODE.format(budget_ms=budget_ms)
+			)
+			worse |= block_ms >= plain_block_ms
+			print(
+				f'{f"sliced ({budget_ms:g} ms)":>16} | {wall_ms:>10.1f} | {block_ms:>18.1f}'
+			)
+
+	if worse:
+		print('FAIL: A sliced loop blocked Blender no shorter than the plain loop.')
+	return 1 if worse else 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
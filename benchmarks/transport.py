@@ -0,0 +1,239 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Compares round-trip latency and throughput of the `tcp` and `ipc` kernel transports.
+
+For each transport, a fresh, background Blender runs `bpy_jupyter.headless`.
+Then, a `jupyter_client` client on the same machine measures:
+
+- **Latency**: Round-trip time of executing an empty cell, from sending `execute_request` until `execute_reply` is received.
+- **`execute_reply` Throughput**: Round-trip of a cell whose `user_expressions` evaluate to a large string, returned in `execute_reply`.
+- **`display_data` Throughput**: Round-trip of a cell that `display()`s a large string, received on `iopub`.
+
+Usage:
+	```bash
+	python benchmarks/transport.py --blender /path/to/blender
+	```
+
+	The extension must already be installed in Blender (ex. by dropping a `uv run blext build` `.zip` into Blender).
+	If it isn't installed into the `user_default` repository, pass its module name with `--module`.
+
+Exit Codes:
+	`0` when every transport could be measured.
+	`1` otherwise.
+"""
+
+import argparse
+import dataclasses
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import jupyter_client
+from headless_kernel import add_blender_arguments, headless_client
+
+####################
+# - Constants
+####################
+TRANSPORTS = ('tcp', 'ipc')
+PAYLOAD_SIZES = (2**10, 2**20, 16 * 2**20)
+
+
+####################
+# - Measurements
+####################
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class TransportResult:
+	"""Measurements of one transport.
+
+	Attributes:
+		transport: The measured transport.
+		latency_us: Round-trip times of executing an empty cell.
+		reply_mb_s: Throughput of `execute_reply` messages, by payload size in bytes.
+		display_mb_s: Throughput of `display_data` messages, by payload size in bytes.
+	"""
+
+	transport: str
+	latency_us: list[float]
+	reply_mb_s: dict[int, float]
+	display_mb_s: dict[int, float]
+
+
+def _round_trip_sec(
+	client: jupyter_client.BlockingKernelClient,
+	code: str,
+	*,
+	user_expressions: dict[str, str] | None = None,
+) -> float:
+	"""Seconds from sending `code` until its `execute_reply`, and all of its `iopub` output, was received."""
+	time_start = time.perf_counter()
+	_ = client.execute_interactive(
+		code,
+		user_expressions=user_expressions,
+		output_hook=lambda _msg: None,
+		timeout=60,
+	)
+	return time.perf_counter() - time_start
+
+
+def _throughput_mb_s(
+	client: jupyter_client.BlockingKernelClient,
+	code: str,
+	*,
+	size: int,
+	repeats: int,
+	user_expressions: dict[str, str] | None = None,
+) -> float:
+	"""Best throughput, in MB/s, of transferring `size` bytes with `code` over `repeats` attempts."""
+	best_sec = min(
+		_round_trip_sec(client, code, user_expressions=user_expressions)
+		for _ in range(repeats)
+	)
+	return size / best_sec / 1e6
+
+
+def measure(
+	client: jupyter_client.BlockingKernelClient,
+	transport: str,
+	*,
+	iterations: int,
+	repeats: int,
+) -> TransportResult:
+	"""Measure latency and throughput of a connected kernel client."""
+	for _ in range(10):
+		_ = _round_trip_sec(client, 'pass')  ## Warm Up
+
+	latency_us = [_round_trip_sec(client, 'pass') * 1e6 for _ in range(iterations)]
+	reply_mb_s = {
+		size: _throughput_mb_s(
+			client,
+			'',
+			size=size,
+			repeats=repeats,
+			user_expressions={'payload': f"'x' * {size - 2}"},  ## Quotes of repr()
+		)
+		for size in PAYLOAD_SIZES
+	}
+	display_mb_s = {
+		size: _throughput_mb_s(
+			client,
+			f"display({{'text/plain': 'x' * {size}}}, raw=True)",
+			size=size,
+			repeats=repeats,
+		)
+		for size in PAYLOAD_SIZES
+	}
+	return TransportResult(
+		transport=transport,
+		latency_us=latency_us,
+		reply_mb_s=reply_mb_s,
+		display_mb_s=display_mb_s,
+	)
+
+
+####################
+# - Blender
+####################
+def run_transport(
+	args: argparse.Namespace, transport: str, path_dir: Path
+) -> TransportResult:
+	"""Run a headless kernel in Blender with the given transport, and measure it."""
+	with headless_client(args, path_dir, transport=transport) as client:
+		return measure(
+			client, transport, iterations=args.iterations, repeats=args.repeats
+		)
+
+
+####################
+# - Reporting
+####################
+def _format_size(size: int) -> str:
+	"""Human-readable payload size, ex. `16 MiB`."""
+	for unit in ('B', 'KiB', 'MiB'):
+		if size < 2**10 or unit == 'MiB':
+			return f'{size} {unit}'
+		size //= 2**10
+	raise AssertionError
+
+
+def report(results: list[TransportResult]) -> None:
+	"""Print a table comparing all measured transports."""
+	print(f'{"":<28}' + ''.join(f'{result.transport:>12}' for result in results))
+
+	for label, quantile in (('Latency p50 [us]', 50), ('Latency p95 [us]', 95)):
+		print(
+			f'{label:<28}'
+			+ ''.join(
+				f'{statistics.quantiles(result.latency_us, n=100)[quantile - 1]:>12.1f}'
+				for result in results
+			)
+		)
+
+	for kind in ('reply', 'display'):
+		for size in PAYLOAD_SIZES:
+			label = f'{kind} {_format_size(size)} [MB/s]'
+			print(
+				f'{label:<28}'
+				+ ''.join(
+					f'{getattr(result, f"{kind}_mb_s")[size]:>12.1f}'
+					for result in results
+				)
+			)
+
+
+####################
+# - Main
+####################
+def main() -> int:
+	"""Run the benchmark, returning the process exit code."""
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	add_blender_arguments(parser)
+	parser.add_argument(
+		'--iterations',
+		type=int,
+		default=1000,
+		help='Number of empty cells to measure latency with.',
+	)
+	parser.add_argument(
+		'--repeats',
+		type=int,
+		default=5,
+		help='Number of transfers per payload size, of which the fastest is kept.',
+	)
+	args = parser.parse_args()
+
+	results: list[TransportResult] = []
+	with tempfile.TemporaryDirectory(prefix='bpy_jupyter-') as tmp_dir:
+		for transport in TRANSPORTS:
+			if transport == 'ipc' and os.name == 'nt':
+				print('Skipping "ipc" transport, which is unavailable on Windows.')
+				continue
+
+			try:
+				results.append(run_transport(args, transport, Path(tmp_dir)))
+			except RuntimeError as ex:
+				print(ex)
+				return 1
+
+	report(results)
+	return 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
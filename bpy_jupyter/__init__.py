@@ -16,12 +16,19 @@
 
 """An extension that embeds a Jupyter kernel within Blender.
 
+Notes:
+	Enabling the extension must stay cheap, since most Blender sessions never start a kernel.
+	Thus, modules imported by `register()` only import the standard library and `bpy` at the top level.
+	Heavy dependencies (ie. `ipykernel`, `zmq`, `pydantic`, `asyncio`) are imported where they're first needed, which is usually when a kernel is started.
+
+	`benchmarks/import_time.py` checks this, and reports what is imported when.
+
 Attributes:
 	BL_REGISTER: All Blender classes that should be registered by `register()`.
 """
 
 from . import operators, panels, preferences
-from .services import registration
+from .services import kernel_prewarm, registration
 from .types import BLClass
 
 ####################
@@ -44,8 +51,11 @@ def register() -> None:
 		Called by Blender when enabling this addon.
 
 		Uses `bpy_jupyter.registration.register_classes()` to register all classes collected in `BL_REGISTER`.
+
+		Then, schedules pre-warming of the Jupyter kernel, which only happens if enabled in the addon preferences.
 	"""
 	registration.register_classes(BL_REGISTER)
+	kernel_prewarm.schedule()
 
 
 def unregister() -> None:
@@ -56,4 +66,5 @@ def unregister() -> None:
 
 		Uses `bpy_jupyter.registration.unregister_classes()` to unregister all Blender classes previously registered by this addon.
 	"""
+	kernel_prewarm.cancel()
 	registration.unregister_classes()
@@ -0,0 +1,190 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Runs the embedded Jupyter kernel in a background-mode Blender, ex. on headless render or compute nodes.
+
+## Motivation
+`StartJupyterKernel` relies on `bpy.app.timers` to increment the `asyncio` event loop, which doesn't keep a `blender --background` process alive.
+Instead, this module drives the event loop natively using `bpy_jupyter.services.async_event_loop.run_until_stopped()`, until shutdown is requested.
+Since the event loop then blocks on its selector until there's work to do, idle overhead is close to zero, and latency is that of the native event loop.
+
+## Usage
+With the extension enabled, run one of:
+
+```bash
+blender --background --online-mode --python-expr "import bl_ext.user_default.bpy_jupyter.headless as h; h.main()" -- --connection-file ./kernel.json
+blender --background --online-mode --python path/to/bpy_jupyter/headless.py -- --connection-file ./kernel.json
+```
+
+On the same machine, `--transport ipc` binds Unix domain sockets instead of TCP ports.
+This doesn't require `--online-mode`, and has lower latency and higher throughput for local clients.
+
+Any Jupyter client can then attach using the connection file, ex. `jupyter console --existing ./kernel.json`.
+
+Shutdown is requested either by a client (ex. `exit` in `jupyter console`), or by sending `SIGINT`/`SIGTERM` to Blender.
+
+Notes:
+	This module deliberately has no relative imports, so that it can also be run by path with `--python`.
+	In that case, it finds the enabled copy of this extension in `sys.modules`, and runs that copy's `main()`.
+"""
+
+import argparse
+import collections.abc as cabc
+import importlib
+import sys
+import types
+from pathlib import Path
+
+import bpy
+
+
+####################
+# - Extension Modules
+####################
+def _extension_package() -> str:
+	"""Find the name of the package of this extension, ex. `bl_ext.user_default.bpy_jupyter`.
+
+	Raises:
+		RuntimeError: If this module wasn't imported as part of the extension, and the extension isn't enabled.
+	"""
+	if __package__:
+		return __package__
+
+	for module_name in sys.modules:
+		if module_name.startswith('bl_ext.') and module_name.endswith('.bpy_jupyter'):
+			return module_name
+
+	msg = "Couldn't find the `bpy_jupyter` extension. Is it enabled?"
+	raise RuntimeError(msg)
+
+
+def _import_extension_module(module_name: str) -> types.ModuleType:
+	"""Import a module of this extension, ex. `services.jupyter_kernel`, by its name relative to the extension package."""
+	return importlib.import_module(f'{_extension_package()}.{module_name}')
+
+
+####################
+# - Arguments
+####################
+def _parse_args(argv: cabc.Sequence[str]) -> argparse.Namespace:
+	"""Parse the command-line arguments given after Blender's `--` separator."""
+	parser = argparse.ArgumentParser(
+		prog='blender --background --online-mode --python headless.py --',
+		description='Run an embedded Jupyter kernel in a background-mode Blender.',
+	)
+	_ = parser.add_argument(
+		'--connection-file',
+		type=Path,
+		default=None,
+		help='Path of the kernel connection file to write. Defaults to the same file as the "Start Kernel" button, which is also registered for discovery by clients.',
+	)
+	_ = parser.add_argument(
+		'--transport',
+		choices=('tcp', 'ipc'),
+		default='tcp',
+		help='How clients connect to the kernel. "ipc" binds Unix domain sockets next to the connection file.',
+	)
+	_ = parser.add_argument(
+		'--stable-connection-file',
+		type=Path,
+		default=None,
+		help='Path of a file that keeps the ports and key of the kernel, so that later runs reuse them. Clients connected to an earlier run then reconnect by themselves.',
+	)
+	return parser.parse_args(argv)
+
+
+def _default_path_connections() -> Path:
+	"""Path of the directory of all connection files, as used by `StartJupyterKernel`."""
+	ext_types = _import_extension_module('types')
+	path_extension_user = Path(
+		bpy.utils.extension_path_user(ext_types.EXT_PACKAGE, path='', create=True)
+	).resolve()
+	return path_extension_user / '.jupyter-connections'
+
+
+####################
+# - Main
+####################
+def main(argv: cabc.Sequence[str] | None = None) -> int:
+	"""Start the kernel, serve requests until shutdown is requested, then stop the kernel.
+
+	Parameters:
+		argv: Command-line arguments.
+			_When `None`, those given after `--` in `sys.argv` are used._
+
+	Returns:
+		The exit code of the process.
+	"""
+	if argv is None:
+		argv = sys.argv[sys.argv.index('--') + 1 :] if '--' in sys.argv else []
+	args = _parse_args(argv)
+
+	# Respect Online Access
+	if args.transport == 'tcp' and not bpy.app.online_access:
+		print(  # noqa: T201
+			'Online access is required for exposing kernel sockets. Pass `--online-mode` to Blender, or use `--transport ipc`.',
+			file=sys.stderr,
+		)
+		return 1
+
+	async_event_loop = _import_extension_module('services.async_event_loop')
+	jupyter_kernel = _import_extension_module('services.jupyter_kernel')
+	process_pool = _import_extension_module('services.process_pool')
+
+	kernel_registry = _import_extension_module('services.kernel_registry')
+
+	# Start Jupyter Kernel and Process Pool
+	## Only the default connection file is registered, like that of `StartJupyterKernel`.
+	if args.connection_file is not None:
+		path_connection_file: Path = args.connection_file.resolve()
+		path_registry: Path | None = None
+	else:
+		path_connections = _default_path_connections()
+		path_connection_file = (
+			kernel_registry.path_process_dir(path_connections)
+			/ jupyter_kernel.connection_file_name()
+		)
+		path_registry = kernel_registry.path_registry(path_connections)
+	jupyter_kernel.init(
+		path_connection_file=path_connection_file,
+		transport=args.transport,
+		path_registry=path_registry,
+		stable_connection_file=(
+			args.stable_connection_file.resolve()
+			if args.stable_connection_file is not None
+			else None
+		),
+	)
+	jupyter_kernel.IPYKERNEL.start()
+	process_pool.start()
+	print(
+		f'Jupyter kernel running. Connection file: {path_connection_file}',
+		file=sys.__stdout__,
+	)
+
+	# Serve Requests until Shutdown
+	try:
+		async_event_loop.run_until_stopped()
+	finally:
+		process_pool.stop()
+		## The event loop no longer runs, so memory is reclaimed right away.
+		jupyter_kernel.IPYKERNEL.stop(defer_reclaim=False)
+
+	return 0
+
+
+if __name__ == '__main__':
+	sys.exit(_import_extension_module('headless').main())
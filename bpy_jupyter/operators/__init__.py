@@ -20,10 +20,16 @@ Attributes:
 	BL_REGISTER: All `bpy.types.Operator`s that should be registered.
 """
 
-from . import copy_kern_info_to_clipboard, start_jupyter_kernel, stop_jupyter_kernel
+from . import (
+	copy_kern_info_to_clipboard,
+	restart_jupyter_kernel,
+	start_jupyter_kernel,
+	stop_jupyter_kernel,
+)
 
 BL_REGISTER = [
 	*start_jupyter_kernel.BL_REGISTER,
 	*stop_jupyter_kernel.BL_REGISTER,
+	*restart_jupyter_kernel.BL_REGISTER,
 	*copy_kern_info_to_clipboard.BL_REGISTER,
 ]
@@ -23,7 +23,6 @@ Attributes:
 import typing as typ
 
 import bpy
-import pyperclipfix
 import typing_extensions as typ_ext
 
 from ..services import jupyter_kernel
@@ -71,6 +70,9 @@ class CopyKernelInfoToClipboard(bpy.types.Operator):
 			context: The current `bpy` context.
 				_Not used._
 		"""
+		# Deferred Import: pyperclipfix
+		import pyperclipfix
+
 		pyperclipfix.copy(str(self.value_to_copy))  # pyright: ignore[reportUnknownArgumentType]
 
 		self.report(
@@ -0,0 +1,106 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Implements `RestartJupyterKernel`.
+
+Attributes:
+	BL_REGISTER: All the Blender classes, implemented by this module, that should be registered.
+"""
+
+import typing as typ
+
+import bpy
+import typing_extensions as typ_ext
+
+from ..services import jupyter_kernel
+from ..types import OperatorType
+
+if typ.TYPE_CHECKING:
+	from bpy._typing import rna_enums
+
+
+####################
+# - Class: Restart Jupyter Kernel
+####################
+class RestartJupyterKernel(bpy.types.Operator):
+	"""Restart the notebook kernel running within Blender, giving clients a fresh namespace.
+
+	Attributes:
+		bl_idname: Name of this operator type.
+		bl_label: Human-oriented label for this operator.
+		warm: Whether to keep the kernel's sockets, so that connected clients stay connected.
+		kernel_name: Name of the kernel to restart.
+	"""
+
+	bl_idname: str = OperatorType.RestartJupyterKernel
+	bl_label: str = 'Restart Jupyter Kernel'
+
+	warm: bpy.props.BoolProperty(  # pyright: ignore[reportInvalidTypeForm, reportUninitializedInstanceVariable]
+		name='Warm',
+		description='Keep sockets, ports and connection file, only resetting the namespace',
+		default=True,
+	)
+	kernel_name: bpy.props.StringProperty(  # pyright: ignore[reportInvalidTypeForm, reportUninitializedInstanceVariable]
+		name='Kernel Name',
+		description='Name of the kernel to restart',
+		default='default',
+	)
+
+	@typ_ext.override
+	@classmethod
+	def poll(cls, context: bpy.types.Context) -> bool:
+		"""Can run while any Jupyter kernel is running.
+
+		Parameters:
+			context: The current `bpy` context.
+				_Not used._
+		"""
+		return bool(jupyter_kernel.running_kernels())
+
+	@typ_ext.override
+	def execute(
+		self, context: bpy.types.Context
+	) -> set['rna_enums.OperatorReturnItems']:
+		"""Restart the embedded jupyter kernel.
+
+		Notes:
+			The `asyncio` event loop keeps running throughout.
+
+		Parameters:
+			context: The current `bpy` context.
+				_Not used._
+		"""
+		if not jupyter_kernel.is_kernel_running(self.kernel_name):
+			self.report(
+				{'ERROR'}, f'Jupyter Kernel {self.kernel_name!r} is not running'
+			)
+			return {'CANCELLED'}
+
+		kernel = jupyter_kernel.KERNELS[self.kernel_name]
+		kernel.restart(warm=self.warm)
+		if kernel.timings.restart_sec is not None:
+			self.report(
+				{'INFO'},
+				f'Restarted Jupyter Kernel {self.kernel_name!r} in {1000 * kernel.timings.restart_sec:.1f} ms',
+			)
+
+		return {'FINISHED'}
+
+
+####################
+# - Blender Registration
+####################
+BL_REGISTER = [RestartJupyterKernel]
@@ -20,19 +20,45 @@ Attributes:
 	BL_REGISTER: All the Blender classes, implemented by this module, that should be registered.
 """
 
+import time
 import typing as typ
 from pathlib import Path
 
 import bpy
 import typing_extensions as typ_ext
 
-from ..services import async_event_loop, jupyter_kernel
+from ..services import jupyter_kernel, kernel_prewarm, kernel_registry
 from ..types import EXT_PACKAGE, OperatorType
 
 if typ.TYPE_CHECKING:
 	from bpy._typing import rna_enums
 
 
+####################
+# - Transports
+####################
+## Blender only keeps references to the strings of enum items, that Python also keeps.
+_TRANSPORT_ITEMS = [
+	('tcp', 'TCP', 'Bind ports on the loopback interface', 0),
+	(
+		'ipc',
+		'Unix Sockets',
+		'Bind Unix domain sockets next to the connection file',
+		1,
+	),
+]
+_TRANSPORT_ITEMS_TCP = _TRANSPORT_ITEMS[:1]
+
+
+def _transport_items(
+	_self: 'StartJupyterKernel', _context: bpy.types.Context | None
+) -> list[tuple[str, str, str, int]]:
+	"""Transports that kernels can use on this platform."""
+	if jupyter_kernel.has_ipc():
+		return _TRANSPORT_ITEMS
+	return _TRANSPORT_ITEMS_TCP
+
+
 ####################
 # - Class: Start Jupyter Kernel
 ####################
@@ -42,21 +68,41 @@ class StartJupyterKernel(bpy.types.Operator):
 	Attributes:
 		bl_idname: Name of this operator type.
 		bl_label: Human-oriented label for this operator.
+		kernel_name: Name of the kernel to start.
+			Kernels with different names run side by side.
+		transport: How clients connect to the kernel.
+			When not set, the `kernel_transport` addon preference is used.
 	"""
 
 	bl_idname: str = OperatorType.StartJupyterKernel
 	bl_label: str = 'Start Jupyter Kernel'
 
+	kernel_name: bpy.props.StringProperty(  # pyright: ignore[reportInvalidTypeForm, reportUninitializedInstanceVariable]
+		name='Kernel Name',
+		description='Name of the kernel to start',
+		default='default',
+	)
+	transport: bpy.props.EnumProperty(  # pyright: ignore[reportInvalidTypeForm, reportUninitializedInstanceVariable]
+		name='Transport',
+		description='How clients connect to the kernel. Defaults to the addon preference',
+		items=_transport_items,
+		## Items made by a callback can only have a default by number.
+		default=0,
+	)
+
 	@typ_ext.override
 	@classmethod
 	def poll(cls, context: bpy.types.Context) -> bool:
-		"""Can run while a Jupyter kernel is not running.
+		"""Can always run, since `kernel_name` isn't known yet.
+
+		Notes:
+			`execute()` refuses to start a kernel that is already running.
 
 		Parameters:
 			context: The current `bpy` context.
 				_Not used._
 		"""
-		return not jupyter_kernel.is_kernel_running()
+		return True
 
 	@typ_ext.override
 	def execute(
@@ -64,10 +110,38 @@ class StartJupyterKernel(bpy.types.Operator):
 	) -> set['rna_enums.OperatorReturnItems']:
 		"""Start an embedded jupyter kernel, as well as an `asyncio` event loop to handle kernel clients.
 
+		Notes:
+			Also starts the process pool of `bpy_jupyter.services.process_pool`, which lives exactly as long as the kernel.
+
+			If `bpy_jupyter.services.kernel_prewarm` is still importing the kernel's dependencies, this waits for it to finish.
+
+			The event loop and process pool are shared by all kernels, and are only started with the first one.
+
+			`tcp` transport requires online access, since it exposes network sockets.
+
 		Parameters:
 			context: The current `bpy` context.
-				_Not used._
 		"""
+		if jupyter_kernel.is_kernel_running(self.kernel_name):
+			self.report(
+				{'ERROR'}, f'Jupyter Kernel {self.kernel_name!r} is already running'
+			)
+			return {'CANCELLED'}
+
+		addon = context.preferences.addons.get(EXT_PACKAGE)
+		prefs = addon.preferences if addon is not None else None
+
+		transport = self.transport
+		if not self.properties.is_property_set('transport') and prefs is not None:
+			transport = prefs.kernel_transport  # pyright: ignore[reportAttributeAccessIssue]
+		## Saved as 'ipc' on another platform, which isn't an item here.
+		transport = transport or 'tcp'
+
+		if transport == 'tcp' and not bpy.app.online_access:
+			self.report({'ERROR'}, 'Online access is required for TCP transport')
+			return {'CANCELLED'}
+
+		time_start = time.perf_counter()
 		path_extension_user = Path(
 			bpy.utils.extension_path_user(
 				EXT_PACKAGE,
@@ -76,17 +150,69 @@ class StartJupyterKernel(bpy.types.Operator):
 			)
 		).resolve()
 
-		# (Re)Initialize Jupyter Kernel
-		jupyter_kernel.init(
-			path_connection_file=Path(
-				path_extension_user / '.jupyter-connections' / 'connection.json'
-			),
+		# Wait for Pre-Warming
+		_ = kernel_prewarm.wait()
+
+		# Deferred Import: pydantic, ipykernel
+		from ..utils.output_policy import OutputPolicy
+
+		output_policy = (
+			OutputPolicy(
+				max_chars_per_sec=prefs.output_max_chars_per_sec or None,  # pyright: ignore[reportAttributeAccessIssue]
+				max_cell_chars=prefs.output_max_cell_chars or None,  # pyright: ignore[reportAttributeAccessIssue]
+				max_history_bytes=prefs.output_max_history_mb * 1024**2 or None,  # pyright: ignore[reportAttributeAccessIssue]
+			)
+			if prefs is not None
+			else None
 		)
 
-		# Start Jupyter Kernel and asyncio Event Loop
-		if jupyter_kernel.IPYKERNEL is not None:
-			jupyter_kernel.IPYKERNEL.start()
+		# (Re)Initialize Jupyter Kernel
+		## Each Blender process has its own connection files, which are indexed by one registry.
+		path_connections = path_extension_user / '.jupyter-connections'
+		try:
+			jupyter_kernel.init(
+				path_connection_file=(
+					kernel_registry.path_process_dir(path_connections)
+					/ jupyter_kernel.connection_file_name(self.kernel_name)
+				),
+				name=self.kernel_name,
+				transport=transport,
+				output_policy=output_policy,
+				path_registry=kernel_registry.path_registry(path_connections),
+				stable_connection_file=(
+					path_connections
+					/ jupyter_kernel.stable_connection_file_name(self.kernel_name)
+					if prefs is not None and prefs.use_stable_connection  # pyright: ignore[reportAttributeAccessIssue]
+					else None
+				),
+			)
+		except ValueError as ex:
+			self.report({'ERROR'}, str(ex))
+			return {'CANCELLED'}
+
+		# Deferred Import: asyncio, multiprocessing, zmq
+		import zmq
+
+		from ..services import async_event_loop, process_pool
+
+		# Start Jupyter Kernel, asyncio Event Loop and Process Pool
+		## A kernel that failed to start publishes that it isn't running, which also removes it from the registry.
+		try:
+			jupyter_kernel.KERNELS[self.kernel_name].start()
+		except (ValueError, zmq.ZMQError) as ex:
+			self.report(
+				{'ERROR'}, f"Jupyter Kernel {self.kernel_name!r} couldn't start: {ex}"
+			)
+			return {'CANCELLED'}
+		if not async_event_loop.is_running():
 			async_event_loop.start()
+		if not process_pool.is_running():
+			process_pool.start()
+
+		self.report(
+			{'INFO'},
+			f'Started Jupyter Kernel {self.kernel_name!r} in {1000 * (time.perf_counter() - time_start):.1f} ms',
+		)
 
 		return {'FINISHED'}
 
@@ -25,13 +25,24 @@ import typing as typ
 import bpy
 import typing_extensions as typ_ext
 
-from ..services import async_event_loop, jupyter_kernel
+from ..services import jupyter_kernel
 from ..types import OperatorType
 
 if typ.TYPE_CHECKING:
 	from bpy._typing import rna_enums
 
 
+####################
+# - Event Loop
+####################
+def _stop_event_loop_if_idle(_: object) -> None:
+	"""Stop the event loop, unless a kernel was started in the meantime."""
+	from ..services import async_event_loop
+
+	if not jupyter_kernel.running_kernels() and async_event_loop.is_running():
+		async_event_loop.stop()
+
+
 ####################
 # - Class: Stop Jupyter Kernel
 ####################
@@ -41,21 +52,28 @@ class StopJupyterKernel(bpy.types.Operator):
 	Attributes:
 		bl_idname: Name of this operator type.
 		bl_label: Human-oriented label for this operator.
+		kernel_name: Name of the kernel to stop.
 	"""
 
 	bl_idname: str = OperatorType.StopJupyterKernel
 	bl_label: str = 'Stop Jupyter Kernel'
 
+	kernel_name: bpy.props.StringProperty(  # pyright: ignore[reportInvalidTypeForm, reportUninitializedInstanceVariable]
+		name='Kernel Name',
+		description='Name of the kernel to stop',
+		default='default',
+	)
+
 	@typ_ext.override
 	@classmethod
 	def poll(cls, context: bpy.types.Context) -> bool:
-		"""Can run while a Jupyter kernel is running.
+		"""Can run while any Jupyter kernel is running.
 
 		Parameters:
 			context: The current `bpy` context.
 				_Not used._
 		"""
-		return jupyter_kernel.is_kernel_running()
+		return bool(jupyter_kernel.running_kernels())
 
 	@typ_ext.override
 	def execute(
@@ -63,14 +81,35 @@ class StopJupyterKernel(bpy.types.Operator):
 	) -> set['rna_enums.OperatorReturnItems']:
 		"""Start the embedded jupyter kernel, as well as the `asyncio` event loop managed by this extension.
 
+		Notes:
+			When the last running kernel is stopped, the event loop is also stopped, once the kernel's memory is reclaimed.
+			So is the process pool of `bpy_jupyter.services.process_pool`, destroying all shared arrays allocated through it.
+
 		Parameters:
 			context: The current `bpy` context.
 				_Not used._
 		"""
-		# Stop Jupyter Kernel and asyncio Event Loop
-		if jupyter_kernel.IPYKERNEL is not None:
-			jupyter_kernel.IPYKERNEL.stop()
-			async_event_loop.stop()
+		# Deferred Import: asyncio, multiprocessing
+		from ..services import async_event_loop, process_pool
+
+		if not jupyter_kernel.is_kernel_running(self.kernel_name):
+			self.report(
+				{'ERROR'}, f'Jupyter Kernel {self.kernel_name!r} is not running'
+			)
+			return {'CANCELLED'}
+
+		# Stop Jupyter Kernel, asyncio Event Loop and Process Pool
+		## The event loop keeps running until the kernel's memory is reclaimed.
+		kernel = jupyter_kernel.KERNELS[self.kernel_name]
+		kernel.stop()
+		if not jupyter_kernel.running_kernels():
+			pending_reclaim = kernel.pending_reclaim
+			if pending_reclaim is None:
+				async_event_loop.stop()
+			else:
+				pending_reclaim.add_done_callback(_stop_event_loop_if_idle)
+			if process_pool.is_running():
+				process_pool.stop()
 
 		return {'FINISHED'}
 
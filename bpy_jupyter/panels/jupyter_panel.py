@@ -20,20 +20,26 @@ Attributes:
 	BL_REGISTER: All the Blender classes, implemented by this module, that should be registered.
 """
 
-import textwrap
 import typing as typ
 
 import bpy
-import pydantic as pyd
 import typing_extensions as typ_ext
 
-from ..services import jupyter_kernel
+from ..services import jupyter_kernel, kernel_prewarm
 
 if typ.TYPE_CHECKING:
 	from bpy._typing import rna_enums
 
 
-from ..types import BLContextType, OperatorType, PanelType
+from ..types import EXT_PACKAGE, BLContextType, OperatorType, PanelType
+
+
+####################
+# - Formatting
+####################
+def _format_ms(value_sec: float | None) -> str:
+	"""Format a duration in seconds as milliseconds, or `-` if it hasn't been measured."""
+	return '-' if value_sec is None else f'{1000 * value_sec:.1f} ms'
 
 
 ####################
@@ -69,9 +75,21 @@ class JupyterPanel(bpy.types.Panel):
 		if context.region is None or context.preferences is None:
 			return
 
+		addon = context.preferences.addons.get(EXT_PACKAGE)
+		use_ipc = (
+			addon is not None
+			and getattr(addon.preferences, 'kernel_transport', 'tcp') == 'ipc'
+			and jupyter_kernel.has_ipc()
+		)
+		can_start = bpy.app.online_access or use_ipc
+
 		width_units_nrm = context.region.width / context.preferences.system.dpi
 		width_chars = max(int(width_units_nrm / 0.11), 1)
 
+		## Snapshots are immutable, and replaced as a whole on each publish.
+		snapshots = jupyter_kernel.SNAPSHOTS
+		kernel = jupyter_kernel.snapshot()
+
 		layout = self.layout
 		if layout is None:
 			return
@@ -79,7 +97,7 @@ class JupyterPanel(bpy.types.Panel):
 		####################
 		# - Section: Respect Online Access
 		####################
-		if not bpy.app.online_access:
+		if not can_start:
 			box = layout.box()
 			col = box.column()
 
@@ -90,6 +108,8 @@ class JupyterPanel(bpy.types.Panel):
 			col.label(text='Required for exposing kernel sockets.')
 			col.label(text='1. Open System Preferences.')
 			col.label(text='2. Toggle "Allow Online Access".')
+			if jupyter_kernel.has_ipc():
+				col.label(text='Or, use the "Unix Sockets" transport.')
 
 			op = box.operator('screen.userpref_show', text='Open System Preferences')
 			op.section = 'SYSTEM'  # pyright: ignore[reportAttributeAccessIssue]
@@ -100,17 +120,65 @@ class JupyterPanel(bpy.types.Panel):
 		row = layout.row(align=True)
 
 		col = row.column(align=True)
-		col.enabled = bpy.app.online_access
-		_ = col.operator(OperatorType.StartJupyterKernel, text='Start Kernel')
-		_ = col.operator(OperatorType.StopJupyterKernel, text='Stop Kernel')
+		col.enabled = can_start
+
+		## Operators take a 'kernel_name', so their poll() can't tell this apart.
+		subrow = col.row(align=True)
+		subrow.enabled = not kernel.is_running
+		_ = subrow.operator(OperatorType.StartJupyterKernel, text='Start Kernel')
+		subcol = col.column(align=True)
+		subcol.enabled = kernel.is_running
+		_ = subcol.operator(OperatorType.StopJupyterKernel, text='Stop Kernel')
+		_ = subcol.operator(OperatorType.RestartJupyterKernel, text='Restart Kernel')
 
 		col = row.column(align=True)
 		col.scale_y = 2.0
 		col.progress(
-			text='Active' if jupyter_kernel.is_kernel_running() else 'Inactive',
-			factor=1.0 if jupyter_kernel.is_kernel_running() else 0.0,
+			text='Active' if kernel.is_running else 'Inactive',
+			factor=1.0 if kernel.is_running else 0.0,
 		)
 
+		####################
+		# - Section: Running Kernels
+		####################
+		running_kernels = [
+			kernel_snapshot
+			for kernel_snapshot in snapshots.values()
+			if kernel_snapshot.is_running
+		]
+		header, body = layout.panel(
+			PanelType.JupyterPanel + '_kernels',
+			default_closed=True,
+		)
+		header.label(text=f'Running Kernels ({len(running_kernels)})')
+		if body is not None:  # pyright: ignore[reportUnnecessaryComparison]
+			if running_kernels:
+				grid = body.grid_flow(
+					row_major=True, columns=2, even_rows=True, even_columns=True
+				)
+				for kernel_snapshot in running_kernels:
+					grid.label(text=kernel_snapshot.name)
+					grid_section_row = grid.column().row(align=True)
+					grid_section_row.alignment = 'RIGHT'
+					grid_section_row.label(text=f'Shell: {kernel_snapshot.ports[0]}')
+					op = grid_section_row.operator(
+						OperatorType.CopyKernelInfoToClipboard, icon='COPYDOWN', text=''
+					)
+					op.value_to_copy = kernel_snapshot.path_connection_file  # pyright: ignore[reportAttributeAccessIssue]
+					op = grid_section_row.operator(
+						OperatorType.RestartJupyterKernel, icon='FILE_REFRESH', text=''
+					)
+					op.kernel_name = kernel_snapshot.name  # pyright: ignore[reportAttributeAccessIssue]
+					op = grid_section_row.operator(
+						OperatorType.StopJupyterKernel, icon='CANCEL', text=''
+					)
+					op.kernel_name = kernel_snapshot.name  # pyright: ignore[reportAttributeAccessIssue]
+			else:
+				box = body.box()
+				row = box.row(align=False)
+				row.alignment = 'CENTER'
+				row.label(text='No Kernels Running')
+
 		####################
 		# - Section: Kernel Connection
 		####################
@@ -132,36 +200,21 @@ class JupyterPanel(bpy.types.Panel):
 				icon='COPYDOWN',
 				text='File Path',
 			)
-			op.value_to_copy = (  # pyright: ignore[reportAttributeAccessIssue]
-				str(jupyter_kernel.IPYKERNEL.path_connection_file)
-				if jupyter_kernel.IPYKERNEL is not None
-				and jupyter_kernel.IPYKERNEL.is_running
-				else ''
-			)
+			op.value_to_copy = kernel.path_connection_file  # pyright: ignore[reportAttributeAccessIssue]
 
 			op = row.operator(
 				OperatorType.CopyKernelInfoToClipboard,
 				icon='COPYDOWN',
 				text='Parent Path',
 			)
-			op.value_to_copy = (  # pyright: ignore[reportAttributeAccessIssue]
-				str(jupyter_kernel.IPYKERNEL.path_connection_file.parent)
-				if jupyter_kernel.IPYKERNEL is not None
-				and jupyter_kernel.IPYKERNEL.is_running
-				else ''
-			)
+			op.value_to_copy = kernel.path_connection_dir  # pyright: ignore[reportAttributeAccessIssue]
 
 			op = col.operator(
 				OperatorType.CopyKernelInfoToClipboard,
 				icon='COPYDOWN',
 				text='File JSON Contents',
 			)
-			op.value_to_copy = (  # pyright: ignore[reportAttributeAccessIssue]
-				jupyter_kernel.IPYKERNEL.connection_info.json_str_with_key
-				if jupyter_kernel.IPYKERNEL is not None
-				and jupyter_kernel.IPYKERNEL.is_running
-				else ''
-			)
+			op.value_to_copy = kernel.json_str_with_key  # pyright: ignore[reportAttributeAccessIssue]
 
 			####################
 			# - Label w/File Path
@@ -172,13 +225,9 @@ class JupyterPanel(bpy.types.Panel):
 			)
 			subheader.label(text='File Path')
 			if subbody is not None:  # pyright: ignore[reportUnnecessaryComparison]
-				if (
-					jupyter_kernel.IPYKERNEL is not None
-					and jupyter_kernel.IPYKERNEL.is_running
-				):
-					wrapped_path_connection_file_lines = textwrap.wrap(
-						str(jupyter_kernel.IPYKERNEL.path_connection_file),
-						width=width_chars,
+				if kernel.is_running:
+					wrapped_path_connection_file_lines = kernel.wrapped(
+						'path_connection_file', width_chars
 					)
 
 					box = subbody.box()
@@ -204,13 +253,9 @@ class JupyterPanel(bpy.types.Panel):
 			)
 			subheader.label(text='JSON Contents')
 			if subbody is not None:  # pyright: ignore[reportUnnecessaryComparison]
-				if (
-					jupyter_kernel.IPYKERNEL is not None
-					and jupyter_kernel.IPYKERNEL.is_running
-				):
-					wrapped_path_connection_file_lines = textwrap.wrap(
-						jupyter_kernel.IPYKERNEL.connection_info.json_str,
-						width=width_chars,
+				if kernel.is_running:
+					wrapped_path_connection_file_lines = kernel.wrapped(
+						'json_str', width_chars
 					)
 
 					box = subbody.box()
@@ -248,22 +293,14 @@ class JupyterPanel(bpy.types.Panel):
 			grid_section_row = grid_section.row()
 			grid_section_row.alignment = 'RIGHT'
 			grid_section_row.label(
-				text=str(jupyter_kernel.IPYKERNEL.connection_info.ip)
-				if jupyter_kernel.IPYKERNEL is not None
-				and jupyter_kernel.IPYKERNEL.is_running
-				else '',
-				icon='QUESTION' if not jupyter_kernel.is_kernel_running() else 'NONE',
+				text=kernel.ip,
+				icon='QUESTION' if not kernel.is_running else 'NONE',
 			)
 
 			op = grid_section_row.operator(
 				OperatorType.CopyKernelInfoToClipboard, icon='COPYDOWN', text=''
 			)
-			op.value_to_copy = (  # pyright: ignore[reportAttributeAccessIssue]
-				str(jupyter_kernel.IPYKERNEL.connection_info.ip)
-				if jupyter_kernel.IPYKERNEL is not None
-				and jupyter_kernel.IPYKERNEL.is_running
-				else ''
-			)
+			op.value_to_copy = kernel.ip  # pyright: ignore[reportAttributeAccessIssue]
 
 			####################
 			# - Ports
@@ -273,39 +310,20 @@ class JupyterPanel(bpy.types.Panel):
 			)
 
 			for label, value in zip(
-				[
-					'Shell',
-					'IOPub',
-					'Stdin',
-					'Control',
-					'Heartbeat',
-				],
-				[
-					jupyter_kernel.IPYKERNEL.connection_info.shell_port,
-					jupyter_kernel.IPYKERNEL.connection_info.iopub_port,
-					jupyter_kernel.IPYKERNEL.connection_info.stdin_port,
-					jupyter_kernel.IPYKERNEL.connection_info.control_port,
-					jupyter_kernel.IPYKERNEL.connection_info.hb_port,
-				]
-				if jupyter_kernel.IPYKERNEL is not None
-				and jupyter_kernel.IPYKERNEL.is_running
-				else 5 * ('',),
-				strict=True,
+				jupyter_kernel.PORT_LABELS, kernel.ports, strict=True
 			):
 				grid.label(text=label)
 				grid_section = grid.column()
 				grid_section_row = grid_section.row()
 				grid_section_row.alignment = 'RIGHT'
 				grid_section_row.label(
-					text=str(value),
-					icon='QUESTION'
-					if not jupyter_kernel.is_kernel_running()
-					else 'NONE',
+					text=value,
+					icon='QUESTION' if not kernel.is_running else 'NONE',
 				)
 				op = grid_section_row.operator(
 					OperatorType.CopyKernelInfoToClipboard, icon='COPYDOWN', text=''
 				)
-				op.value_to_copy = str(value)  # pyright: ignore[reportAttributeAccessIssue]
+				op.value_to_copy = value  # pyright: ignore[reportAttributeAccessIssue]
 
 		####################
 		# - Section: Kernel Security
@@ -323,46 +341,201 @@ class JupyterPanel(bpy.types.Panel):
 				row_major=True, columns=2, even_rows=True, even_columns=True
 			)
 
-			for label, value in zip(
-				[
-					'Key',
-					'Protocol',
-					'Sig. Algo',
-				],
-				[
-					jupyter_kernel.IPYKERNEL.connection_info.key,
-					jupyter_kernel.IPYKERNEL.connection_info.transport,
-					jupyter_kernel.IPYKERNEL.connection_info.signature_scheme,
-				]
-				if jupyter_kernel.IPYKERNEL is not None
-				and jupyter_kernel.IPYKERNEL.is_running
-				else 3 * ('',),
-				strict=True,
+			## Security-sensitive values may be copied, though the key is shown masked.
+			## An attacker with access to Blender's memory could get it anyway.
+			## Thus, there's no good reason to keep it from the operator.
+			for label, (value, value_to_copy) in zip(
+				jupyter_kernel.SECURITY_LABELS, kernel.security, strict=True
 			):
 				grid.label(text=label)
 				grid_section = grid.column()
 				grid_section_row = grid_section.row()
 				grid_section_row.alignment = 'RIGHT'
 				grid_section_row.label(
-					text=str(value),
-					icon='QUESTION'
-					if not jupyter_kernel.is_kernel_running()
-					else 'NONE',
+					text=value,
+					icon='QUESTION' if not kernel.is_running else 'NONE',
+				)
+				op = grid_section_row.operator(
+					OperatorType.CopyKernelInfoToClipboard, icon='COPYDOWN', text=''
 				)
+				op.value_to_copy = value_to_copy  # pyright: ignore[reportAttributeAccessIssue]
 
-				# Special Case: Allow Copying Security-Sensitive Values
-				## An attacker with access to Blender's memory could get it anyway.
-				## Thus, there's no good reason to keep it from the operator.
-				if isinstance(value, pyd.SecretStr):
-					op = grid_section_row.operator(
-						OperatorType.CopyKernelInfoToClipboard, icon='COPYDOWN', text=''
+		####################
+		# - Section: Start Latency
+		####################
+		header, body = layout.panel(
+			PanelType.JupyterPanel + '_latency',
+			default_closed=True,
+		)
+		header.label(text='Start Latency')
+		if body is not None:  # pyright: ignore[reportUnnecessaryComparison]
+			prewarm_state = kernel_prewarm.state()
+			timings = (
+				jupyter_kernel.IPYKERNEL.timings
+				if jupyter_kernel.IPYKERNEL is not None
+				else None
+			)
+
+			grid = body.grid_flow(
+				row_major=True, columns=2, even_rows=True, even_columns=True
+			)
+			for label, value in [
+				(
+					'Pre-Warm',
+					prewarm_state.status.title()
+					if prewarm_state.import_sec is None
+					else f'{1000 * prewarm_state.import_sec:.1f} ms',
+				),
+				('Import on Start', _format_ms(jupyter_kernel.IMPORT_SEC)),
+				(
+					'Kernel Start',
+					_format_ms(None if timings is None else timings.start_sec),
+				),
+				(
+					'Kernel Restart',
+					_format_ms(None if timings is None else timings.restart_sec),
+				),
+				(
+					'Kernel Stop',
+					_format_ms(None if timings is None else timings.stop_sec),
+				),
+				(
+					'Memory Reclaim',
+					_format_ms(
+						None
+						if timings is None or timings.reclaim is None
+						else timings.reclaim.drop_sec + timings.reclaim.gc_sec
+					),
+				),
+			]:
+				grid.label(text=label)
+				grid_section_row = grid.column().row()
+				grid_section_row.alignment = 'RIGHT'
+				grid_section_row.label(text=value)
+
+		####################
+		# - Section: Cell Timings
+		####################
+		header, body = layout.panel(
+			PanelType.JupyterPanel + '_celltimings',
+			default_closed=True,
+		)
+		header.label(text='Cell Timings')
+		if body is not None:  # pyright: ignore[reportUnnecessaryComparison]
+			cell_timings = (
+				jupyter_kernel.IPYKERNEL.cell_timings
+				if jupyter_kernel.IPYKERNEL is not None
+				else None
+			)
+			if cell_timings is not None and cell_timings.cells:
+				grid = body.grid_flow(
+					row_major=True, columns=2, even_rows=True, even_columns=True
+				)
+				for label, series in [
+					('Queue Wait (p50/p95)', cell_timings.queue_sec),
+					('Wall Time (p50/p95)', cell_timings.wall_sec),
+					('Blocking (p50/p95)', cell_timings.blocking_sec),
+				]:
+					grid.label(text=label)
+					grid_section_row = grid.column().row()
+					grid_section_row.alignment = 'RIGHT'
+					grid_section_row.label(
+						text=f'{1000 * series.p50:.1f} / {1000 * series.p95:.1f} ms'
 					)
-					op.value_to_copy = str(value.get_secret_value())  # pyright: ignore[reportAttributeAccessIssue]
+				grid.label(text='Longest Block')
+				grid_section_row = grid.column().row()
+				grid_section_row.alignment = 'RIGHT'
+				grid_section_row.label(
+					text=_format_ms(cell_timings.max_blocking_sec.max)
+				)
+
+				####################
+				# - Recent Cells
+				####################
+				subheader, subbody = body.panel(
+					PanelType.JupyterPanel + '_celltimings_recent',
+					default_closed=True,
+				)
+				subheader.label(text='Recent Cells')
+				if subbody is not None:  # pyright: ignore[reportUnnecessaryComparison]
+					box = subbody.box()
+					col = box.column(align=False)
+					col.scale_y = 0.5
+					for timing in reversed(cell_timings.cells[-5:]):
+						col.label(
+							text=f'{1000 * timing.max_blocking_sec:.0f} ms: '
+							+ (timing.code or '(empty)'),
+							icon='ERROR' if timing.status == 'error' else 'NONE',
+						)
+			else:
+				box = body.box()
+				row = box.row(align=False)
+				row.alignment = 'CENTER'
+				row.label(text='No Cells Run')
+
+		####################
+		# - Section: Event Loop Metrics
+		####################
+		header, body = layout.panel(
+			PanelType.JupyterPanel + '_eventloop',
+			default_closed=True,
+		)
+		header.label(text='Event Loop')
+		if body is not None:  # pyright: ignore[reportUnnecessaryComparison]
+			# Deferred Import: asyncio
+			from ..services import async_event_loop
+
+			loop_metrics = async_event_loop.metrics()
+
+			grid = body.grid_flow(
+				row_major=True, columns=2, even_rows=True, even_columns=True
+			)
+			for label, value in [
+				('Tick Interval', f'{1000 * loop_metrics.state.interval_sec:.2f} ms'),
+				(
+					'Skipped Ticks',
+					f'{loop_metrics.state.skipped_ticks} / {loop_metrics.state.ticks}',
+				),
+				(
+					'Timer Lag (p50/p95)',
+					f'{1000 * loop_metrics.lag_sec.p50:.2f} / {1000 * loop_metrics.lag_sec.p95:.2f} ms',
+				),
+				(
+					'Run Time (p95/max)',
+					f'{1000 * loop_metrics.run_sec.p95:.2f} / {1000 * loop_metrics.run_sec.max:.2f} ms',
+				),
+				(
+					'Ready Depth (p95/max)',
+					f'{loop_metrics.ready_depth.p95:.0f} / {loop_metrics.ready_depth.max:.0f}',
+				),
+			]:
+				grid.label(text=label)
+				grid_section_row = grid.column().row()
+				grid_section_row.alignment = 'RIGHT'
+				grid_section_row.label(text=value)
+
+			####################
+			# - Slow Callbacks
+			####################
+			subheader, subbody = body.panel(
+				PanelType.JupyterPanel + '_eventloop_slow',
+				default_closed=True,
+			)
+			subheader.label(text=f'Slow Callbacks ({len(loop_metrics.slow_callbacks)})')
+			if subbody is not None:  # pyright: ignore[reportUnnecessaryComparison]
+				box = subbody.box()
+				col = box.column(align=False)
+				col.scale_y = 0.5
+				if loop_metrics.slow_callbacks:
+					for slow_callback in reversed(loop_metrics.slow_callbacks[-5:]):
+						col.label(
+							text=f'{1000 * slow_callback.duration_sec:.0f} ms: '
+							+ ', '.join(slow_callback.callbacks),
+						)
 				else:
-					op = grid_section_row.operator(
-						OperatorType.CopyKernelInfoToClipboard, icon='COPYDOWN', text=''
-					)
-					op.value_to_copy = str(value)  # pyright: ignore[reportAttributeAccessIssue]
+					row = col.row(align=False)
+					row.alignment = 'CENTER'
+					row.label(text='None Recorded')
 
 
 ####################
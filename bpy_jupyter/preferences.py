@@ -21,9 +21,48 @@ Attributes:
 """
 
 import bpy
+import typing_extensions as typ_ext
 
+from .services import jupyter_kernel, kernel_prewarm
 from .types import EXT_PACKAGE
 
+####################
+# - Property Callbacks
+####################
+## Blender only keeps references to the strings of enum items, that Python also keeps.
+_KERNEL_TRANSPORT_ITEMS = [
+	(
+		'tcp',
+		'TCP',
+		'Bind ports on the loopback interface. Requires online access',
+		0,
+	),
+	(
+		'ipc',
+		'Unix Sockets',
+		'Bind Unix domain sockets next to the connection file. Faster, but only for clients on this machine',
+		1,
+	),
+]
+_KERNEL_TRANSPORT_ITEMS_TCP = _KERNEL_TRANSPORT_ITEMS[:1]
+
+
+def _kernel_transport_items(
+	_self: 'BPYJupyterAddonPrefs', _context: bpy.types.Context | None
+) -> list[tuple[str, str, str, int]]:
+	"""Transports that kernels can use on this platform."""
+	if jupyter_kernel.has_ipc():
+		return _KERNEL_TRANSPORT_ITEMS
+	return _KERNEL_TRANSPORT_ITEMS_TCP
+
+
+def _update_use_kernel_prewarm(
+	self: 'BPYJupyterAddonPrefs', _context: bpy.types.Context
+) -> None:
+	"""Start pre-warming right away, when `use_kernel_prewarm` is enabled."""
+	if self.use_kernel_prewarm:
+		kernel_prewarm.start()
+
 
 ####################
 # - Class: Preferences
@@ -33,10 +72,78 @@ class BPYJupyterAddonPrefs(bpy.types.AddonPreferences):
 
 	Attributes:
 		bl_idname: Matches `__package__`.
+		use_kernel_prewarm: Whether to import the kernel's dependencies in the background, shortly after Blender starts.
+		kernel_transport: How clients connect to kernels started from the UI.
+			_`ipc` is only offered where `jupyter_kernel.has_ipc()`._
+		use_stable_connection: Whether kernels started from the UI reuse the ports and key of their previous run.
+		output_max_chars_per_sec: Output rate of a kernel, beyond which output is dropped.
+			_`0` disables the rate limit._
+		output_max_cell_chars: Output of each cell, beyond which further output is dropped.
+			_`0` disables truncation._
+		output_max_history_mb: Megabytes of displayed results kept in `Out`, beyond which the least recently displayed are evicted.
+			_`0` disables eviction by size._
 	"""
 
 	bl_idname: str = EXT_PACKAGE
 
+	use_kernel_prewarm: bpy.props.BoolProperty(  # pyright: ignore[reportInvalidTypeForm, reportUninitializedInstanceVariable]
+		name='Pre-Warm Kernel',
+		description='Import the kernel in the background after Blender starts, so that starting a kernel is fast. Uses more memory, even if no kernel is started',
+		default=False,
+		update=_update_use_kernel_prewarm,
+	)
+	kernel_transport: bpy.props.EnumProperty(  # pyright: ignore[reportInvalidTypeForm, reportUninitializedInstanceVariable]
+		name='Kernel Transport',
+		description='How clients connect to kernels started from the UI',
+		items=_kernel_transport_items,
+		## Items made by a callback can only have a default by number.
+		default=0,
+	)
+	use_stable_connection: bpy.props.BoolProperty(  # pyright: ignore[reportInvalidTypeForm, reportUninitializedInstanceVariable]
+		name='Stable Connection',
+		description='Reuse the ports and key of the previous run when starting a kernel, so that connected clients reconnect by themselves. New ports and a new key are used when any port is taken, or another Blender process uses them',
+		default=False,
+	)
+	output_max_chars_per_sec: bpy.props.IntProperty(  # pyright: ignore[reportInvalidTypeForm, reportUninitializedInstanceVariable]
+		name='Max Output Rate',
+		description='Characters of cell output per second, beyond which output is dropped. 0 for no limit',
+		default=1_000_000,
+		min=0,
+	)
+	output_max_cell_chars: bpy.props.IntProperty(  # pyright: ignore[reportInvalidTypeForm, reportUninitializedInstanceVariable]
+		name='Max Cell Output',
+		description='Characters of output per cell, beyond which further output is dropped. 0 for no limit',
+		default=10_000_000,
+		min=0,
+	)
+	output_max_history_mb: bpy.props.IntProperty(  # pyright: ignore[reportInvalidTypeForm, reportUninitializedInstanceVariable]
+		name='Max Output History',
+		description='Megabytes of displayed results kept in Out, beyond which the least recently displayed are evicted. 0 for no limit',
+		default=512,
+		min=0,
+	)
+
+	@typ_ext.override
+	def draw(self, context: bpy.types.Context) -> None:
+		"""Draw the addon preferences.
+
+		Parameters:
+			context: The Blender context object.
+				_Not used._
+		"""
+		layout = self.layout
+		if layout is None:
+			return
+
+		_ = layout.prop(self, 'use_kernel_prewarm')
+		_ = layout.prop(self, 'kernel_transport')
+		_ = layout.prop(self, 'use_stable_connection')
+
+		col = layout.column(heading='Output')
+		_ = col.prop(self, 'output_max_chars_per_sec')
+		_ = col.prop(self, 'output_max_cell_chars')
+		_ = col.prop(self, 'output_max_history_mb')
+
 
 ####################
 # - Blender Registration
@@ -43,24 +43,417 @@ If that code uses a lot of CPU processing, then **it will block that main thread
 To run expensive code "in the background", one should use the right tools for the job, such as `multiprocessing`.
 The `async` part only comes into play when ex. `await`ing messages from that external process to update the extension's UI.
 
+## Adaptive Pumping
+Blender must be asked to run `increment_event_loop` periodically, but how often is a tradeoff:
+
+- **Too Rarely**: Kernel requests are answered slowly, since each message waits for the next tick.
+- **Too Often**: Blender wakes up constantly, consuming CPU even when no client is connected.
+
+Therefore, the interval between ticks is chosen adaptively, according to a `PumpPolicy`.
+While the event loop is idle, the interval backs off towards `PumpPolicy.max_interval_sec`.
+As soon as there is work to do (I/O events, ready callbacks, or due timers), it snaps back to `PumpPolicy.min_interval_sec`.
+
+## Draining
+A single iteration only runs the callbacks that were ready when it began.
+Callbacks scheduled _during_ that iteration (ex. the next step of a coroutine chain) would therefore wait for the next tick, so that a chain of `N` `await`s would take `N` ticks.
+
+To avoid this, each tick keeps iterating the event loop until either no callbacks are ready, or `PumpPolicy.drain_budget_sec` has been spent.
+The budget bounds how long Blender's UI is blocked by each tick.
+
+## Gating
+Most ticks find nothing to do: No callbacks are ready, no timers are due, and none of the sockets watched by the event loop (ex. the kernel's ZMQ shell socket) are readable.
+Spinning the event loop for such a tick is pure overhead, so when `PumpPolicy.gate_idle_ticks` is set, such ticks return without running the event loop at all.
+
+Checking for readable sockets is done by polling the event loop's own selector with a timeout of `0`.
+This covers every file descriptor registered with the event loop, including the FDs of all `ZMQStream`s.
+Unlike reading `zmq.EVENTS`, polling these FDs doesn't consume their edge-triggered notifications.
+
+## Batching
+While a scene batch of `bpy_jupyter.utils.scene_batching` is active, a tick doesn't return control to Blender after draining.
+Instead, it keeps running the event loop (blocking on its selector for at most `BATCH_WAIT_SEC` at a time), until the batch ends.
+This way, Blender neither evaluates the depsgraph nor redraws between the steps of a batched cell.
+
+So that a batch that waits for a long time can't freeze Blender indefinitely, each tick holds on to a batch for at most `PumpPolicy.max_batch_hold_sec`.
+
+## Instrumentation
+To tell whether slowness comes from Blender's timer scheduling, from this pump, or from the code running on the event loop, each tick records:
+
+- **Timer Lag**: How much later than requested Blender actually ran the tick.
+- **Run Time**: How long the tick spent running the event loop.
+- **Ready Depth**: How many callbacks were ready when the tick began.
+- **Slow Callbacks**: Which callbacks were running when a single iteration took longer than `SLOW_CALLBACK_SEC`.
+
+Measurements are kept in fixed-size ring buffers of length `METRICS_WINDOW`, and are only summarized when `metrics()` is called.
+
+## Background Mode
+When Blender runs with `--background`, there is no UI to keep responsive, and `bpy.app.timers` doesn't keep Blender alive.
+There, `run_until_stopped()` should be used instead of `start()`, which drives the event loop natively using `loop.run_forever()`.
+The event loop then blocks on its selector until there's work to do, so idle overhead is close to zero.
 
 Attributes:
-	EVENT_LOOP_TIMEOUT_SEC: Number of seconds between each iteration of the `asyncio` event loop.
+	METRICS_WINDOW: Number of most recent ticks whose measurements are retained.
+	SLOW_CALLBACK_SEC: Seconds that a single event loop iteration must exceed, for its callbacks to be recorded as slow.
+	SLOW_CALLBACK_MAX_DESCRIBED: Maximum number of callbacks described for each slow iteration.
+	BATCH_WAIT_SEC: Seconds that the event loop may block on its selector at a time, while a tick holds on to a batch.
+	EVENT_LOOP: The `asyncio` event loop incremented by the pump, once `start()` has been called.
+	PUMP_POLICY: The policy currently used to choose the interval between ticks.
+	_PUMP_STATE: The live state of the adaptive pump.
+	_IO_EVENT_COUNT: Number of I/O events processed by the event loop since the last tick.
+	_SAMPLES: Ring buffers of per-tick measurements.
 """
 
 import asyncio
+import collections
+import contextlib
+import dataclasses
+import itertools
+import signal
+import time
+import typing as typ
 
 import bpy
 
+from ..utils import scene_batching
+from ..utils.stats import SeriesSummary
+
 ####################
 # - Constants
 ####################
-EVENT_LOOP_TIMEOUT_SEC = 0.001
+METRICS_WINDOW = 1024
+SLOW_CALLBACK_SEC = 0.05
+SLOW_CALLBACK_MAX_DESCRIBED = 4
+BATCH_WAIT_SEC = 0.001
+
+
+####################
+# - Types
+####################
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class PumpPolicy:
+	"""Determines how often Blender is asked to run `increment_event_loop`.
+
+	Attributes:
+		min_interval_sec: Seconds between ticks, while the event loop has work to do.
+		max_interval_sec: Ceiling on the seconds between ticks, approached while the event loop is idle.
+		backoff_factor: Multiplier applied to the interval after each idle tick.
+		drain_budget_sec: Seconds that each tick may spend iterating the event loop, while callbacks remain ready.
+			_When `0`, each tick runs exactly one iteration._
+		gate_idle_ticks: Whether to skip running the event loop on ticks where no work is pending.
+		max_batch_hold_sec: Seconds that each tick may keep running the event loop, while a scene batch is active.
+	"""
+
+	min_interval_sec: float = 0.0005
+	max_interval_sec: float = 0.05
+	backoff_factor: float = 1.5
+	drain_budget_sec: float = 0.004
+	gate_idle_ticks: bool = True
+	max_batch_hold_sec: float = 2.0
+
+	def __post_init__(self) -> None:
+		"""Check that the policy is self-consistent.
+
+		Raises:
+			ValueError: If the intervals are not positive and ordered, if `backoff_factor < 1`, or if `drain_budget_sec` or `max_batch_hold_sec` is negative.
+		"""
+		if not 0 < self.min_interval_sec <= self.max_interval_sec:
+			msg = f'Pump intervals must satisfy `0 < min_interval_sec <= max_interval_sec` (got {self.min_interval_sec}, {self.max_interval_sec}).'
+			raise ValueError(msg)
+		if self.backoff_factor < 1:
+			msg = (
+				f'Pump `backoff_factor` must be at least 1 (got {self.backoff_factor}).'
+			)
+			raise ValueError(msg)
+		if self.drain_budget_sec < 0:
+			msg = f'Pump `drain_budget_sec` must be non-negative (got {self.drain_budget_sec}).'
+			raise ValueError(msg)
+		if self.max_batch_hold_sec < 0:
+			msg = f'Pump `max_batch_hold_sec` must be non-negative (got {self.max_batch_hold_sec}).'
+			raise ValueError(msg)
+
+
+@dataclasses.dataclass(kw_only=True, slots=True)
+class PumpState:
+	"""The live state of the adaptive pump.
+
+	Attributes:
+		interval_sec: Seconds that `increment_event_loop` last asked Blender to wait.
+		idle_ticks: Number of consecutive ticks in which the event loop had no work.
+		io_events: Number of I/O events processed during the last tick.
+		iterations: Number of event loop iterations run during the last tick.
+			_When `0`, the tick was skipped, since no work was pending._
+		ticks: Total number of ticks since `start()`.
+		skipped_ticks: Total number of ticks since `start()`, which were skipped since no work was pending.
+	"""
+
+	interval_sec: float
+	idle_ticks: int = 0
+	io_events: int = 0
+	iterations: int = 0
+	ticks: int = 0
+	skipped_ticks: int = 0
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class SlowCallback:
+	"""An event loop iteration that took longer than `SLOW_CALLBACK_SEC`.
+
+	Attributes:
+		timestamp: Value of `time.time()` when the iteration finished.
+		duration_sec: Seconds that the iteration took.
+		callbacks: Descriptions of (the first few) callbacks that were ready when the iteration began.
+	"""
+
+	timestamp: float
+	duration_sec: float
+	callbacks: tuple[str, ...]
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class LoopMetrics:
+	"""Summarized measurements of the most recent ticks.
+
+	Attributes:
+		state: The live state of the adaptive pump.
+		lag_sec: How much later than requested each tick actually ran.
+		run_sec: Time spent running the event loop, for each tick that wasn't skipped.
+		ready_depth: Number of ready callbacks at the start of each tick that wasn't skipped.
+		slow_callbacks: The most recent iterations that took longer than `SLOW_CALLBACK_SEC`, oldest first.
+	"""
+
+	state: PumpState
+	lag_sec: SeriesSummary
+	run_sec: SeriesSummary
+	ready_depth: SeriesSummary
+	slow_callbacks: tuple[SlowCallback, ...]
+
+
+@dataclasses.dataclass(kw_only=True, slots=True)
+class _TickSamples:
+	"""Ring buffers of per-tick measurements, as well as the state needed to compute timer lag."""
+
+	lag_sec: collections.deque[float] = dataclasses.field(
+		default_factory=lambda: collections.deque(maxlen=METRICS_WINDOW)
+	)
+	run_sec: collections.deque[float] = dataclasses.field(
+		default_factory=lambda: collections.deque(maxlen=METRICS_WINDOW)
+	)
+	ready_depth: collections.deque[int] = dataclasses.field(
+		default_factory=lambda: collections.deque(maxlen=METRICS_WINDOW)
+	)
+	slow_callbacks: collections.deque[SlowCallback] = dataclasses.field(
+		default_factory=lambda: collections.deque(maxlen=METRICS_WINDOW // 16)
+	)
+	last_tick_end: float | None = None
+
+
+####################
+# - Globals
+####################
+EVENT_LOOP: asyncio.AbstractEventLoop | None = None
+PUMP_POLICY: PumpPolicy = PumpPolicy()
+_PUMP_STATE: PumpState = PumpState(interval_sec=PUMP_POLICY.min_interval_sec)
+_IO_EVENT_COUNT: int = 0
+_SAMPLES: _TickSamples = _TickSamples()
+
+
+####################
+# - Event Loop Introspection
+####################
+def _instrument_loop(loop: asyncio.AbstractEventLoop) -> None:
+	"""Count the I/O events processed by `loop`, by wrapping its internal `_process_events`.
+
+	Notes:
+		Both `SelectorEventLoop` and `ProactorEventLoop` pass the result of each `select()` to `_process_events`.
+		Wrapping it is therefore the cheapest way to learn whether any socket had activity during a tick.
+
+		Instrumenting the same loop twice is a no-op.
+
+	Parameters:
+		loop: The event loop to instrument.
+	"""
+	process_events = getattr(loop, '_process_events', None)
+	if process_events is None or getattr(process_events, '_bpy_jupyter_counted', False):
+		return
+
+	def counted_process_events(event_list: list[typ.Any]) -> None:
+		global _IO_EVENT_COUNT  # noqa: PLW0603
+		_IO_EVENT_COUNT += len(event_list)
+		process_events(event_list)
+
+	counted_process_events._bpy_jupyter_counted = True  # pyright: ignore[reportFunctionMemberAccess]  # noqa: SLF001
+	loop._process_events = counted_process_events  # pyright: ignore[reportAttributeAccessIssue]  # noqa: SLF001
+
+
+def _num_ready(loop: asyncio.AbstractEventLoop) -> int:
+	"""Number of callbacks that are ready to run on `loop`, without waiting for I/O or timers."""
+	return len(getattr(loop, '_ready', ()))
+
+
+def _sec_until_next_timer(loop: asyncio.AbstractEventLoop) -> float | None:
+	"""Seconds until the earliest scheduled timer on `loop` is due, or `None` if no timers are scheduled.
+
+	Notes:
+		Cancelled timers are lazily removed from the heap by `asyncio`, so the result may be conservatively early.
+	"""
+	scheduled: list[asyncio.TimerHandle] = getattr(loop, '_scheduled', [])
+	if scheduled:
+		return scheduled[0].when() - loop.time()
+	return None
+
+
+def _describe_handle(handle: asyncio.Handle) -> str:
+	"""Human-readable description of the callback wrapped by an `asyncio.Handle`.
+
+	Notes:
+		Wakeups of an `asyncio.Task` are described by the task's name and coroutine, which is far more useful than the name of the wakeup method.
+	"""
+	callback = getattr(handle, '_callback', None)
+	owner = getattr(callback, '__self__', None)
+	if isinstance(owner, asyncio.Task):
+		coro = owner.get_coro()
+		return f'{owner.get_name()} ({getattr(coro, "__qualname__", repr(coro))})'
+	return getattr(callback, '__qualname__', repr(callback))
+
+
+def _has_pending_work(loop: asyncio.AbstractEventLoop) -> bool:
+	"""Cheaply check whether an iteration of `loop` would have anything to do.
+
+	Notes:
+		Work is pending if any callback is ready, if any timer is due, or if any file descriptor watched by the loop is ready.
+
+		Event loops without a selector (ex. `ProactorEventLoop`) can't be checked, and are therefore always presumed to have pending work.
+
+	Parameters:
+		loop: The event loop to check.
+
+	Returns:
+		Whether running an iteration of `loop` might do some work.
+	"""
+	if _num_ready(loop) > 0:
+		return True
+
+	sec_until_next_timer = _sec_until_next_timer(loop)
+	if sec_until_next_timer is not None and sec_until_next_timer <= 0:
+		return True
+
+	selector = getattr(loop, '_selector', None)
+	if selector is None:
+		return True
+	return len(selector.select(0)) > 0
+
+
+def _next_interval_sec(loop: asyncio.AbstractEventLoop, *, had_work: bool) -> float:
+	"""Compute the interval to wait before the next tick, and update `_PUMP_STATE` accordingly.
+
+	Parameters:
+		loop: The event loop that was just incremented.
+		had_work: Whether the tick that just ran did any work.
+
+	Returns:
+		The number of seconds to wait before running `increment_event_loop` again.
+	"""
+	policy = PUMP_POLICY
+	state = _PUMP_STATE
+
+	if had_work or _num_ready(loop) > 0:
+		state.idle_ticks = 0
+		interval_sec = policy.min_interval_sec
+	else:
+		state.idle_ticks += 1
+		interval_sec = min(
+			state.interval_sec * policy.backoff_factor, policy.max_interval_sec
+		)
+
+	# Don't Oversleep Scheduled Timers
+	## Otherwise, ex. 'asyncio.sleep()' would be up to 'max_interval_sec' late.
+	sec_until_next_timer = _sec_until_next_timer(loop)
+	if sec_until_next_timer is not None:
+		interval_sec = max(
+			min(interval_sec, sec_until_next_timer), policy.min_interval_sec
+		)
+
+	state.interval_sec = interval_sec
+	return interval_sec
 
 
 ####################
 # - Event Loop
 ####################
+def _run_once(loop: asyncio.AbstractEventLoop) -> None:
+	"""Run exactly one iteration of `loop`, using `loop.call_soon(loop.stop)`, then `loop.run_forever()`.
+
+	Notes:
+		If the iteration takes longer than `SLOW_CALLBACK_SEC`, the callbacks that were ready when it began are recorded as slow.
+	"""
+	first_ready = tuple(
+		itertools.islice(getattr(loop, '_ready', ()), SLOW_CALLBACK_MAX_DESCRIBED)
+	)
+
+	time_start = time.perf_counter()
+	_ = loop.call_soon(loop.stop)
+	loop.run_forever()
+	duration_sec = time.perf_counter() - time_start
+
+	if duration_sec > SLOW_CALLBACK_SEC:
+		_SAMPLES.slow_callbacks.append(
+			SlowCallback(
+				timestamp=time.time(),
+				duration_sec=duration_sec,
+				callbacks=tuple(_describe_handle(handle) for handle in first_ready),
+			)
+		)
+
+
+def _drain(loop: asyncio.AbstractEventLoop, *, budget_sec: float) -> int:
+	"""Iterate `loop` until no callbacks are ready, or until `budget_sec` has been spent.
+
+	Notes:
+		At least one iteration is always run, even when `budget_sec` is `0`.
+
+	Parameters:
+		loop: The event loop to iterate.
+		budget_sec: Seconds that may be spent iterating, after which no new iteration is started.
+
+	Returns:
+		The number of iterations that were run.
+	"""
+	deadline = time.perf_counter() + budget_sec
+
+	_run_once(loop)
+	iterations = 1
+	while _num_ready(loop) > 0 and time.perf_counter() < deadline:
+		_run_once(loop)
+		iterations += 1
+
+	return iterations
+
+
+def _hold_batch(loop: asyncio.AbstractEventLoop, *, budget_sec: float) -> int:
+	"""Keep iterating `loop` while a scene batch is active, or until `budget_sec` has been spent.
+
+	Notes:
+		Each run of `loop` lasts at most `BATCH_WAIT_SEC`, after which the batch is checked for again.
+		So, the batch ending is noticed at most `BATCH_WAIT_SEC` late.
+
+	Parameters:
+		loop: The event loop to iterate.
+		budget_sec: Seconds that may be spent iterating, after which control is returned to Blender, even if the batch is still active.
+
+	Returns:
+		The number of runs of `loop`.
+	"""
+	deadline = time.perf_counter() + budget_sec
+
+	runs = 0
+	while scene_batching.is_batching() and time.perf_counter() < deadline:
+		handle = loop.call_later(BATCH_WAIT_SEC, loop.stop)
+		loop.run_forever()
+		handle.cancel()
+		runs += 1
+
+	return runs
+
+
 @bpy.app.handlers.persistent
 def increment_event_loop() -> float:
 	"""Run one iteration of the `asyncio` event loop.
@@ -73,17 +466,112 @@ def increment_event_loop() -> float:
 
 	Since the event loop retains its state, and ability to accept tasks, after `loop.stop()`, doing this repeatedly amounts to a frequently invoked "pause and flush".
 
+	While callbacks remain ready, further iterations are run within `PUMP_POLICY.drain_budget_sec`.
+	While a scene batch is active, the event loop keeps running for up to `PUMP_POLICY.max_batch_hold_sec`.
+	When `PUMP_POLICY.gate_idle_ticks` is set, and no work is pending, the event loop isn't run at all.
+
 	Notes:
 		**To enable**, use `bpy.app.timers.register(increment_event_loop, persistent=True)`.
 
+		"Very often" is decided by `PUMP_POLICY`; see the module documentation.
+
 	Returns:
 		The number of seconds to wait before running this function again.
 	"""
+	global _IO_EVENT_COUNT  # noqa: PLW0603
+
 	loop = asyncio.get_event_loop()
-	_ = loop.call_soon(loop.stop)
-	loop.run_forever()
+	time_start = time.perf_counter()
+	_PUMP_STATE.ticks += 1
+
+	# Measure Timer Lag
+	if _SAMPLES.last_tick_end is not None:
+		_SAMPLES.lag_sec.append(
+			time_start - _SAMPLES.last_tick_end - _PUMP_STATE.interval_sec
+		)
+
+	# Skip Idle Ticks
+	if PUMP_POLICY.gate_idle_ticks and not _has_pending_work(loop):
+		_PUMP_STATE.io_events = 0
+		_PUMP_STATE.iterations = 0
+		_PUMP_STATE.skipped_ticks += 1
+		interval_sec = _next_interval_sec(loop, had_work=False)
+
+		_SAMPLES.last_tick_end = time.perf_counter()
+		return interval_sec
+
+	num_ready = _num_ready(loop)
+	iterations = _drain(loop, budget_sec=PUMP_POLICY.drain_budget_sec)
+	if scene_batching.is_batching():
+		iterations += _hold_batch(loop, budget_sec=PUMP_POLICY.max_batch_hold_sec)
 
-	return EVENT_LOOP_TIMEOUT_SEC
+	io_events = _IO_EVENT_COUNT
+	_IO_EVENT_COUNT = 0
+
+	_PUMP_STATE.io_events = io_events
+	_PUMP_STATE.iterations = iterations
+	interval_sec = _next_interval_sec(loop, had_work=num_ready > 0 or io_events > 0)
+
+	_SAMPLES.last_tick_end = time.perf_counter()
+	_SAMPLES.run_sec.append(_SAMPLES.last_tick_end - time_start)
+	_SAMPLES.ready_depth.append(num_ready)
+	return interval_sec
+
+
+####################
+# - Pump Policy
+####################
+def set_pump_policy(policy: PumpPolicy) -> None:
+	"""Replace the policy used to choose the interval between ticks.
+
+	Notes:
+		The new policy takes effect on the next tick, which starts out at `policy.min_interval_sec`.
+
+	Parameters:
+		policy: The new pump policy.
+	"""
+	global PUMP_POLICY  # noqa: PLW0603
+
+	PUMP_POLICY = policy  # pyright: ignore[reportConstantRedefinition]
+	_PUMP_STATE.interval_sec = policy.min_interval_sec
+	_PUMP_STATE.idle_ticks = 0
+
+
+def pump_state() -> PumpState:
+	"""A snapshot of the live state of the adaptive pump.
+
+	Returns:
+		A copy of the pump state, which is safe to keep around.
+	"""
+	return dataclasses.replace(_PUMP_STATE)
+
+
+####################
+# - Metrics
+####################
+def metrics() -> LoopMetrics:
+	"""Summarize the measurements of the most recent `METRICS_WINDOW` ticks.
+
+	Notes:
+		Summarizing sorts each ring buffer, so avoid calling this very often (ex. more than once per redraw).
+
+	Returns:
+		Summaries of timer lag, run time and ready depth, as well as the most recent slow callbacks.
+	"""
+	return LoopMetrics(
+		state=pump_state(),
+		lag_sec=SeriesSummary.from_samples(_SAMPLES.lag_sec),
+		run_sec=SeriesSummary.from_samples(_SAMPLES.run_sec),
+		ready_depth=SeriesSummary.from_samples(_SAMPLES.ready_depth),
+		slow_callbacks=tuple(_SAMPLES.slow_callbacks),
+	)
+
+
+def reset_metrics() -> None:
+	"""Discard all measurements recorded so far."""
+	global _SAMPLES  # noqa: PLW0603
+
+	_SAMPLES = _TickSamples()
 
 
 ####################
@@ -97,6 +585,14 @@ def start() -> None:
 
 		**DO NOT** run if an event loop has already been started using `start()`.
 	"""
+	global EVENT_LOOP, _PUMP_STATE, _IO_EVENT_COUNT  # noqa: PLW0603
+
+	EVENT_LOOP = asyncio.get_event_loop()  # pyright: ignore[reportConstantRedefinition]
+	_instrument_loop(EVENT_LOOP)
+	_PUMP_STATE = PumpState(interval_sec=PUMP_POLICY.min_interval_sec)
+	_IO_EVENT_COUNT = 0
+	reset_metrics()
+
 	bpy.app.timers.register(increment_event_loop, persistent=True)
 
 
@@ -109,3 +605,34 @@ def stop():
 		**DO NOT** run if an event loop has not already been started using `start()`.
 	"""
 	bpy.app.timers.unregister(increment_event_loop)
+
+
+def run_until_stopped() -> None:
+	"""Run the `asyncio` event loop natively, blocking until `loop.stop()` is called.
+
+	Notes:
+		Use instead of `start()`, when Blender runs in background mode.
+		**DO NOT** use while Blender's UI is running, since it would freeze until the event loop is stopped.
+
+		`SIGINT` and `SIGTERM` stop the event loop, where the platform supports `loop.add_signal_handler()`.
+	"""
+	global EVENT_LOOP  # noqa: PLW0603
+
+	EVENT_LOOP = asyncio.get_event_loop()  # pyright: ignore[reportConstantRedefinition]
+
+	stop_signals: list[signal.Signals] = []
+	for stop_signal in (signal.SIGINT, signal.SIGTERM):
+		with contextlib.suppress(NotImplementedError):
+			EVENT_LOOP.add_signal_handler(stop_signal, EVENT_LOOP.stop)
+			stop_signals.append(stop_signal)
+
+	try:
+		EVENT_LOOP.run_forever()
+	finally:
+		for stop_signal in stop_signals:
+			_ = EVENT_LOOP.remove_signal_handler(stop_signal)
+
+
+def is_running() -> bool:
+	"""Whether the `asyncio` event loop is currently being incremented by Blender."""
+	return bpy.app.timers.is_registered(increment_event_loop)
@@ -14,7 +14,7 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-"""Manages a global instance of an embedded `ipython` kernel, as implemented by `bpy_jupyter.utils.IPyKernel`.
+"""Manages a registry of named, embedded `ipython` kernels, as implemented by `bpy_jupyter.utils.IPyKernel`.
 
 Notes:
 	**Must** be used together with `bpy_jupyter.services.async_event_loop`, or some other implementation of an `asyncio` event loop.
@@ -22,54 +22,316 @@ Notes:
 	If this is not done, then the embedded kernel will be unable to act on incoming requests.
 	Instead, such requests will hang forever / until timing out.
 
+	Several kernels can run at once, each with their own sockets, connection file and shell namespace.
+	They all share the loaded `.blend` file, and are all driven by the same event loop.
+	Only one of them at a time forwards output written directly to file descriptors; see `IPyKernel.capture_fd_output`.
+	The kernel named `DEFAULT_KERNEL_NAME` is the one controlled from the UI, and is also available as `IPYKERNEL`.
+
+	Whenever a kernel is initialized, started, stopped or restarted, an immutable `KernelSnapshot` of its state is published to `SNAPSHOTS`.
+	UI code (ex. `JupyterPanel.draw()`) should read these snapshots, which is cheap and never waits for a kernel's lock.
+	Regions of the `PROPERTIES` editor are only redrawn when a snapshot actually changes.
+
+	`bpy_jupyter.utils.ipykernel` (and with it `ipykernel`, `zmq` and `pydantic`) is only imported once `init()` is first called.
+	This keeps enabling the extension cheap, since most Blender sessions never start a kernel.
+	To avoid paying for this import when starting a kernel, see `bpy_jupyter.services.kernel_prewarm`.
+
 Attributes:
-	IPYKERNEL: An instance of the embedded `ipython` kernel.
+	DEFAULT_KERNEL_NAME: Name of the kernel controlled from the UI.
+	KERNELS: All initialized kernels, by name.
+	IPYKERNEL: The kernel named `DEFAULT_KERNEL_NAME`, if it was initialized.
+	IMPORT_SEC: Seconds that the first `init()` spent importing `bpy_jupyter.utils.ipykernel`.
+		Close to `0` when the kernel was pre-warmed.
+	PORT_LABELS: Labels of the kernel's sockets, in the order of `KernelSnapshot.ports`.
+	SECURITY_LABELS: Labels of the kernel's security settings, in the order of `KernelSnapshot.security`.
+	SNAPSHOTS: Most recently published state of each initialized kernel, by name.
+		_Replaced as a whole on each publish, so that readers always see a consistent mapping._
 """
 
+import dataclasses
+import functools
+import re
+import sys
+import textwrap
+import time
+import typing as typ
 from pathlib import Path
 
-from ..utils.ipykernel import IPyKernel
+from . import kernel_registry
+
+if typ.TYPE_CHECKING:
+	from ..utils.ipykernel import IPyKernel
+	from ..utils.output_policy import OutputPolicy
 
 ####################
 # - Globals
 ####################
-IPYKERNEL: IPyKernel | None = None
+DEFAULT_KERNEL_NAME: str = 'default'
+KERNELS: 'dict[str, IPyKernel]' = {}
+IPYKERNEL: 'IPyKernel | None' = None
+IMPORT_SEC: float | None = None
+
+_KERNEL_NAME_PATTERN = re.compile(r'[A-Za-z0-9_-]+')
+
+PORT_LABELS: tuple[str, ...] = ('Shell', 'IOPub', 'Stdin', 'Control', 'Heartbeat')
+SECURITY_LABELS: tuple[str, ...] = ('Key', 'Protocol', 'Sig. Algo')
+
+
+####################
+# - Snapshots
+####################
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class KernelSnapshot:
+	"""Immutable, precomputed state of a kernel, as needed to draw it.
+
+	Notes:
+		Snapshots of kernels that aren't running hold empty strings, so that the UI can keep its layout.
+
+	Attributes:
+		name: Name of the kernel.
+		is_running: Whether the kernel is running.
+		path_connection_file: Path to the kernel's connection file.
+		path_connection_dir: Path to the directory containing the connection file.
+		json_str: Contents of the connection file, without the key.
+		json_str_with_key: Contents of the connection file, including the key.
+		ip: IP address (or `ipc` path prefix) that the kernel binds to.
+		ports: Port of each socket, in the order of `PORT_LABELS`.
+		security: Shown and copied value of each security setting, in the order of `SECURITY_LABELS`.
+			_The key is shown masked, yet copied in full._
+	"""
+
+	name: str
+	is_running: bool = False
+	path_connection_file: str = ''
+	path_connection_dir: str = ''
+	json_str: str = ''
+	json_str_with_key: str = ''
+	ip: str = ''
+	ports: tuple[str, ...] = len(PORT_LABELS) * ('',)
+	security: tuple[tuple[str, str], ...] = len(SECURITY_LABELS) * (('', ''),)
+
+	_wrapped: dict[tuple[str, int], tuple[str, ...]] = dataclasses.field(
+		default_factory=dict, init=False, repr=False, compare=False
+	)
+
+	def wrapped(
+		self, attr: typ.Literal['path_connection_file', 'json_str'], width: int
+	) -> tuple[str, ...]:
+		"""Lines of a string attribute, wrapped to `width` characters.
+
+		Notes:
+			Lines are only wrapped once for each width, and then reused for as long as this snapshot is current.
+		"""
+		lines = self._wrapped.get((attr, width))
+		if lines is None:
+			lines = self._wrapped[attr, width] = tuple(
+				textwrap.wrap(getattr(self, attr), width=width)
+			)
+		return lines
+
+
+SNAPSHOTS: dict[str, KernelSnapshot] = {}
+
+
+@functools.cache
+def _inactive_snapshot(name: str) -> KernelSnapshot:
+	"""Snapshot of a kernel that isn't running."""
+	return KernelSnapshot(name=name)
+
+
+def _take_snapshot(name: str, kernel: 'IPyKernel') -> KernelSnapshot:
+	"""Precompute the state of a kernel."""
+	if not kernel.is_running:
+		return _inactive_snapshot(name)
+
+	info = kernel.connection_info
+	return KernelSnapshot(
+		name=name,
+		is_running=True,
+		path_connection_file=str(kernel.path_connection_file),
+		path_connection_dir=str(kernel.path_connection_file.parent),
+		json_str=info.json_str,
+		json_str_with_key=info.json_str_with_key,
+		ip=str(info.ip),
+		ports=tuple(
+			str(port)
+			for port in (
+				info.shell_port,
+				info.iopub_port,
+				info.stdin_port,
+				info.control_port,
+				info.hb_port,
+			)
+		),
+		security=(
+			(str(info.key), info.key.get_secret_value()),
+			(info.transport, info.transport),
+			(info.signature_scheme, info.signature_scheme),
+		),
+	)
+
+
+def publish_snapshot(name: str) -> None:
+	"""Publish a new snapshot of the named kernel's state, redrawing the UI if it changed.
+
+	Notes:
+		Called by each kernel after every lifecycle operation, through `IPyKernel.on_lifecycle`.
+	"""
+	global SNAPSHOTS  # noqa: PLW0603
+
+	kernel = KERNELS.get(name)
+	new_snapshot = (
+		_inactive_snapshot(name) if kernel is None else _take_snapshot(name, kernel)
+	)
+	if SNAPSHOTS.get(name) == new_snapshot:
+		return
+
+	SNAPSHOTS = {**SNAPSHOTS, name: new_snapshot}  # pyright: ignore[reportConstantRedefinition]
+	kernel_registry.publish(new_snapshot)
+	_tag_redraw()
+
+
+def snapshot(name: str = DEFAULT_KERNEL_NAME) -> KernelSnapshot:
+	"""Most recently published state of the named kernel, without waiting for any lock."""
+	return SNAPSHOTS.get(name) or _inactive_snapshot(name)
+
+
+def _tag_redraw() -> None:
+	"""Redraw all regions of the `PROPERTIES` editor, where the kernel panel is shown."""
+	import bpy
+
+	window_manager = bpy.context.window_manager
+	if window_manager is None:
+		return
+
+	for window in window_manager.windows:
+		for area in window.screen.areas:
+			if area.type == 'PROPERTIES':
+				area.tag_redraw()
 
 
 ####################
 # - Lifecycle
 ####################
-def init(*, path_connection_file: Path) -> None:
-	"""Initialize the IPyKernel using the given connection file path.
+def init(
+	*,
+	path_connection_file: Path,
+	name: str = DEFAULT_KERNEL_NAME,
+	transport: typ.Literal['tcp', 'ipc'] = 'tcp',
+	output_policy: 'OutputPolicy | None' = None,
+	path_registry: Path | None = None,
+	stable_connection_file: Path | None = None,
+) -> None:
+	"""Initialize the named IPyKernel using the given connection file path.
 
 	Notes:
 		This is merely a setup function.
 
-		The kernel is not actually started until `IPYKERNEL.start()` is called.
+		The kernel is not actually started until `KERNELS[name].start()` is called.
+
+		Only the first of several running kernels forwards output written directly to the `stdout`/`stderr` file descriptors.
 
 	Parameters:
 		path_connection_file: Path to the kernel connection file.
+		name: Name of the kernel.
+			Must only contain letters, digits, `_` and `-`.
+		transport: How clients connect to the kernel.
+			See `bpy_jupyter.utils.ipykernel.IPyKernel.transport`.
+		output_policy: How output of cells is coalesced and limited.
+			_When `None`, the defaults of `OutputPolicy` are used._
+		path_registry: Path to the registry of kernels of all processes on this host, in which to register the kernel while it runs.
+			_When `None`, the kernel isn't registered._
+		stable_connection_file: Where to keep the kernel's ports and key, so that each start reuses them.
+			See `bpy_jupyter.utils.ipykernel.IPyKernel.stable_connection_file`.
+
+	Raises:
+		ValueError: If the name is invalid, or a kernel with that name is running.
 	"""
-	global IPYKERNEL  # noqa: PLW0603
+	global IPYKERNEL, IMPORT_SEC  # noqa: PLW0603
 
-	if IPYKERNEL is None or not IPYKERNEL.is_running:
-		IPYKERNEL = IPyKernel(path_connection_file=path_connection_file)  # pyright: ignore[reportConstantRedefinition]
+	if _KERNEL_NAME_PATTERN.fullmatch(name) is None:
+		msg = f"Can't initialize kernel {name!r}, since its name may only contain letters, digits, '_' and '-'."
+		raise ValueError(msg)
+
+	# Deferred Import: ipykernel, zmq, pydantic
+	time_start = time.perf_counter()
+	from ..utils.ipykernel import IPyKernel
 
-	elif IPYKERNEL.is_running:
-		msg = "Can't re-initialize `IPYKERNEL`, since it is running."
+	if IMPORT_SEC is None:
+		IMPORT_SEC = time.perf_counter() - time_start  # pyright: ignore[reportConstantRedefinition]
+
+	if is_kernel_running(name):
+		msg = f"Can't re-initialize kernel {name!r}, since it is running."
 		raise ValueError(msg)
 
+	KERNELS[name] = IPyKernel(
+		path_connection_file=path_connection_file,
+		transport=transport,
+		on_lifecycle=functools.partial(publish_snapshot, name),
+		stable_connection_file=stable_connection_file,
+		**({'output_policy': output_policy} if output_policy is not None else {}),
+	)
+	if name == DEFAULT_KERNEL_NAME:
+		IPYKERNEL = KERNELS[name]  # pyright: ignore[reportConstantRedefinition]
+	if path_registry is not None:
+		kernel_registry.track(name, path_registry)
+	publish_snapshot(name)
+
 
 ####################
 # - Information
 ####################
-def is_kernel_running() -> bool:
-	"""Whether the kernel is both initialized and running.
+def is_kernel_running(name: str = DEFAULT_KERNEL_NAME) -> bool:
+	"""Whether the named kernel is both initialized and running.
 
 	Notes:
-		Use this to check the kernel state from `poll()` methods, since it also takes the uninitialized `IPYKERNEL is None` state into account.
+		Use this to check the kernel state from `poll()` methods, since it also takes the uninitialized state into account.
+		Reads the kernel's published snapshot, so it never waits for the kernel's lock.
+
+	Parameters:
+		name: Name of the kernel.
 
 	Returns:
-		Whether the underlying `IPYKERNEL` is both initialized (aka. not `None`), and running (aka. `IPYKERNEL.is_running`).
+		Whether the named kernel is both initialized (aka. in `KERNELS`), and running (aka. `.is_running`).
+	"""
+	return snapshot(name).is_running
+
+
+def has_ipc() -> bool:
+	"""Whether kernels can use `ipc` transport on this platform.
+
+	Notes:
+		Once `zmq` is imported (ex. by pre-warming), it decides with `zmq.has('ipc')`.
+		Before then, `ipc` is presumed available everywhere but on Windows, so that drawing the UI never imports `zmq`.
+		_Either way, `IPyKernel.start()` refuses `ipc` transport where `zmq` doesn't support it._
+	"""
+	zmq = sys.modules.get('zmq')
+	if zmq is not None:
+		return zmq.has('ipc')
+	return sys.platform != 'win32'
+
+
+def running_kernels() -> 'dict[str, IPyKernel]':
+	"""All kernels that are currently running, by name."""
+	return {name: kernel for name, kernel in KERNELS.items() if kernel.is_running}
+
+
+def stable_connection_file_name(name: str = DEFAULT_KERNEL_NAME) -> str:
+	"""Conventional file name of the file that keeps the ports and key of the named kernel, across starts.
+
+	Notes:
+		Unlike connection files, this file isn't specific to a Blender process, so that restarting Blender also reuses them.
+		While a Blender process that saved it is alive, other Blender processes neither reuse nor overwrite it, and use new ports and keys instead.
+	"""
+	return f'stable-{connection_file_name(name)}'
+
+
+def connection_file_name(name: str = DEFAULT_KERNEL_NAME) -> str:
+	"""Conventional file name of the connection file of the named kernel.
+
+	Notes:
+		The default kernel keeps the historical `connection.json`.
+		Since several Blender processes may run the same kernel, put it in the process's own directory, ex. with `kernel_registry.path_process_dir()`.
 	"""
-	return IPYKERNEL is not None and IPYKERNEL.is_running
+	if name == DEFAULT_KERNEL_NAME:
+		return 'connection.json'
+	return f'connection-{name}.json'
@@ -0,0 +1,186 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Pre-warms the embedded Jupyter kernel, by importing its heavy dependencies in a background thread.
+
+Notes:
+	Starting the first kernel of a Blender session is dominated by imports.
+	`ipykernel`, `IPython`, `zmq` and `pydantic` are imported by `bpy_jupyter.utils.ipykernel`, and `debugpy` while the kernel application initializes.
+	Together, these take several hundred milliseconds, during which Blender is frozen.
+
+	None of these imports touch `bpy`, and importing is thread-safe.
+	Thus, they can be done in a background thread, well before the user starts a kernel.
+	Afterwards, starting a kernel only constructs the kernel application, binds its sockets and writes its connection file.
+
+	Pre-warming is optional, since it costs memory in sessions that never start a kernel.
+	It's enabled by the `use_kernel_prewarm` addon preference.
+	When enabled, `schedule()` pre-warms shortly after registration, once Blender has finished starting up.
+
+Attributes:
+	PREWARM_MODULES: Modules imported by the pre-warming thread, in order.
+		Relative names are resolved against `bpy_jupyter.services`.
+	PREWARM_DELAY_SEC: Delay between `schedule()` and the start of pre-warming.
+"""
+
+import dataclasses
+import importlib
+import threading
+import time
+import typing as typ
+
+import bpy
+
+from ..types import EXT_PACKAGE
+
+PREWARM_MODULES: tuple[str, ...] = (
+	'..utils.ipykernel',
+	'ipykernel.debugger',
+	'IPython.core.completerlib',
+)
+PREWARM_DELAY_SEC: float = 2.0
+
+
+####################
+# - Types
+####################
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class PrewarmState:
+	"""Progress of pre-warming the embedded Jupyter kernel.
+
+	Attributes:
+		status: Whether pre-warming hasn't started, is running, has finished or has failed.
+		import_sec: Seconds taken by the pre-warming thread, once it has finished.
+		error: Why pre-warming failed, if it did.
+	"""
+
+	status: typ.Literal['idle', 'running', 'done', 'failed'] = 'idle'
+	import_sec: float | None = None
+	error: str | None = None
+
+
+####################
+# - Globals
+####################
+_LOCK = threading.Lock()
+_THREAD: threading.Thread | None = None
+_STATE = PrewarmState()
+
+
+####################
+# - Pre-Warming Thread
+####################
+def _prewarm() -> None:
+	"""Import all `PREWARM_MODULES`, recording how long it took.
+
+	Notes:
+		Runs in the pre-warming thread.
+	"""
+	global _STATE  # noqa: PLW0603
+
+	time_start = time.perf_counter()
+	try:
+		for module_name in PREWARM_MODULES:
+			_ = importlib.import_module(module_name, package=__package__)
+	except Exception as ex:
+		## The same import will fail again, and be reported, when a kernel is started.
+		state = PrewarmState(status='failed', error=repr(ex))
+	else:
+		state = PrewarmState(status='done', import_sec=time.perf_counter() - time_start)
+
+	with _LOCK:
+		_STATE = state
+
+
+def _on_schedule() -> None:
+	"""Start pre-warming, if the addon preferences allow it.
+
+	Notes:
+		Run by `bpy.app.timers`, once.
+		Addon preferences are read here, since they're not reliably available during registration.
+	"""
+	addon = bpy.context.preferences.addons.get(EXT_PACKAGE)
+	if addon is not None and getattr(addon.preferences, 'use_kernel_prewarm', False):
+		start()
+
+
+####################
+# - Actions
+####################
+def start() -> None:
+	"""Start pre-warming in a background thread.
+
+	Notes:
+		Does nothing if pre-warming has already been started.
+	"""
+	global _THREAD, _STATE  # noqa: PLW0603
+
+	with _LOCK:
+		if _THREAD is None:
+			_STATE = PrewarmState(status='running')
+			_THREAD = threading.Thread(
+				target=_prewarm, name='bpy_jupyter-prewarm', daemon=True
+			)
+			_THREAD.start()
+
+
+def wait(timeout_sec: float | None = None) -> bool:
+	"""Block until pre-warming is no longer running.
+
+	Notes:
+		Starting a kernel while pre-warming is running would wait on the same imports anyway.
+		Waiting explicitly simply makes this obvious.
+
+	Parameters:
+		timeout_sec: Maximum number of seconds to wait.
+			When `None`, wait indefinitely.
+
+	Returns:
+		Whether pre-warming is no longer running.
+	"""
+	if _THREAD is not None:
+		_THREAD.join(timeout_sec)
+		return not _THREAD.is_alive()
+	return True
+
+
+def schedule(*, delay_sec: float = PREWARM_DELAY_SEC) -> None:
+	"""Start pre-warming after a delay, if enabled in the addon preferences.
+
+	Parameters:
+		delay_sec: Seconds to wait before deciding whether to start.
+	"""
+	if not bpy.app.timers.is_registered(_on_schedule):
+		bpy.app.timers.register(_on_schedule, first_interval=delay_sec)
+
+
+def cancel() -> None:
+	"""Cancel a pre-warm scheduled by `schedule()`.
+
+	Notes:
+		An already running pre-warming thread can't be cancelled.
+		Since it's a daemon thread, it never keeps Blender from exiting.
+	"""
+	if bpy.app.timers.is_registered(_on_schedule):
+		bpy.app.timers.unregister(_on_schedule)
+
+
+####################
+# - Queries
+####################
+def state() -> PrewarmState:
+	"""Progress of pre-warming the embedded Jupyter kernel."""
+	with _LOCK:
+		return _STATE
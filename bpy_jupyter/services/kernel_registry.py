@@ -0,0 +1,216 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Registers the running kernels of this Blender process, in the registry shared by all Blender processes of the host.
+
+## Motivation
+Several Blender processes of one user share the same extension user directory.
+So, each process writes its connection files to its own directory, and announces its kernels in a shared `registry.json`:
+
+```
+.jupyter-connections/
+├── registry.json
+├── 1234/connection.json
+└── 5678/connection.json
+```
+
+Clients find the kernel they want by reading only `registry.json`, ex. with the standalone `bpy_jupyter_registry` module.
+
+## Liveness
+While kernels of this process are running, `refresh()` rewrites their entries every `HEARTBEAT_SEC`.
+This is scheduled on the `asyncio` event loop, so that it works both in Blender's UI and in `bpy_jupyter.headless`.
+This also keeps the entries' `.blend` path current, once the file is saved under a new name.
+
+Entries of crashed processes are pruned by the next update of any process, together with their connection files.
+
+Notes:
+	The registry only helps clients discover kernels.
+	So, failing to update it (ex. on a read-only file system) never prevents a kernel from starting or stopping.
+
+Attributes:
+	REGISTRY_FILE_NAME: Name of the registry file, within the directory of all connection files.
+	HEARTBEAT_SEC: Seconds between refreshes of this process's entries.
+		_Entries that missed three refreshes are stale, by `bpy_jupyter_registry.STALE_SEC`._
+	_PATHS: Path to the registry that each tracked kernel is registered in, by kernel name.
+	_ENTRIES: Current entries of this process's running kernels, by kernel name.
+	_HEARTBEAT: The scheduled next refresh, while any kernel is running.
+"""
+
+import contextlib
+import dataclasses
+import json
+import os
+import time
+import typing as typ
+from pathlib import Path
+
+from ..standalone import import_standalone
+
+if typ.TYPE_CHECKING:
+	import asyncio
+
+	from bpy_jupyter_registry import RegistryEntry
+
+	from .jupyter_kernel import KernelSnapshot
+
+####################
+# - Globals
+####################
+REGISTRY_FILE_NAME: str = 'registry.json'
+HEARTBEAT_SEC: float = 10.0
+
+_PATHS: dict[str, Path] = {}
+_ENTRIES: 'dict[str, RegistryEntry]' = {}
+_HEARTBEAT: 'asyncio.TimerHandle | None' = None
+
+
+####################
+# - Paths
+####################
+def path_process_dir(path_connections: Path) -> Path:
+	"""Directory of this process's connection files, within the directory of all connection files."""
+	return path_connections / str(os.getpid())
+
+
+def path_registry(path_connections: Path) -> Path:
+	"""Path to the registry, within the directory of all connection files."""
+	return path_connections / REGISTRY_FILE_NAME
+
+
+####################
+# - Registration
+####################
+def track(name: str, path: Path) -> None:
+	"""Register the named kernel in the registry at `path`, whenever it runs.
+
+	Notes:
+		Call before the kernel is first started.
+		From then on, `publish()` adds or removes its entry with each snapshot of its state.
+	"""
+	_PATHS[name] = path
+
+
+def publish(snapshot: 'KernelSnapshot') -> None:
+	"""Add the entry of a tracked kernel when it runs, or remove it when it stops.
+
+	Notes:
+		Called by `bpy_jupyter.services.jupyter_kernel.publish_snapshot()`, whenever a kernel's snapshot changes.
+	"""
+	global _HEARTBEAT  # noqa: PLW0603
+
+	path = _PATHS.get(snapshot.name)
+	if path is None:
+		return
+
+	registry = import_standalone('bpy_jupyter_registry')
+	if not snapshot.is_running:
+		entry = _ENTRIES.pop(snapshot.name, None)
+		if entry is not None:
+			_update(path, remove=[entry.key])
+			if not _ENTRIES and _HEARTBEAT is not None:
+				_HEARTBEAT.cancel()
+				_HEARTBEAT = None
+
+			## The kernel already deleted its connection file.
+			with contextlib.suppress(OSError):
+				Path(entry.connection_file).parent.rmdir()
+		return
+
+	info = json.loads(snapshot.json_str)
+	previous = _ENTRIES.get(snapshot.name)
+	now = time.time()
+	entry = registry.RegistryEntry(
+		pid=os.getpid(),
+		kernel_name=snapshot.name,
+		blend_path=_blend_path(),
+		start_time=previous.start_time if previous is not None else now,
+		heartbeat=now,
+		connection_file=snapshot.path_connection_file,
+		transport=info['transport'],
+		ip=info['ip'],
+		ports={key: value for key, value in info.items() if key.endswith('_port')},
+	)
+	_ENTRIES[snapshot.name] = entry
+	_update(path, put=[entry])
+	_schedule_heartbeat()
+
+
+def refresh() -> None:
+	"""Rewrite the entries of this process's running kernels, with a new heartbeat and `.blend` path."""
+	now = time.time()
+	blend_path = _blend_path()
+	for name, entry in list(_ENTRIES.items()):
+		_ENTRIES[name] = dataclasses.replace(
+			entry, heartbeat=now, blend_path=blend_path
+		)
+
+	for path in {_PATHS[name] for name in _ENTRIES}:
+		_update(
+			path,
+			put=[entry for name, entry in _ENTRIES.items() if _PATHS[name] == path],
+		)
+
+
+def entries(name: str) -> 'dict[str, RegistryEntry]':
+	"""All running kernels of the host, from the registry that the named kernel is tracked in.
+
+	Returns:
+		Entries that aren't stale, by key; empty when the kernel isn't tracked.
+	"""
+	path = _PATHS.get(name)
+	if path is None:
+		return {}
+	return import_standalone('bpy_jupyter_registry').read(path)
+
+
+####################
+# - Internal
+####################
+def _blend_path() -> str:
+	"""Path of the loaded `.blend` file, or an empty string if it was never saved."""
+	import bpy
+
+	return bpy.data.filepath
+
+
+def _update(path: Path, **changes: typ.Any) -> None:
+	"""Update the registry, without ever raising on a failure to write it."""
+	registry = import_standalone('bpy_jupyter_registry')
+
+	## Discovery is best-effort; kernels must start and stop regardless.
+	with contextlib.suppress(OSError):
+		_ = registry.update(path, **changes)
+
+
+def _heartbeat() -> None:
+	"""Refresh the entries, then schedule the next refresh while any kernel is running."""
+	global _HEARTBEAT  # noqa: PLW0603
+
+	_HEARTBEAT = None
+	if _ENTRIES:
+		refresh()
+		_schedule_heartbeat()
+
+
+def _schedule_heartbeat() -> None:
+	"""Refresh the entries in `HEARTBEAT_SEC`, unless that's already scheduled."""
+	global _HEARTBEAT  # noqa: PLW0603
+
+	# Deferred Import: asyncio
+	import asyncio
+
+	if _HEARTBEAT is None:
+		_HEARTBEAT = asyncio.get_event_loop().call_later(HEARTBEAT_SEC, _heartbeat)
@@ -0,0 +1,279 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Lets any thread run callables on Blender's main thread, using the `asyncio` event loop managed by `bpy_jupyter.services.async_event_loop`.
+
+## Motivation
+Blender's Python API is not thread safe: Touching `bpy` from ex. a worker thread, `ipykernel`'s iopub/heartbeat threads, or a thread spawned by the user, may crash Blender.
+Such threads instead need some way to ask the main thread to do the work for them.
+
+## Mechanism
+`submit()` puts a callable on a thread-safe queue, and returns a `concurrent.futures.Future` that resolves once the callable has run.
+
+Submissions are coalesced: Only the first submission into an empty queue schedules a batch on the event loop, using `loop.call_soon_threadsafe()`.
+When the event loop is next incremented, the batch runs queued callables on the main thread, until either the queue is empty or `BATCH_BUDGET_SEC` has been spent.
+Whatever remains is left for another batch, which is scheduled to run on a later iteration, so that Blender's UI is given a chance to respond in between.
+
+Notes:
+	**Requires** `bpy_jupyter.services.async_event_loop` to have been started at least once.
+
+	Callables submitted while the event loop isn't being incremented will wait until it is.
+
+Attributes:
+	BATCH_BUDGET_SEC: Seconds that each batch may spend running queued callables.
+	METRICS_WINDOW: Number of most recent submissions (and batches) whose measurements are retained.
+	_QUEUE: Submissions waiting to run on the main thread.
+	_LOCK: Guards `_BATCH_SCHEDULED`, as well as the submission counter.
+	_BATCH_SCHEDULED: Whether a batch has been scheduled on the event loop, but hasn't yet started.
+	_SAMPLES: Ring buffers of per-submission and per-batch measurements.
+"""
+
+import asyncio
+import collections
+import collections.abc as cabc
+import concurrent.futures
+import dataclasses
+import threading
+import time
+import typing as typ
+
+from ..utils.stats import SeriesSummary
+from . import async_event_loop
+
+####################
+# - Constants
+####################
+BATCH_BUDGET_SEC = 0.004
+METRICS_WINDOW = 1024
+
+
+####################
+# - Types
+####################
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class _Submission:
+	"""A callable waiting to run on the main thread, together with the future that should receive its result."""
+
+	func: cabc.Callable[..., typ.Any]
+	args: tuple[typ.Any, ...]
+	kwargs: dict[str, typ.Any]
+	future: concurrent.futures.Future[typ.Any]
+	time_submitted: float
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class DispatchMetrics:
+	"""Summarized measurements of the most recent submissions and batches.
+
+	Attributes:
+		queue_depth: Number of submissions currently waiting to run.
+		submitted: Total number of submissions so far.
+		completed: Total number of submissions that have run (or were cancelled before running).
+		wait_sec: Time between submission and the start of running, for each submission.
+		run_sec: Time spent running, for each submission.
+		batch_size: Number of submissions run by each batch.
+	"""
+
+	queue_depth: int
+	submitted: int
+	completed: int
+	wait_sec: SeriesSummary
+	run_sec: SeriesSummary
+	batch_size: SeriesSummary
+
+
+@dataclasses.dataclass(kw_only=True, slots=True)
+class _DispatchSamples:
+	"""Counters and ring buffers of per-submission and per-batch measurements."""
+
+	submitted: int = 0
+	completed: int = 0
+	wait_sec: collections.deque[float] = dataclasses.field(
+		default_factory=lambda: collections.deque(maxlen=METRICS_WINDOW)
+	)
+	run_sec: collections.deque[float] = dataclasses.field(
+		default_factory=lambda: collections.deque(maxlen=METRICS_WINDOW)
+	)
+	batch_size: collections.deque[int] = dataclasses.field(
+		default_factory=lambda: collections.deque(maxlen=METRICS_WINDOW)
+	)
+
+
+####################
+# - Globals
+####################
+_QUEUE: collections.deque[_Submission] = collections.deque()
+_LOCK: threading.Lock = threading.Lock()
+_BATCH_SCHEDULED: bool = False
+_SAMPLES: _DispatchSamples = _DispatchSamples()
+
+
+####################
+# - Batch Execution
+####################
+def _run_batch() -> None:
+	"""Run queued submissions on the main thread, until the queue is empty or `BATCH_BUDGET_SEC` has been spent.
+
+	Notes:
+		Always called from the `asyncio` event loop, and therefore always in the main thread.
+
+		If submissions remain after the budget is spent, another batch is scheduled with `loop.call_soon()`.
+	"""
+	global _BATCH_SCHEDULED  # noqa: PLW0603
+
+	with _LOCK:
+		_BATCH_SCHEDULED = False
+
+	time_start = time.perf_counter()
+	deadline = time_start + BATCH_BUDGET_SEC
+	batch_size = 0
+	while _QUEUE:
+		submission = _QUEUE.popleft()
+		batch_size += 1
+		_SAMPLES.completed += 1
+
+		# Respect Cancellation
+		if not submission.future.set_running_or_notify_cancel():
+			continue
+
+		# Run Submission
+		time_run_start = time.perf_counter()
+		try:
+			result = submission.func(*submission.args, **submission.kwargs)
+		except BaseException as ex:
+			submission.future.set_exception(ex)
+		else:
+			submission.future.set_result(result)
+		time_run_end = time.perf_counter()
+
+		_SAMPLES.wait_sec.append(time_run_start - submission.time_submitted)
+		_SAMPLES.run_sec.append(time_run_end - time_run_start)
+
+		if time_run_end >= deadline:
+			break
+
+	_SAMPLES.batch_size.append(batch_size)
+
+	# Leave Remaining Submissions to a Later Batch
+	if _QUEUE:
+		_schedule_batch(threadsafe=False)
+
+
+def _event_loop() -> asyncio.AbstractEventLoop:
+	"""The event loop that runs batches.
+
+	Raises:
+		RuntimeError: If the event loop has never been started by `async_event_loop.start()`.
+	"""
+	loop = async_event_loop.EVENT_LOOP
+	if loop is None:
+		msg = "Can't dispatch to the main thread, since `async_event_loop` was never started."
+		raise RuntimeError(msg)
+	return loop
+
+
+def _schedule_batch(*, threadsafe: bool) -> None:
+	"""Schedule `_run_batch()` on the event loop, unless a batch is already scheduled.
+
+	Parameters:
+		threadsafe: Whether to use `loop.call_soon_threadsafe()`, which is required when not on the main thread.
+
+	Raises:
+		RuntimeError: If the event loop has never been started by `async_event_loop.start()`.
+	"""
+	global _BATCH_SCHEDULED  # noqa: PLW0603
+
+	loop = _event_loop()
+	with _LOCK:
+		if _BATCH_SCHEDULED:
+			return
+		_BATCH_SCHEDULED = True
+
+	if threadsafe:
+		_ = loop.call_soon_threadsafe(_run_batch)
+	else:
+		_ = loop.call_soon(_run_batch)
+
+
+####################
+# - Submission
+####################
+def submit(
+	func: cabc.Callable[..., typ.Any], /, *args: typ.Any, **kwargs: typ.Any
+) -> concurrent.futures.Future[typ.Any]:
+	"""Run `func(*args, **kwargs)` on Blender's main thread, as soon as possible.
+
+	Notes:
+		Safe to call from any thread, including the main thread.
+
+		**Never** block the main thread on the returned future (ex. with `.result()`), since the main thread is what must run `func`.
+		From `async` code running on the event loop, use `await asyncio.wrap_future(future)` instead.
+
+	Parameters:
+		func: The callable to run on the main thread.
+		args: Positional arguments to pass to `func`.
+		kwargs: Keyword arguments to pass to `func`.
+
+	Returns:
+		A future that resolves to the return value of `func`, or to the exception that it raised.
+
+	Raises:
+		RuntimeError: If the event loop has never been started by `async_event_loop.start()`.
+	"""
+	## Checked before queueing, so that a failed submission never runs in a later batch.
+	_ = _event_loop()
+
+	future: concurrent.futures.Future[typ.Any] = concurrent.futures.Future()
+	_QUEUE.append(
+		_Submission(
+			func=func,
+			args=args,
+			kwargs=kwargs,
+			future=future,
+			time_submitted=time.perf_counter(),
+		)
+	)
+	with _LOCK:
+		_SAMPLES.submitted += 1
+
+	_schedule_batch(threadsafe=True)
+	return future
+
+
+####################
+# - Metrics
+####################
+def metrics() -> DispatchMetrics:
+	"""Summarize the measurements of the most recent `METRICS_WINDOW` submissions and batches.
+
+	Returns:
+		Current queue depth, counters, as well as summaries of wait time, run time and batch size.
+	"""
+	return DispatchMetrics(
+		queue_depth=len(_QUEUE),
+		submitted=_SAMPLES.submitted,
+		completed=_SAMPLES.completed,
+		wait_sec=SeriesSummary.from_samples(tuple(_SAMPLES.wait_sec)),
+		run_sec=SeriesSummary.from_samples(tuple(_SAMPLES.run_sec)),
+		batch_size=SeriesSummary.from_samples(tuple(_SAMPLES.batch_size)),
+	)
+
+
+def reset_metrics() -> None:
+	"""Discard all measurements recorded so far."""
+	global _SAMPLES  # noqa: PLW0603
+
+	_SAMPLES = _DispatchSamples()
@@ -0,0 +1,294 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Manages a pool of worker processes, which lets notebook cells `await` CPU-heavy work without freezing Blender's UI.
+
+## Motivation
+As `bpy_jupyter.services.async_event_loop` is quick to point out, concurrency is not parallelism.
+CPU-heavy pure-Python or `numpy` code blocks Blender's main thread, no matter how many `await`s surround it.
+
+This service runs such code in separate processes instead, while the main thread only `await`s the result:
+
+```python
+result = await process_pool.run(expensive_function, argument)
+```
+
+## Shared Memory
+Large arrays shouldn't be pickled to reach a worker.
+Instead, allocate a `SharedArray` with `allocate_shared()`, fill it in place (ex. `mesh.vertices.foreach_get('co', shared.array.ravel())`), and pass only `shared.spec` to the worker.
+The worker then uses `with spec.attach() as array: ...` to see the very same memory.
+
+Shared arrays allocated through this service are destroyed by `stop()`, unless released earlier with `release_shared()`.
+
+Notes:
+	Workers are started with the `spawn` method, since forking Blender's multi-threaded process is unsafe.
+	Functions sent to workers must therefore be importable by name, ex. from `numpy` or from a module on `sys.path`.
+	**Functions defined in a notebook cell can't be sent to workers.**
+
+Attributes:
+	METRICS_WINDOW: Number of most recent tasks whose measurements are retained.
+	POOL: The running process pool, if any.
+	_SHARED_ARRAYS: Shared arrays allocated through this service, which haven't yet been released.
+	_SAMPLES: Counters and ring buffers of per-task measurements.
+"""
+
+import asyncio
+import collections
+import collections.abc as cabc
+import concurrent.futures
+import dataclasses
+import multiprocessing
+import os
+import time
+import typing as typ
+
+from ..standalone import import_standalone
+from ..utils.shared_arrays import SharedArray
+from ..utils.stats import SeriesSummary
+
+if typ.TYPE_CHECKING:
+	import numpy.typing as npt
+
+####################
+# - Constants
+####################
+METRICS_WINDOW = 1024
+
+
+####################
+# - Types
+####################
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class PoolMetrics:
+	"""Summarized measurements of the most recent tasks.
+
+	Attributes:
+		max_workers: Number of worker processes in the pool.
+			_`0` when the pool isn't running._
+		active_tasks: Number of tasks that have been submitted, but haven't yet finished.
+		submitted: Total number of tasks submitted since `start()`.
+		failed: Total number of tasks that raised an exception since `start()`.
+		wait_sec: Time between submission and the start of running in a worker, for each task.
+		run_sec: Time spent running in a worker, for each task.
+		utilization: Fraction of the pool's total worker time spent running tasks, since `start()`.
+		shared_bytes: Total size of all shared arrays that haven't yet been released.
+	"""
+
+	max_workers: int
+	active_tasks: int
+	submitted: int
+	failed: int
+	wait_sec: SeriesSummary
+	run_sec: SeriesSummary
+	utilization: float
+	shared_bytes: int
+
+
+@dataclasses.dataclass(kw_only=True, slots=True)
+class _PoolSamples:
+	"""Counters and ring buffers of per-task measurements."""
+
+	time_started: float = dataclasses.field(default_factory=time.time)
+	max_workers: int = 0
+	active_tasks: int = 0
+	submitted: int = 0
+	failed: int = 0
+	busy_sec: float = 0.0
+	wait_sec: collections.deque[float] = dataclasses.field(
+		default_factory=lambda: collections.deque(maxlen=METRICS_WINDOW)
+	)
+	run_sec: collections.deque[float] = dataclasses.field(
+		default_factory=lambda: collections.deque(maxlen=METRICS_WINDOW)
+	)
+
+
+####################
+# - Globals
+####################
+POOL: concurrent.futures.ProcessPoolExecutor | None = None
+_SHARED_ARRAYS: dict[str, SharedArray] = {}
+_SAMPLES: _PoolSamples = _PoolSamples()
+
+
+####################
+# - Lifecycle
+####################
+def start(*, max_workers: int | None = None) -> None:
+	"""Start the process pool.
+
+	Notes:
+		Worker processes are spawned by `concurrent.futures.ProcessPoolExecutor`, which may defer this until the first task is submitted.
+
+	Parameters:
+		max_workers: Number of worker processes.
+			_When `None`, one worker per CPU is used._
+
+	Raises:
+		ValueError: If the process pool is already running.
+	"""
+	global POOL, _SAMPLES  # noqa: PLW0603
+
+	if POOL is not None:
+		msg = "Can't start the process pool, since it is already running."
+		raise ValueError(msg)
+
+	## Like the default of 'ProcessPoolExecutor', but known without asking it.
+	if max_workers is None:
+		max_workers = os.cpu_count() or 1
+
+	POOL = concurrent.futures.ProcessPoolExecutor(  # pyright: ignore[reportConstantRedefinition]
+		max_workers=max_workers,
+		mp_context=multiprocessing.get_context('spawn'),
+	)
+	_SAMPLES = _PoolSamples(max_workers=max_workers)
+
+
+def stop() -> None:
+	"""Stop the process pool, and destroy all shared arrays allocated through this service.
+
+	Notes:
+		Tasks that haven't started are cancelled.
+		The main thread doesn't wait for running tasks to finish; their workers exit once they are done.
+
+	Raises:
+		ValueError: If the process pool is not running.
+	"""
+	global POOL  # noqa: PLW0603
+
+	if POOL is None:
+		msg = "Can't stop the process pool, since it is not running."
+		raise ValueError(msg)
+
+	POOL.shutdown(wait=False, cancel_futures=True)
+	POOL = None  # pyright: ignore[reportConstantRedefinition]
+
+	for shared in _SHARED_ARRAYS.values():
+		shared.unlink()
+	_SHARED_ARRAYS.clear()
+
+
+def is_running() -> bool:
+	"""Whether the process pool is running."""
+	return POOL is not None
+
+
+####################
+# - Tasks
+####################
+async def run(
+	func: cabc.Callable[..., typ.Any], /, *args: typ.Any, **kwargs: typ.Any
+) -> typ.Any:
+	"""Run `func(*args, **kwargs)` in a worker process, and `await` its result.
+
+	Notes:
+		`func`, `args`, `kwargs` and the return value are all pickled.
+		Pass large arrays as `SharedArraySpec`s, as explained in the module documentation.
+
+	Parameters:
+		func: The callable to run. Must be importable by name.
+		args: Positional arguments to pass to `func`.
+		kwargs: Keyword arguments to pass to `func`.
+
+	Returns:
+		The return value of `func`.
+
+	Raises:
+		ValueError: If the process pool is not running.
+	"""
+	if POOL is None:
+		msg = "Can't run a task in the process pool, since it is not running."
+		raise ValueError(msg)
+
+	worker = import_standalone('bpy_jupyter_worker')
+	samples = _SAMPLES
+
+	time_submitted = time.time()
+	samples.submitted += 1
+	samples.active_tasks += 1
+	try:
+		result, time_started, run_sec = await asyncio.wrap_future(
+			POOL.submit(worker.timed_call, func, args, kwargs)
+		)
+	except Exception:
+		samples.failed += 1
+		raise
+	finally:
+		samples.active_tasks -= 1
+
+	samples.busy_sec += run_sec
+	samples.wait_sec.append(max(time_started - time_submitted, 0.0))
+	samples.run_sec.append(run_sec)
+	return result
+
+
+####################
+# - Shared Arrays
+####################
+def allocate_shared(shape: cabc.Sequence[int], dtype: 'npt.DTypeLike') -> SharedArray:
+	"""Allocate a zero-initialized shared array, which is destroyed by `stop()` unless released earlier.
+
+	Parameters:
+		shape: Shape of the array.
+		dtype: Data type of the array.
+	"""
+	shared = SharedArray(shape, dtype)
+	_SHARED_ARRAYS[shared.spec.name] = shared
+	return shared
+
+
+def share_array(array: 'npt.ArrayLike') -> SharedArray:
+	"""Copy an array into a new shared array, which is destroyed by `stop()` unless released earlier.
+
+	Notes:
+		Prefer `allocate_shared()` followed by in-place filling, which avoids this copy.
+	"""
+	shared = SharedArray.from_array(array)
+	_SHARED_ARRAYS[shared.spec.name] = shared
+	return shared
+
+
+def release_shared(shared: SharedArray) -> None:
+	"""Destroy a shared array allocated through this service, before `stop()` would."""
+	_ = _SHARED_ARRAYS.pop(shared.spec.name, None)
+	shared.unlink()
+
+
+####################
+# - Metrics
+####################
+def metrics() -> PoolMetrics:
+	"""Summarize the measurements of the most recent `METRICS_WINDOW` tasks.
+
+	Returns:
+		Pool size, counters, utilization, as well as summaries of wait time and run time.
+	"""
+	max_workers = _SAMPLES.max_workers if POOL is not None else 0
+	elapsed_sec = time.time() - _SAMPLES.time_started
+
+	return PoolMetrics(
+		max_workers=max_workers,
+		active_tasks=_SAMPLES.active_tasks,
+		submitted=_SAMPLES.submitted,
+		failed=_SAMPLES.failed,
+		wait_sec=SeriesSummary.from_samples(_SAMPLES.wait_sec),
+		run_sec=SeriesSummary.from_samples(_SAMPLES.run_sec),
+		utilization=(
+			min(_SAMPLES.busy_sec / (max_workers * elapsed_sec), 1.0)
+			if max_workers > 0 and elapsed_sec > 0
+			else 0.0
+		),
+		shared_bytes=sum(shared.spec.nbytes for shared in _SHARED_ARRAYS.values()),
+	)
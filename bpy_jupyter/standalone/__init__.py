@@ -0,0 +1,59 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Modules that must also be importable outside of Blender, by their own top-level name.
+
+## Motivation
+The `bpy_jupyter` package itself can only be imported within Blender, since it imports `bpy` as soon as it is loaded.
+Some code must however run in processes without `bpy`, such as:
+
+- **Worker Processes**: Ex. those of `bpy_jupyter.services.process_pool`, which are plain Python interpreters.
+- **Notebook Clients**: Ex. scripts using `jupyter_client` to talk to the embedded kernel.
+
+Each module in this directory therefore only imports the standard library (and optionally `numpy`), and never uses relative imports.
+Outside of Blender, they can be used by putting this directory on `sys.path`, then importing them by name.
+
+Attributes:
+	PATH_STANDALONE: Path to this directory, which should be put on `sys.path` to import its modules by name.
+"""
+
+import importlib
+import sys
+import types
+from pathlib import Path
+
+PATH_STANDALONE: Path = Path(__file__).resolve().parent
+
+
+def import_standalone(module_name: str) -> types.ModuleType:
+	"""Import a standalone module by its own top-level name, exactly as a process without `bpy` would.
+
+	Notes:
+		Puts `PATH_STANDALONE` on `sys.path`, if it isn't already there.
+
+		Objects from modules imported in this way are pickled by reference to their top-level name.
+		This allows them to be unpickled in ex. `multiprocessing` workers, which inherit `sys.path` when spawned.
+
+	Parameters:
+		module_name: Name of the standalone module, ex. `bpy_jupyter_worker`.
+
+	Returns:
+		The imported module.
+	"""
+	if str(PATH_STANDALONE) not in sys.path:
+		sys.path.append(str(PATH_STANDALONE))
+
+	return importlib.import_module(module_name)
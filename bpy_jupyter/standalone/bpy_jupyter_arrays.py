@@ -0,0 +1,88 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Attaches to shared-memory arrays of `bpy_jupyter.utils.shared_arrays`, from any process on the same host.
+
+Examples:
+	In a worker of `bpy_jupyter.services.process_pool`, given the `spec` of a `SharedArray`:
+
+	```python
+	def mean_position(spec):
+		with spec.attach() as co:
+			return co.mean(axis=0)
+	```
+
+Notes:
+	This module is standalone: It must be importable as `bpy_jupyter_arrays`, by processes without `bpy`.
+
+	`SharedArraySpec` is pickled by reference to this module, so that worker processes can unpickle it.
+	_Pickled by reference to `bpy_jupyter.utils.shared_arrays`, unpickling would import `bpy_jupyter`, which imports `bpy`._
+"""
+
+import collections.abc as cabc
+import contextlib
+import dataclasses
+import math
+import typing as typ
+from multiprocessing import shared_memory
+
+if typ.TYPE_CHECKING:
+	import numpy.typing as npt
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class SharedArraySpec:
+	"""Everything needed to attach to an existing shared-memory array, from any process on the same host.
+
+	Attributes:
+		name: Name of the shared memory segment.
+		shape: Shape of the array.
+		dtype: `numpy` dtype string of the array, ex. `'<f4'`.
+	"""
+
+	name: str
+	shape: tuple[int, ...]
+	dtype: str
+
+	@property
+	def nbytes(self) -> int:
+		"""Number of bytes occupied by the array."""
+		import numpy as np
+
+		return math.prod(self.shape) * np.dtype(self.dtype).itemsize
+
+	@contextlib.contextmanager
+	def attach(self) -> cabc.Iterator['npt.NDArray[typ.Any]']:
+		"""Attach to the shared memory segment, yielding a `numpy` view of its array.
+
+		Notes:
+			The view **must not** be used after the `with` block ends, since the segment is then closed in this process.
+			Closing doesn't destroy the segment; only its owner may do that.
+		"""
+		import numpy as np
+
+		shm = shared_memory.SharedMemory(name=self.name)
+		try:
+			array: npt.NDArray[typ.Any] = np.ndarray(
+				self.shape, dtype=np.dtype(self.dtype), buffer=shm.buf
+			)
+			yield array
+			del array
+		finally:
+			# Views Escaping the 'with' Block Keep the Mapping Alive
+			## The mapping is then closed whenever they are garbage collected.
+			with contextlib.suppress(BufferError):
+				shm.close()
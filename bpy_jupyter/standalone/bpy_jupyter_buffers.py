@@ -0,0 +1,133 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Rebuilds `numpy` arrays sent by `bpy_jupyter.utils.binary_buffers`, in notebook clients.
+
+Examples:
+	With a `jupyter_client.BlockingKernelClient` connected to the embedded kernel:
+
+	```python
+	import bpy_jupyter_buffers
+
+	_ = client.execute_interactive(
+		'from bl_ext.user_default.bpy_jupyter.utils.binary_buffers import send_foreach'
+	)
+	arrays = bpy_jupyter_buffers.execute_arrays(
+		client, "send_foreach(bpy.data.meshes['Cube'].vertices, 'co', components=3)"
+	)
+	co = arrays['co']
+	```
+
+Notes:
+	This module is standalone: It must be importable as `bpy_jupyter_buffers`, by processes without `bpy`.
+
+	Arrays are views of the received message buffers, so they are never copied.
+	Since `jupyter_client` receives buffers as `bytes`, the arrays are read-only.
+
+Attributes:
+	BUFFER_MIMETYPE: Mimetype of the description of an array, whose data is in the message's `buffers`.
+"""
+
+import collections.abc as cabc
+import typing as typ
+
+if typ.TYPE_CHECKING:
+	import numpy.typing as npt
+
+BUFFER_MIMETYPE = 'application/vnd.bpy-jupyter.ndarray+json'
+
+
+def is_array_message(msg: cabc.Mapping[str, typ.Any]) -> bool:
+	"""Whether a message received on `iopub` carries an array.
+
+	Parameters:
+		msg: A deserialized Jupyter message.
+	"""
+	return (
+		msg.get('msg_type') == 'display_data'
+		and BUFFER_MIMETYPE in msg.get('content', {}).get('data', {})
+		and len(msg.get('buffers', [])) > 0
+	)
+
+
+def array_from_message(
+	msg: cabc.Mapping[str, typ.Any],
+) -> tuple[str, 'npt.NDArray[typ.Any]']:
+	"""Rebuild the array carried by a message, without copying it.
+
+	Parameters:
+		msg: A deserialized Jupyter message, for which `is_array_message()` is `True`.
+
+	Returns:
+		The name of the array, and the array itself.
+
+	Raises:
+		ValueError: If the message doesn't carry an array, or its buffer doesn't match its description.
+	"""
+	import numpy as np
+
+	if not is_array_message(msg):
+		msg_err = 'Message does not carry an array.'
+		raise ValueError(msg_err)
+
+	description = msg['content']['data'][BUFFER_MIMETYPE]
+	buffer = msg['buffers'][0]
+	if memoryview(buffer).nbytes != description['nbytes']:
+		msg_err = f'Buffer of array {description["name"]!r} has {memoryview(buffer).nbytes} bytes, but {description["nbytes"]} bytes were expected.'
+		raise ValueError(msg_err)
+
+	array = np.frombuffer(buffer, dtype=np.dtype(description['dtype'])).reshape(
+		description['shape']
+	)
+	return description['name'], array
+
+
+def execute_arrays(
+	client: typ.Any,
+	code: str,
+	*,
+	timeout: float | None = None,
+) -> dict[str, 'npt.NDArray[typ.Any]']:
+	"""Execute code in the kernel, collecting all arrays that it sends.
+
+	Notes:
+		Other output is discarded.
+
+	Parameters:
+		client: A connected `jupyter_client.BlockingKernelClient`.
+		code: Code to execute, which sends arrays, ex. with `send_foreach()`.
+		timeout: Seconds to wait for the code to finish.
+			_When `None`, wait indefinitely._
+
+	Returns:
+		The received arrays, by name.
+
+	Raises:
+		RuntimeError: If the code raised an exception.
+	"""
+	arrays: dict[str, npt.NDArray[typ.Any]] = {}
+
+	def output_hook(msg: dict[str, typ.Any]) -> None:
+		if is_array_message(msg):
+			name, array = array_from_message(msg)
+			arrays[name] = array
+
+	reply = client.execute_interactive(code, timeout=timeout, output_hook=output_hook)
+	if reply['content']['status'] != 'ok':
+		msg = f'Executing code failed: {reply["content"].get("ename")}: {reply["content"].get("evalue")}'
+		raise RuntimeError(msg)
+
+	return arrays
@@ -0,0 +1,382 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Reads and updates the registry of kernels running in all Blender processes of a host, without opening their connection files.
+
+Each Blender process writes its kernels' connection files to its own directory, ex. `.jupyter-connections/<pid>/connection.json`.
+Alongside, a single `registry.json` indexes every running kernel by `<pid>/<kernel name>`, with what's needed to pick one:
+
+- **Process**: PID, the loaded `.blend` file, and when the kernel started.
+- **Connection**: Path to the connection file, the transport, IP and ports.
+- **Liveness**: When the process last confirmed that the kernel is running.
+
+Examples:
+	In a notebook client, or any script:
+
+	```python
+	import bpy_jupyter_registry
+	import jupyter_client
+
+	entries = bpy_jupyter_registry.read(path_registry)
+	entry = next(e for e in entries.values() if e.blend_path.endswith('scene.blend'))
+
+	client = jupyter_client.BlockingKernelClient(connection_file=entry.connection_file)
+	client.load_connection_file()
+	```
+
+	From a shell, to list all running kernels:
+
+	```bash
+	python bpy_jupyter_registry.py path/to/.jupyter-connections/registry.json
+	```
+
+Notes:
+	This module is standalone: It must be importable as `bpy_jupyter_registry`, by processes without `bpy`.
+
+	Reads never take a lock, since updates replace the whole file atomically, by renaming a new file over it.
+	Updates take an exclusive lock on a `.lock` file next to the registry, so that concurrent processes never lose each other's entries.
+
+	Entries are stale when their process is no longer alive, or when they weren't refreshed for `STALE_SEC`.
+	`read()` skips stale entries, while `update()` prunes them from the file, together with the connection files of dead processes.
+
+Attributes:
+	REGISTRY_VERSION: Version of the registry's format, which is stored in the file.
+	STALE_SEC: Seconds after the last refresh of an entry, after which it's stale, even if its process is alive.
+		_Three missed refreshes, which Blender processes do every `bpy_jupyter.services.kernel_registry.HEARTBEAT_SEC`._
+		_Guards against reused PIDs, and against processes that hang; a process whose entry was pruned adds it again with its next refresh._
+"""
+
+import collections.abc as cabc
+import contextlib
+import dataclasses
+import json
+import os
+import sys
+import tempfile
+import time
+import typing as typ
+from pathlib import Path
+
+REGISTRY_VERSION = 1
+STALE_SEC = 30.0
+
+
+####################
+# - Entries
+####################
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class RegistryEntry:
+	"""A running kernel, as indexed by the registry.
+
+	Attributes:
+		pid: ID of the Blender process running the kernel.
+		kernel_name: Name of the kernel within its process.
+		blend_path: Path of the `.blend` file loaded in the process.
+			_Empty when the file was never saved._
+		start_time: Unix time at which the kernel started.
+		heartbeat: Unix time at which the process last confirmed that the kernel is running.
+		connection_file: Path to the kernel's connection file.
+		transport: How clients connect to the kernel, ex. `tcp`.
+		ip: IP address (or `ipc` path prefix) that the kernel binds to.
+		ports: Port of each socket, by the name used in connection files, ex. `shell_port`.
+	"""
+
+	pid: int
+	kernel_name: str
+	blend_path: str = ''
+	start_time: float = 0.0
+	heartbeat: float = 0.0
+	connection_file: str = ''
+	transport: str = 'tcp'
+	ip: str = ''
+	ports: dict[str, int] = dataclasses.field(default_factory=dict)
+
+	@property
+	def key(self) -> str:
+		"""Key of this entry in the registry."""
+		return entry_key(self.pid, self.kernel_name)
+
+	def is_stale(self, now: float | None = None) -> bool:
+		"""Whether this entry's process is no longer alive, or it wasn't refreshed for `STALE_SEC`.
+
+		Parameters:
+			now: Current Unix time.
+				_When `None`, `time.time()` is used._
+		"""
+		now = time.time() if now is None else now
+		return now - self.heartbeat > STALE_SEC or not pid_alive(self.pid)
+
+
+def entry_key(pid: int, kernel_name: str) -> str:
+	"""Key of the entry of a kernel in the registry, ex. `1234/default`."""
+	return f'{pid}/{kernel_name}'
+
+
+####################
+# - Processes
+####################
+def pid_alive(pid: int) -> bool:
+	"""Whether a process with the given ID is running on this host.
+
+	Notes:
+		On Windows, `os.kill()` would terminate the process, so the process is opened with `ctypes` instead.
+	"""
+	if pid <= 0:
+		return False
+	if pid == os.getpid():
+		return True
+	if sys.platform == 'win32':
+		return _pid_alive_windows(pid)
+
+	try:
+		os.kill(pid, 0)
+	except ProcessLookupError:
+		return False
+	except PermissionError:
+		## Exists, but belongs to another user.
+		return True
+	return True
+
+
+def _pid_alive_windows(pid: int) -> bool:
+	"""Whether a process with the given ID is running, on Windows."""
+	import ctypes
+
+	process_query_limited_information = 0x1000
+	still_active = 259
+
+	kernel32 = ctypes.windll.kernel32  # pyright: ignore[reportAttributeAccessIssue]
+	handle = kernel32.OpenProcess(process_query_limited_information, False, pid)
+	if not handle:
+		return False
+	try:
+		exit_code = ctypes.c_ulong()
+		return bool(
+			kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code))
+			and exit_code.value == still_active
+		)
+	finally:
+		kernel32.CloseHandle(handle)
+
+
+####################
+# - Reading
+####################
+def _read_raw(path_registry: Path) -> dict[str, RegistryEntry]:
+	"""All entries of the registry, including stale ones.
+
+	Notes:
+		A missing, unreadable or incompatible registry is treated as empty.
+	"""
+	try:
+		data = json.loads(path_registry.read_text(encoding='utf-8'))
+	except (OSError, ValueError):
+		return {}
+	if not isinstance(data, dict) or data.get('version') != REGISTRY_VERSION:
+		return {}
+
+	entries: dict[str, RegistryEntry] = {}
+	for key, fields in data.get('entries', {}).items():
+		with contextlib.suppress(TypeError):
+			entries[key] = RegistryEntry(**fields)
+	return entries
+
+
+def read(path_registry: Path | str) -> dict[str, RegistryEntry]:
+	"""All running kernels of the registry, by key.
+
+	Notes:
+		Only this one file is read, and it's never locked.
+
+	Parameters:
+		path_registry: Path to `registry.json`.
+
+	Returns:
+		Entries that aren't stale, by `entry_key()`.
+	"""
+	now = time.time()
+	return {
+		key: entry
+		for key, entry in _read_raw(Path(path_registry)).items()
+		if not entry.is_stale(now)
+	}
+
+
+def lookup(
+	path_registry: Path | str, pid: int, kernel_name: str = 'default'
+) -> RegistryEntry | None:
+	"""The entry of one kernel, if it's running.
+
+	Parameters:
+		path_registry: Path to `registry.json`.
+		pid: ID of the Blender process running the kernel.
+		kernel_name: Name of the kernel within its process.
+	"""
+	entry = _read_raw(Path(path_registry)).get(entry_key(pid, kernel_name))
+	if entry is None or entry.is_stale():
+		return None
+	return entry
+
+
+####################
+# - Updating
+####################
+@contextlib.contextmanager
+def _locked(path_lock: Path) -> cabc.Iterator[None]:
+	"""Hold an exclusive lock on a lock file, shared by all processes of the host."""
+	with path_lock.open('a+b') as f:
+		if sys.platform == 'win32':
+			import msvcrt
+
+			## Only locks a byte range, which suffices since all processes lock the same one.
+			_ = f.seek(0)
+			msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)  # pyright: ignore[reportAttributeAccessIssue]
+			try:
+				yield
+			finally:
+				_ = f.seek(0)
+				msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)  # pyright: ignore[reportAttributeAccessIssue]
+		else:
+			import fcntl
+
+			fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+			try:
+				yield
+			finally:
+				fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _write_atomic(path: Path, text: str) -> None:
+	"""Replace the contents of a file at once, so that readers see either the old or new contents."""
+	with tempfile.NamedTemporaryFile(
+		'w',
+		encoding='utf-8',
+		dir=path.parent,
+		prefix=f'.{path.name}-',
+		suffix='.tmp',
+		delete=False,
+	) as f:
+		_ = f.write(text)
+	try:
+		_ = Path(f.name).replace(path)
+	except OSError:
+		Path(f.name).unlink(missing_ok=True)
+		raise
+
+
+def _remove_connection_file(entry: RegistryEntry) -> None:
+	"""Delete the connection file of a dead process, together with its directory once empty."""
+	if not entry.connection_file:
+		return
+
+	path_connection_file = Path(entry.connection_file)
+	with contextlib.suppress(OSError):
+		path_connection_file.unlink(missing_ok=True)
+	with contextlib.suppress(OSError):
+		path_connection_file.parent.rmdir()
+
+
+def update(
+	path_registry: Path | str,
+	*,
+	put: cabc.Iterable[RegistryEntry] = (),
+	remove: cabc.Iterable[str] = (),
+) -> dict[str, RegistryEntry]:
+	"""Add, replace and remove entries of the registry, while pruning stale entries.
+
+	Notes:
+		The registry is locked while it's read, changed and replaced.
+
+		The connection files of pruned entries are deleted only when their process is dead.
+		A live process whose entry was pruned simply adds it again, with its next refresh.
+
+	Parameters:
+		path_registry: Path to `registry.json`, whose directory is created if needed.
+		put: Entries to add, or replace by their key.
+		remove: Keys of entries to remove.
+
+	Returns:
+		The entries now in the registry, by key.
+	"""
+	path_registry = Path(path_registry)
+	path_registry.parent.mkdir(parents=True, exist_ok=True)
+
+	with _locked(path_registry.with_name(path_registry.name + '.lock')):
+		now = time.time()
+		entries: dict[str, RegistryEntry] = {}
+		for key, entry in _read_raw(path_registry).items():
+			if not entry.is_stale(now):
+				entries[key] = entry
+			elif not pid_alive(entry.pid):
+				_remove_connection_file(entry)
+
+		for key in remove:
+			_ = entries.pop(key, None)
+		for entry in put:
+			entries[entry.key] = entry
+
+		_write_atomic(
+			path_registry,
+			json.dumps(
+				{
+					'version': REGISTRY_VERSION,
+					'entries': {
+						key: dataclasses.asdict(entry) for key, entry in entries.items()
+					},
+				},
+				indent=1,
+			),
+		)
+	return entries
+
+
+####################
+# - Main
+####################
+def main(argv: cabc.Sequence[str] | None = None) -> int:
+	"""Print all running kernels of a registry, as a table or as JSON."""
+	import argparse
+
+	parser = argparse.ArgumentParser(
+		description=typ.cast('str', __doc__).splitlines()[0]
+	)
+	_ = parser.add_argument('registry', type=Path, help='Path to registry.json.')
+	_ = parser.add_argument(
+		'--json', action='store_true', help='Print entries as JSON.'
+	)
+	args = parser.parse_args(argv)
+
+	entries = read(args.registry)
+	if args.json:
+		print(  # noqa: T201
+			json.dumps(
+				{key: dataclasses.asdict(entry) for key, entry in entries.items()},
+				indent=1,
+			)
+		)
+		return 0
+
+	now = time.time()
+	for entry in sorted(entries.values(), key=lambda entry: entry.start_time):
+		print(  # noqa: T201
+			f'{entry.key:>16} | {entry.transport:>3} | up {now - entry.start_time:>8.0f} s'
+			f' | {entry.blend_path or "(unsaved)"} | {entry.connection_file}'
+		)
+	return 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
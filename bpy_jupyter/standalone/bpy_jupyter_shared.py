@@ -0,0 +1,201 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Maps shared-memory arrays of the embedded kernel, in notebook clients on the same host.
+
+Examples:
+	With a `jupyter_client.BlockingKernelClient` connected to the embedded kernel:
+
+	```python
+	import bpy_jupyter_shared
+
+	with bpy_jupyter_shared.SharedArrayClient(client) as shared:
+		# Read: After 'exchange.publish_foreach(mesh.vertices, "co", components=3)' ran in the kernel.
+		with shared.acquire('co') as co:
+			print(co.mean(axis=0))
+
+		# Write: Before 'exchange.foreach_set(mesh.vertices, "co", key="positions")' runs in the kernel.
+		with shared.allocate('positions', new_positions.shape, '<f4') as positions:
+			positions[...] = new_positions
+	```
+
+Notes:
+	This module is standalone: It must be importable as `bpy_jupyter_shared`, by processes without `bpy`.
+
+	This client talks to `bpy_jupyter.utils.shared_array_comm.SharedArrayExchange` over a comm.
+	While waiting for a reply, other messages received on `iopub` are discarded.
+
+	Python's `multiprocessing.resource_tracker` would destroy attached segments when this process exits, as if it owned them.
+	Attached segments are therefore unregistered from it, since only the kernel may destroy them.
+
+Attributes:
+	COMM_TARGET: Name of the comm target of the embedded kernel.
+"""
+
+import collections.abc as cabc
+import contextlib
+import queue
+import time
+import typing as typ
+import uuid
+from multiprocessing import resource_tracker, shared_memory
+
+if typ.TYPE_CHECKING:
+	import numpy.typing as npt
+
+COMM_TARGET = 'bpy_jupyter.shared_arrays'
+
+
+class SharedArrayClient:
+	"""Client of the shared arrays of one embedded kernel.
+
+	Attributes:
+		client: A connected `jupyter_client.BlockingKernelClient`.
+		timeout: Seconds to wait for each reply from the kernel.
+		comm_id: ID of the comm to the kernel.
+	"""
+
+	def __init__(self, client: typ.Any, *, timeout: float = 10.0) -> None:
+		"""Open a comm to the shared arrays of the kernel.
+
+		Parameters:
+			client: A connected `jupyter_client.BlockingKernelClient`.
+			timeout: Seconds to wait for each reply from the kernel.
+		"""
+		self.client = client
+		self.timeout = timeout
+		self.comm_id: str = uuid.uuid4().hex
+		self._send('comm_open', {'target_name': COMM_TARGET, 'data': {}})
+
+	####################
+	# - Arrays
+	####################
+	@contextlib.contextmanager
+	def acquire(self, key: str) -> cabc.Iterator['npt.NDArray[typ.Any]']:
+		"""Map the shared array that the kernel bound to `key`.
+
+		Notes:
+			The kernel doesn't destroy the segment while it's acquired, even if the key is rebound.
+			The array **must not** be used after the `with` block ends.
+
+		Raises:
+			RuntimeError: If no array is bound to `key`, or the kernel didn't reply.
+		"""
+		spec = self._request('acquire', key=key)['spec']
+		with self._attach(spec) as array:
+			yield array
+
+	@contextlib.contextmanager
+	def allocate(
+		self, key: str, shape: cabc.Sequence[int], dtype: 'npt.DTypeLike'
+	) -> cabc.Iterator['npt.NDArray[typ.Any]']:
+		"""Have the kernel allocate a zero-initialized shared array bound to `key`, and map it.
+
+		Notes:
+			Write into the array within the `with` block.
+			Afterwards, kernel code can use it by `key`, since the kernel keeps it bound.
+
+		Raises:
+			RuntimeError: If the array couldn't be allocated, or the kernel didn't reply.
+		"""
+		import numpy as np
+
+		spec = self._request(
+			'allocate', key=key, shape=list(shape), dtype=np.dtype(dtype).str
+		)['spec']
+		with self._attach(spec) as array:
+			yield array
+
+	def specs(self) -> dict[str, dict[str, typ.Any]]:
+		"""Name, shape and dtype of all shared arrays of the kernel, by key."""
+		return self._request('list')['specs']
+
+	def close(self) -> None:
+		"""Close the comm, which drops all references that this client still holds."""
+		self._send('comm_close', {'data': {}})
+
+	def __enter__(self) -> typ.Self:
+		"""Use this client within a `with` block, which closes it at the end."""
+		return self
+
+	def __exit__(self, *_: object) -> None:
+		"""Close this client."""
+		self.close()
+
+	####################
+	# - Internal
+	####################
+	@contextlib.contextmanager
+	def _attach(
+		self, spec: dict[str, typ.Any]
+	) -> cabc.Iterator['npt.NDArray[typ.Any]']:
+		"""Map a segment referenced by this client, releasing the reference afterwards."""
+		import numpy as np
+
+		try:
+			shm = shared_memory.SharedMemory(name=spec['name'])
+		except FileNotFoundError:
+			_ = self._request('release', name=spec['name'])
+			raise
+
+		## Only the kernel may destroy the segment.
+		resource_tracker.unregister(shm._name, 'shared_memory')  # noqa: SLF001  # pyright: ignore[reportAttributeAccessIssue]
+		try:
+			array: npt.NDArray[typ.Any] = np.ndarray(
+				spec['shape'], dtype=np.dtype(spec['dtype']), buffer=shm.buf
+			)
+			yield array
+			del array
+		finally:
+			with contextlib.suppress(BufferError):
+				shm.close()
+			_ = self._request('release', name=spec['name'])
+
+	def _send(self, msg_type: str, content: dict[str, typ.Any]) -> None:
+		"""Send a comm message on the shell channel."""
+		msg = self.client.session.msg(msg_type, {'comm_id': self.comm_id, **content})
+		self.client.shell_channel.send(msg)
+
+	def _request(self, op: str, **arguments: typ.Any) -> dict[str, typ.Any]:
+		"""Send a request to the kernel, and wait for its reply.
+
+		Raises:
+			RuntimeError: If the kernel replied with an error, or didn't reply in time.
+		"""
+		request_id = uuid.uuid4().hex
+		self._send(
+			'comm_msg', {'data': {'request_id': request_id, 'op': op, **arguments}}
+		)
+
+		deadline = time.monotonic() + self.timeout
+		while (remaining := deadline - time.monotonic()) > 0:
+			try:
+				msg = self.client.get_iopub_msg(timeout=remaining)
+			except queue.Empty:
+				break
+
+			content = msg['content']
+			if (
+				msg['msg_type'] == 'comm_msg'
+				and content.get('comm_id') == self.comm_id
+				and content['data'].get('request_id') == request_id
+			):
+				if 'error' in content['data']:
+					raise RuntimeError(content['data']['error'])
+				return content['data']
+
+		msg = f'Kernel did not reply to shared array request {op!r} in time.'
+		raise RuntimeError(msg)
@@ -0,0 +1,46 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Code that runs inside the worker processes of `bpy_jupyter.services.process_pool`.
+
+Notes:
+	This module is standalone: It must be importable as `bpy_jupyter_worker`, by processes without `bpy`.
+"""
+
+import collections.abc as cabc
+import time
+import typing as typ
+
+
+def timed_call(
+	func: cabc.Callable[..., typ.Any],
+	args: tuple[typ.Any, ...],
+	kwargs: dict[str, typ.Any],
+) -> tuple[typ.Any, float, float]:
+	"""Run `func(*args, **kwargs)`, measuring when it started and how long it took.
+
+	Parameters:
+		func: The callable to run.
+		args: Positional arguments to pass to `func`.
+		kwargs: Keyword arguments to pass to `func`.
+
+	Returns:
+		The return value of `func`, the value of `time.time()` when it started, and the seconds that it took to run.
+	"""
+	time_started = time.time()
+	time_start = time.perf_counter()
+	result = func(*args, **kwargs)
+	return result, time_started, time.perf_counter() - time_start
@@ -146,12 +146,18 @@ class OperatorType(enum.StrEnum):
 		StartJupyterKernel: Starts an embedded Jupyter kernel, using `bpy_jupyter.services.jupyter_kernel`.
 
 			- Also starts an `asyncio` event loop, using `bpy_jupyter.services.async_event_loop`.
+			- Also starts a process pool, using `bpy_jupyter.services.process_pool`.
 		StopJupyterKernel: Stops the embedded Jupyter kernel, using `bpy_jupyter.services.jupyter_kernel`.
 
 			- Also stops the active `asyncio` event loop, using `bpy_jupyter.services.async_event_loop`.
+			- Also stops the process pool, using `bpy_jupyter.services.process_pool`.
+		RestartJupyterKernel: Restarts the embedded Jupyter kernel, using `bpy_jupyter.services.jupyter_kernel`.
+
+			- By default, the restart is warm, which keeps all client connections alive.
 		CopyKernelInfoToClipboard: Copies some string whose value depends on a running Jupyter kernel, to the system clipboard.
 	"""
 
 	StartJupyterKernel = f'{EXT_NAME}.start_jupyter_kernel'
 	StopJupyterKernel = f'{EXT_NAME}.stop_jupyter_kernel'
+	RestartJupyterKernel = f'{EXT_NAME}.restart_jupyter_kernel'
 	CopyKernelInfoToClipboard = f'{EXT_NAME}.copy_kernel_info_to_clipboard'
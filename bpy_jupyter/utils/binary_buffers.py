@@ -0,0 +1,192 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Sends `numpy` arrays, ex. of mesh vertices or image pixels, to notebook clients as raw binary message buffers.
+
+Notes:
+	Displaying an array normally sends its `repr` (or a JSON list) over `iopub`, which costs a lot of time and memory for large arrays.
+	Instead, `send_array()` publishes a `display_data` message whose array data is a raw ZeroMQ frame in the message's `buffers`.
+	The JSON part of the message only describes the array, by `BUFFER_MIMETYPE`, and gives frontends a short `text/plain` summary.
+
+	Large buffers are sent by ZeroMQ without copying them, while the kernel's `iopub` thread holds a reference to the array.
+	Arrays therefore **must not** be modified after they are sent, which is why `send_foreach()` always fills a fresh array.
+
+	On the client, the standalone `bpy_jupyter_buffers` module rebuilds arrays from such messages, without copying them either.
+
+	`numpy` and `IPython` are imported lazily, so that importing this module stays cheap.
+
+Attributes:
+	BUFFER_MIMETYPE: Mimetype of the description of an array, whose data is in the message's `buffers`.
+		_Must match `bpy_jupyter_buffers.BUFFER_MIMETYPE`._
+
+References:
+	- Jupyter Messaging (Buffers): <https://jupyter-client.readthedocs.io/en/stable/messaging.html#the-wire-protocol>
+	- `bpy_struct.foreach_get`: <https://docs.blender.org/api/current/bpy.types.bpy_struct.html#bpy.types.bpy_struct.foreach_get>
+"""
+
+import typing as typ
+
+if typ.TYPE_CHECKING:
+	import numpy.typing as npt
+
+BUFFER_MIMETYPE = 'application/vnd.bpy-jupyter.ndarray+json'
+
+
+####################
+# - Filling Arrays
+####################
+def foreach_get(
+	source: typ.Any,
+	attr: str | None = None,
+	*,
+	components: int = 1,
+	dtype: 'npt.DTypeLike' = '<f4',
+	out: 'npt.NDArray[typ.Any] | None' = None,
+) -> 'npt.NDArray[typ.Any]':
+	"""Fill a `numpy` array with `foreach_get`, without intermediate Python objects.
+
+	Examples:
+		```python
+		co = foreach_get(mesh.vertices, 'co', components=3)
+		pixels = foreach_get(image.pixels)
+		```
+
+	Parameters:
+		source: A `bpy` collection (ex. `mesh.vertices`), or a `bpy` property array (ex. `image.pixels`).
+		attr: Name of the property to get from each element of a collection.
+			_Must be `None` when `source` is a property array._
+		components: Number of values per element, ex. `3` for vertex coordinates.
+		dtype: Data type of the array.
+			_Should match the C type of the property, ex. `<f4` for float properties, or Blender must convert each value._
+		out: Contiguous array to fill, ex. one in shared memory.
+			_When `None`, a new array is allocated._
+
+	Returns:
+		The filled array, of shape `(len(source),)` when `components` is `1`, and `(len(source), components)` otherwise.
+	"""
+	import numpy as np
+
+	shape = (len(source),) if components == 1 else (len(source), components)
+	array = np.empty(shape, dtype=dtype) if out is None else out
+	if attr is None:
+		source.foreach_get(array.ravel())
+	else:
+		source.foreach_get(attr, array.ravel())
+	return array
+
+
+####################
+# - Sending Arrays
+####################
+def array_description(
+	array: 'npt.NDArray[typ.Any]', *, name: str
+) -> dict[str, typ.Any]:
+	"""JSON-compatible description of an array, which is sent alongside its buffer.
+
+	Parameters:
+		array: The array to describe.
+		name: Name that clients can use to tell arrays apart.
+	"""
+	return {
+		'name': name,
+		'dtype': array.dtype.str,
+		'shape': list(array.shape),
+		'nbytes': array.nbytes,
+	}
+
+
+def send_array(array: 'npt.ArrayLike', *, name: str = '') -> None:
+	"""Publish an array to all clients of the current kernel, as a raw binary buffer of a `display_data` message.
+
+	Notes:
+		Must be called from code run by a kernel, ex. a notebook cell.
+		Output written to `stdout`/`stderr` before calling is flushed first, so that it stays in order.
+
+	Parameters:
+		array: The array to send.
+			_Non-contiguous arrays are copied once into a contiguous array._
+		name: Name that clients can use to tell arrays apart.
+
+	Raises:
+		RuntimeError: If not called from code run by a kernel.
+	"""
+	import numpy as np
+	from IPython.core.getipython import get_ipython
+
+	shell = get_ipython()
+	if shell is None or not hasattr(shell, 'kernel'):
+		msg = "Can't send an array, since no Jupyter kernel is running this code."
+		raise RuntimeError(msg)
+
+	array = np.ascontiguousarray(array)
+	description = array_description(array, name=name)
+
+	# Publish like ZMQDisplayPublisher.publish(), with Buffers
+	## Hooks (ex. of ipywidgets.Output) may capture, or swallow, the message.
+	display_pub = shell.display_pub
+	display_pub._flush_streams()  # noqa: SLF001
+	msg = display_pub.session.msg(
+		'display_data',
+		{
+			'data': {
+				'text/plain': f'<array {name!r}: {array.dtype} {array.shape}>',
+				BUFFER_MIMETYPE: description,
+			},
+			'metadata': {},
+			'transient': {},
+		},
+		parent=display_pub.parent_header,
+	)
+	for hook in display_pub._hooks:  # noqa: SLF001
+		msg = hook(msg)
+		if msg is None:
+			return
+
+	_ = display_pub.session.send(
+		display_pub.pub_socket,
+		msg,
+		ident=display_pub.topic,
+		buffers=[memoryview(array.reshape(-1).view(np.uint8))],
+	)
+
+
+def send_foreach(
+	source: typ.Any,
+	attr: str | None = None,
+	*,
+	name: str | None = None,
+	components: int = 1,
+	dtype: 'npt.DTypeLike' = '<f4',
+) -> None:
+	"""Fill a new array with `foreach_get`, and publish it to all clients of the current kernel.
+
+	Examples:
+		```python
+		send_foreach(mesh.vertices, 'co', components=3)
+		```
+
+	Parameters:
+		source: A `bpy` collection or property array; see `foreach_get()`.
+		attr: Name of the property to get from each element of a collection; see `foreach_get()`.
+		name: Name that clients can use to tell arrays apart.
+			_When `None`, `attr` is used._
+		components: Number of values per element; see `foreach_get()`.
+		dtype: Data type of the array; see `foreach_get()`.
+	"""
+	send_array(
+		foreach_get(source, attr, components=components, dtype=dtype),
+		name=(attr or '') if name is None else name,
+	)
@@ -0,0 +1,487 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Reads and writes `bpy` data in bulk, as `numpy` arrays.
+
+## Motivation
+Loops like `[v.co for v in mesh.vertices]` create a Python object per element, which is orders of magnitude slower than `foreach_get`.
+Yet `foreach_get` is easy to get wrong: The array must be flat, of the right length and C type, and matrices come out transposed.
+
+Therefore, `BulkData` wraps `foreach_get`/`foreach_set` for the data that's most often read or written in bulk:
+
+- **Objects**: Locations, rotations, scales and matrices of many objects.
+- **Meshes**: Vertex positions and normals, attributes, and UV maps.
+- **Custom Properties**: One custom property of many objects (or other IDs).
+- **Keyframes**: Keyframe coordinates of an F-Curve.
+
+Embedded kernels add a `BulkData` named `bulk` to the namespace of every cell:
+
+```python
+co = bulk.vertex_positions(mesh)
+bulk.set_vertex_positions(mesh, co + [0, 0, 1])
+```
+
+## Buffer Reuse
+Writing arrays of another type or layout than Blender's requires converting them first.
+Each `BulkData` converts into preallocated buffers, which are reused by later writes of the same shape.
+
+Reads may reuse buffers too, by passing `reuse=True`.
+The returned array is then overwritten by the next read of the same accessor, so it should only be used right away.
+
+Notes:
+	Objects may be given as a `bpy` collection (ex. `bpy.data.objects` or `collection.objects`), or as a sequence (ex. `bpy.context.selected_objects`).
+	Only collections support `foreach_get`; sequences are read and written one object at a time.
+
+	`numpy` is imported lazily, so that importing this module stays cheap.
+
+Attributes:
+	ATTRIBUTE_LAYOUTS: For each attribute data type, the property of its elements, the number of values per element, and the `numpy` type of these values.
+
+References:
+	- `bpy_struct.foreach_get`: <https://docs.blender.org/api/current/bpy.types.bpy_struct.html#bpy.types.bpy_struct.foreach_get>
+	- `Attribute`: <https://docs.blender.org/api/current/bpy.types.Attribute.html>
+"""
+
+import collections.abc as cabc
+import math
+import typing as typ
+
+from .binary_buffers import foreach_get
+
+if typ.TYPE_CHECKING:
+	import numpy.typing as npt
+
+ATTRIBUTE_LAYOUTS: dict[str, tuple[str, int, str]] = {
+	'FLOAT': ('value', 1, '<f4'),
+	'INT': ('value', 1, '<i4'),
+	'INT8': ('value', 1, '<i4'),
+	'BOOLEAN': ('value', 1, '?'),
+	'FLOAT2': ('vector', 2, '<f4'),
+	'INT32_2D': ('value', 2, '<i4'),
+	'FLOAT_VECTOR': ('vector', 3, '<f4'),
+	'FLOAT_COLOR': ('color', 4, '<f4'),
+	'BYTE_COLOR': ('color', 4, '<f4'),
+	'QUATERNION': ('value', 4, '<f4'),
+	'FLOAT4X4': ('value', 16, '<f4'),
+}
+
+
+####################
+# - Class: Bulk Data
+####################
+class BulkData:
+	"""Reads and writes `bpy` data as `numpy` arrays, reusing preallocated buffers.
+
+	Notes:
+		Writes don't run the update callbacks of the written properties.
+		Instead, written objects are tagged for update, and written meshes are updated with `mesh.update()`.
+	"""
+
+	def __init__(self) -> None:
+		"""Initialize without any buffers."""
+		self._buffers: dict[str, npt.NDArray[typ.Any]] = {}
+
+	####################
+	# - Buffers
+	####################
+	@property
+	def nbytes(self) -> int:
+		"""Total size of all preallocated buffers."""
+		return sum(buffer.nbytes for buffer in self._buffers.values())
+
+	def clear(self) -> None:
+		"""Free all preallocated buffers."""
+		self._buffers.clear()
+
+	def _array(
+		self,
+		key: str,
+		shape: tuple[int, ...],
+		dtype: 'npt.DTypeLike',
+		*,
+		reuse: bool,
+	) -> 'npt.NDArray[typ.Any]':
+		"""An array to fill, which is the buffer of `key` when `reuse` is set.
+
+		Notes:
+			Each key has one buffer, which is replaced when another shape or type is asked for.
+		"""
+		import numpy as np
+
+		if not reuse:
+			return np.empty(shape, dtype=dtype)
+
+		buffer = self._buffers.get(key)
+		if buffer is None or buffer.shape != shape or buffer.dtype != np.dtype(dtype):
+			buffer = self._buffers[key] = np.empty(shape, dtype=dtype)
+		return buffer
+
+	def _converted(
+		self,
+		key: str,
+		values: 'npt.ArrayLike',
+		shape: tuple[int, ...],
+		dtype: 'npt.DTypeLike',
+	) -> 'npt.NDArray[typ.Any]':
+		"""Values to write, as a contiguous array of `shape` and `dtype`.
+
+		Notes:
+			Values that already are such an array are returned as-is.
+			Otherwise, they're converted into a buffer for writes to `key`, which broadcasts them to `shape`.
+			_Writes have their own buffers, so that they don't overwrite arrays returned by reads with `reuse=True`._
+		"""
+		import numpy as np
+
+		if (
+			isinstance(values, np.ndarray)
+			and values.shape == shape
+			and values.dtype == np.dtype(dtype)
+			and values.flags.c_contiguous
+		):
+			return values
+
+		buffer = self._array(f'write:{key}', shape, dtype, reuse=True)
+		buffer[...] = values
+		return buffer
+
+	####################
+	# - Objects
+	####################
+	def _get_objects(
+		self,
+		objects: cabc.Sequence[typ.Any],
+		attr: str,
+		shape: tuple[int, ...],
+		*,
+		reuse: bool,
+	) -> 'npt.NDArray[typ.Any]':
+		"""Get a property of each object, as an array of shape `(len(objects), *shape)`."""
+		array = self._array(attr, (len(objects), *shape), '<f4', reuse=reuse)
+		if hasattr(objects, 'foreach_get'):
+			objects.foreach_get(attr, array.ravel())  # pyright: ignore[reportAttributeAccessIssue]
+		else:
+			for i, obj in enumerate(objects):
+				array[i] = getattr(obj, attr)
+		return array
+
+	def _set_objects(
+		self,
+		objects: cabc.Sequence[typ.Any],
+		attr: str,
+		shape: tuple[int, ...],
+		values: 'npt.ArrayLike',
+	) -> None:
+		"""Set a property of each object, from values broadcastable to `(len(objects), *shape)`."""
+		array = self._converted(attr, values, (len(objects), *shape), '<f4')
+		if hasattr(objects, 'foreach_set'):
+			objects.foreach_set(attr, array.ravel())  # pyright: ignore[reportAttributeAccessIssue]
+		else:
+			for obj, value in zip(objects, array, strict=True):
+				setattr(obj, attr, value)
+
+		for obj in objects:
+			obj.update_tag(refresh={'OBJECT'})
+
+	def locations(
+		self, objects: cabc.Sequence[typ.Any], *, reuse: bool = False
+	) -> 'npt.NDArray[typ.Any]':
+		"""Locations of objects, of shape `(len(objects), 3)`."""
+		return self._get_objects(objects, 'location', (3,), reuse=reuse)
+
+	def set_locations(
+		self, objects: cabc.Sequence[typ.Any], values: 'npt.ArrayLike'
+	) -> None:
+		"""Set locations of objects, from values broadcastable to `(len(objects), 3)`."""
+		self._set_objects(objects, 'location', (3,), values)
+
+	def rotations(
+		self, objects: cabc.Sequence[typ.Any], *, reuse: bool = False
+	) -> 'npt.NDArray[typ.Any]':
+		"""Euler rotations of objects in radians, of shape `(len(objects), 3)`."""
+		return self._get_objects(objects, 'rotation_euler', (3,), reuse=reuse)
+
+	def set_rotations(
+		self, objects: cabc.Sequence[typ.Any], values: 'npt.ArrayLike'
+	) -> None:
+		"""Set Euler rotations of objects in radians, from values broadcastable to `(len(objects), 3)`."""
+		self._set_objects(objects, 'rotation_euler', (3,), values)
+
+	def scales(
+		self, objects: cabc.Sequence[typ.Any], *, reuse: bool = False
+	) -> 'npt.NDArray[typ.Any]':
+		"""Scales of objects, of shape `(len(objects), 3)`."""
+		return self._get_objects(objects, 'scale', (3,), reuse=reuse)
+
+	def set_scales(
+		self, objects: cabc.Sequence[typ.Any], values: 'npt.ArrayLike'
+	) -> None:
+		"""Set scales of objects, from values broadcastable to `(len(objects), 3)`."""
+		self._set_objects(objects, 'scale', (3,), values)
+
+	def matrices(
+		self,
+		objects: cabc.Sequence[typ.Any],
+		*,
+		world: bool = True,
+		reuse: bool = False,
+	) -> 'npt.NDArray[typ.Any]':
+		"""Transformation matrices of objects, of shape `(len(objects), 4, 4)`.
+
+		Notes:
+			Matrices are row-major, like `np.array(obj.matrix_world)`.
+			_`foreach_get` gives column-major matrices, which are returned transposed._
+
+		Parameters:
+			objects: Objects to get matrices of.
+			world: Whether to get `matrix_world`, or else `matrix_basis`.
+			reuse: Whether to fill a reused buffer, instead of a new array.
+		"""
+		attr = 'matrix_world' if world else 'matrix_basis'
+		if not hasattr(objects, 'foreach_get'):
+			return self._get_objects(objects, attr, (4, 4), reuse=reuse)
+		return self._get_objects(objects, attr, (4, 4), reuse=reuse).transpose(0, 2, 1)
+
+	def set_matrices(
+		self,
+		objects: cabc.Sequence[typ.Any],
+		values: 'npt.ArrayLike',
+		*,
+		world: bool = True,
+	) -> None:
+		"""Set transformation matrices of objects, from row-major values broadcastable to `(len(objects), 4, 4)`.
+
+		Parameters:
+			objects: Objects to set matrices of.
+			values: Row-major matrices, like those of `matrices()`.
+			world: Whether to set `matrix_world`, or else `matrix_basis`.
+		"""
+		import numpy as np
+
+		attr = 'matrix_world' if world else 'matrix_basis'
+		if not hasattr(objects, 'foreach_set'):
+			self._set_objects(objects, attr, (4, 4), values)
+			return
+		values = np.broadcast_to(values, (len(objects), 4, 4)).transpose(0, 2, 1)
+		self._set_objects(objects, attr, (4, 4), values)
+
+	####################
+	# - Meshes
+	####################
+	def vertex_positions(
+		self, mesh: typ.Any, *, reuse: bool = False
+	) -> 'npt.NDArray[typ.Any]':
+		"""Positions of the vertices of a mesh, of shape `(len(mesh.vertices), 3)`."""
+		return foreach_get(
+			mesh.vertices,
+			'co',
+			components=3,
+			out=self._array('co', (len(mesh.vertices), 3), '<f4', reuse=reuse),
+		)
+
+	def set_vertex_positions(self, mesh: typ.Any, values: 'npt.ArrayLike') -> None:
+		"""Set positions of the vertices of a mesh, from values broadcastable to `(len(mesh.vertices), 3)`."""
+		array = self._converted('co', values, (len(mesh.vertices), 3), '<f4')
+		mesh.vertices.foreach_set('co', array.ravel())
+		mesh.update()
+
+	def vertex_normals(
+		self, mesh: typ.Any, *, reuse: bool = False
+	) -> 'npt.NDArray[typ.Any]':
+		"""Normals of the vertices of a mesh, of shape `(len(mesh.vertices), 3)`."""
+		return foreach_get(
+			mesh.vertex_normals,
+			'vector',
+			components=3,
+			out=self._array('normal', (len(mesh.vertices), 3), '<f4', reuse=reuse),
+		)
+
+	def attribute(
+		self, mesh: typ.Any, name: str, *, reuse: bool = False
+	) -> 'npt.NDArray[typ.Any]':
+		"""Values of a mesh attribute, of shape `(len(attribute.data),)` or `(len(attribute.data), components)`.
+
+		Notes:
+			`FLOAT4X4` attributes have 16 components per element, in the order that `foreach_get` gives them.
+
+		Raises:
+			KeyError: If the mesh has no attribute of that name.
+			ValueError: If attributes of that data type can't be read in bulk.
+		"""
+		attr, components, dtype, data = self._attribute_layout(mesh, name)
+		shape = (len(data),) if components == 1 else (len(data), components)
+		return foreach_get(
+			data,
+			attr,
+			components=components,
+			dtype=dtype,
+			out=self._array(f'attribute:{name}', shape, dtype, reuse=reuse),
+		)
+
+	def set_attribute(self, mesh: typ.Any, name: str, values: 'npt.ArrayLike') -> None:
+		"""Set values of a mesh attribute, from values broadcastable to the shape given by `attribute()`.
+
+		Raises:
+			KeyError: If the mesh has no attribute of that name.
+			ValueError: If attributes of that data type can't be written in bulk.
+		"""
+		attr, components, dtype, data = self._attribute_layout(mesh, name)
+		shape = (len(data),) if components == 1 else (len(data), components)
+		array = self._converted(f'attribute:{name}', values, shape, dtype)
+		data.foreach_set(attr, array.ravel())
+		mesh.update()
+
+	def _attribute_layout(
+		self, mesh: typ.Any, name: str
+	) -> tuple[str, int, str, typ.Any]:
+		"""Property, components, type and elements of a mesh attribute."""
+		attribute = mesh.attributes.get(name)
+		if attribute is None:
+			msg = f'Mesh {mesh.name!r} has no attribute {name!r}.'
+			raise KeyError(msg)
+
+		layout = ATTRIBUTE_LAYOUTS.get(attribute.data_type)
+		if layout is None:
+			msg = f"Attribute {name!r} is of type {attribute.data_type}, which can't be read or written in bulk."
+			raise ValueError(msg)
+		return (*layout, attribute.data)
+
+	def uvs(
+		self, mesh: typ.Any, layer: str | None = None, *, reuse: bool = False
+	) -> 'npt.NDArray[typ.Any]':
+		"""UV coordinates of each face corner of a mesh, of shape `(len(mesh.loops), 2)`.
+
+		Parameters:
+			mesh: Mesh to get UV coordinates of.
+			layer: Name of the UV map.
+				_When `None`, the active UV map is used._
+			reuse: Whether to fill a reused buffer, instead of a new array.
+
+		Raises:
+			KeyError: If the mesh has no such UV map.
+		"""
+		return foreach_get(
+			self._uv_layer(mesh, layer).uv,
+			'vector',
+			components=2,
+			out=self._array('uv', (len(mesh.loops), 2), '<f4', reuse=reuse),
+		)
+
+	def set_uvs(
+		self, mesh: typ.Any, values: 'npt.ArrayLike', layer: str | None = None
+	) -> None:
+		"""Set UV coordinates of each face corner of a mesh, from values broadcastable to `(len(mesh.loops), 2)`.
+
+		Raises:
+			KeyError: If the mesh has no such UV map.
+		"""
+		array = self._converted('uv', values, (len(mesh.loops), 2), '<f4')
+		self._uv_layer(mesh, layer).uv.foreach_set('vector', array.ravel())
+		mesh.update()
+
+	def _uv_layer(self, mesh: typ.Any, layer: str | None) -> typ.Any:
+		"""A UV map of a mesh, which is the active one when `layer` is `None`."""
+		uv_layer = mesh.uv_layers.active if layer is None else mesh.uv_layers.get(layer)
+		if uv_layer is None:
+			msg = (
+				f'Mesh {mesh.name!r} has no UV map.'
+				if layer is None
+				else f'Mesh {mesh.name!r} has no UV map {layer!r}.'
+			)
+			raise KeyError(msg)
+		return uv_layer
+
+	####################
+	# - Custom Properties
+	####################
+	def custom_property(
+		self,
+		ids: cabc.Iterable[typ.Any],
+		key: str,
+		*,
+		default: float = math.nan,
+		dtype: 'npt.DTypeLike' = '<f8',
+	) -> 'npt.NDArray[typ.Any]':
+		"""One custom property of each ID (ex. object), of shape `(len(ids),)`.
+
+		Notes:
+			Custom properties don't support `foreach_get`, so each is read with `id[key]`.
+			This is still much faster than building a list, since values go straight into the array.
+
+		Parameters:
+			ids: IDs to get the custom property of.
+			key: Name of the custom property.
+			default: Value of IDs without the custom property.
+			dtype: Data type of the array.
+		"""
+		import numpy as np
+
+		return np.fromiter((id_.get(key, default) for id_ in ids), dtype=dtype)
+
+	def set_custom_property(
+		self, ids: cabc.Iterable[typ.Any], key: str, values: 'npt.ArrayLike'
+	) -> None:
+		"""Set one custom property of each ID (ex. object), from values broadcastable to `(len(ids),)`."""
+		import numpy as np
+
+		ids = list(ids)
+		for id_, value in zip(
+			ids, np.broadcast_to(values, (len(ids),)).tolist(), strict=True
+		):
+			id_[key] = value
+
+	####################
+	# - Keyframes
+	####################
+	def keyframes(
+		self, fcurve: typ.Any, *, reuse: bool = False
+	) -> 'npt.NDArray[typ.Any]':
+		"""Frames and values of the keyframes of an F-Curve, of shape `(len(fcurve.keyframe_points), 2)`.
+
+		Examples:
+			```python
+			fcurve = obj.animation_data.action.fcurves.find('location', index=2)
+			frames, values = bulk.keyframes(fcurve).T
+			```
+		"""
+		return foreach_get(
+			fcurve.keyframe_points,
+			'co',
+			components=2,
+			out=self._array(
+				'keyframes', (len(fcurve.keyframe_points), 2), '<f4', reuse=reuse
+			),
+		)
+
+	def set_keyframes(self, fcurve: typ.Any, values: 'npt.ArrayLike') -> None:
+		"""Replace the keyframes of an F-Curve, from an array of shape `(n, 2)` of frames and values.
+
+		Notes:
+			Keyframes are added or removed until there are `n`, then all are moved at once.
+			Afterwards, handles are recalculated with `fcurve.update()`.
+		"""
+		import numpy as np
+
+		num_keyframes = len(np.asarray(values))
+		array = self._converted('keyframes', values, (num_keyframes, 2), '<f4')
+
+		keyframe_points = fcurve.keyframe_points
+		if len(keyframe_points) < num_keyframes:
+			keyframe_points.add(num_keyframes - len(keyframe_points))
+		while len(keyframe_points) > num_keyframes:
+			keyframe_points.remove(keyframe_points[-1], fast=True)
+
+		keyframe_points.foreach_set('co', array.ravel())
+		fcurve.update()
@@ -0,0 +1,382 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Measures how long each cell of an embedded kernel took, and how long it blocked Blender's main thread.
+
+## Motivation
+Every cell runs on Blender's main thread, which also draws Blender's UI.
+While a cell runs without `await`ing, Blender is frozen.
+
+Therefore, embedded kernels time every `execute_request` with a `CellClock`, which measures:
+
+- **Queue Wait**: Time from the client sending the request, until it started running.
+	_Includes waiting for earlier requests, also of other embedded kernels._
+	_The time of sending is taken from the request's header, so clients on other machines need a synchronized clock._
+- **Wall Time**: Time from starting to run the request, until its reply was ready.
+- **CPU Time**: Time that the main thread spent computing the cell.
+- **Blocking Time**: Time that the cell held the main thread.
+	_While a cell `await`s, Blender is free to redraw, so this can be much smaller than the wall time._
+- **Longest Block**: The longest uninterrupted stretch that the cell held the main thread, i.e. the longest UI freeze.
+
+The most recent timings are kept in a `CellTimingStore`, and added to the metadata of each `execute_reply` under `METADATA_KEY`.
+In notebooks, they are shown by the `%blender_stats` line magic.
+
+Attributes:
+	TIMINGS_WINDOW: Number of most recent cells whose timings are retained.
+	METADATA_KEY: Key of the timings in the metadata of `execute_reply` messages.
+	CODE_PREVIEW_CHARS: Number of characters of each cell's first line that are kept, to recognize it by.
+"""
+
+import collections
+import collections.abc as cabc
+import dataclasses
+import datetime
+import time
+import typing as typ
+
+from .stats import SeriesSummary
+
+TIMINGS_WINDOW = 256
+METADATA_KEY = 'bpy_jupyter'
+CODE_PREVIEW_CHARS = 40
+
+
+####################
+# - Class: Cell Timing
+####################
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class CellTiming:
+	"""How long one `execute_request` took.
+
+	Attributes:
+		msg_id: ID of the `execute_request`.
+		execution_count: Execution count of the cell.
+			_`None` for silent requests, which don't count._
+		code: The start of the first non-empty line of the cell.
+		status: Status of the `execute_reply`, ex. `ok` or `error`.
+		queue_sec: Seconds from sending the request, until it started running.
+		wall_sec: Seconds from starting to run the request, until its reply was ready.
+		cpu_sec: Seconds of CPU time that the main thread spent running the cell.
+		blocking_sec: Seconds that the cell held the main thread.
+		max_blocking_sec: Seconds of the longest uninterrupted stretch that the cell held the main thread.
+	"""
+
+	msg_id: str
+	execution_count: int | None
+	code: str
+	status: str
+
+	queue_sec: float
+	wall_sec: float
+	cpu_sec: float
+	blocking_sec: float
+	max_blocking_sec: float
+
+	@property
+	def metadata(self) -> dict[str, float]:
+		"""These timings in milliseconds, as added to the metadata of `execute_reply` messages."""
+		return {
+			'queue_ms': 1000 * self.queue_sec,
+			'wall_ms': 1000 * self.wall_sec,
+			'cpu_ms': 1000 * self.cpu_sec,
+			'blocking_ms': 1000 * self.blocking_sec,
+			'max_blocking_ms': 1000 * self.max_blocking_sec,
+		}
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class CellTimingSummary:
+	"""Summary of the timings of the most recent cells.
+
+	Attributes:
+		cells: Timings of the most recent cells, oldest first.
+		queue_sec: Summary of the queue wait of each cell.
+		wall_sec: Summary of the wall time of each cell.
+		blocking_sec: Summary of the blocking time of each cell.
+		max_blocking_sec: Summary of the longest block of each cell.
+	"""
+
+	cells: tuple[CellTiming, ...] = ()
+	queue_sec: SeriesSummary = dataclasses.field(default_factory=SeriesSummary)
+	wall_sec: SeriesSummary = dataclasses.field(default_factory=SeriesSummary)
+	blocking_sec: SeriesSummary = dataclasses.field(default_factory=SeriesSummary)
+	max_blocking_sec: SeriesSummary = dataclasses.field(default_factory=SeriesSummary)
+
+
+####################
+# - Class: Cell Timing Store
+####################
+class CellTimingStore:
+	"""Timings of the `TIMINGS_WINDOW` most recent cells of one kernel.
+
+	Notes:
+		Cells are recorded on the thread of the kernel's event loop, which is also where timings should be read.
+		So no locking is needed.
+	"""
+
+	def __init__(self) -> None:
+		"""Initialize an empty store."""
+		self._timings: collections.deque[CellTiming] = collections.deque(
+			maxlen=TIMINGS_WINDOW
+		)
+
+	def record(self, timing: CellTiming) -> None:
+		"""Record the timing of a cell, forgetting the oldest one if the store is full."""
+		self._timings.append(timing)
+
+	def timings(self) -> tuple[CellTiming, ...]:
+		"""Timings of the most recent cells, oldest first."""
+		return tuple(self._timings)
+
+	def summary(self) -> CellTimingSummary:
+		"""Summarize the timings of the most recent cells.
+
+		Notes:
+			Summarizing sorts each series, so avoid calling this very often (ex. more than once per redraw).
+		"""
+		return CellTimingSummary(
+			cells=tuple(self._timings),
+			queue_sec=SeriesSummary.from_samples(t.queue_sec for t in self._timings),
+			wall_sec=SeriesSummary.from_samples(t.wall_sec for t in self._timings),
+			blocking_sec=SeriesSummary.from_samples(
+				t.blocking_sec for t in self._timings
+			),
+			max_blocking_sec=SeriesSummary.from_samples(
+				t.max_blocking_sec for t in self._timings
+			),
+		)
+
+	def clear(self) -> None:
+		"""Forget all recorded timings."""
+		self._timings.clear()
+
+
+####################
+# - Class: Cell Clock
+####################
+class CellClock:
+	"""Times one request, including how long each step of its coroutine held the thread.
+
+	Notes:
+		A coroutine only holds its thread while it runs, i.e. between two `await`s that actually suspend it.
+		Awaiting `timed(coro)` instead of `coro` therefore sums up the time of each of these steps.
+
+		Coroutines of several tasks, ex. a request and a cell that it runs in its own task, may all be timed by the same clock.
+		Steps that begin within another timed step are part of that step, so no time is counted twice.
+
+	Attributes:
+		time_received: `time.perf_counter()` when the request was sent, or else received.
+		time_started: `time.perf_counter()` when the request started running.
+		cpu_sec: Thread CPU time spent in steps so far.
+		blocking_sec: Time spent in steps so far.
+		max_blocking_sec: Longest step so far.
+	"""
+
+	def __init__(
+		self,
+		time_received: float | None = None,
+		*,
+		date_sent: datetime.datetime | None = None,
+	) -> None:
+		"""Start the clock.
+
+		Notes:
+			A request that arrives while the main thread is blocked is only received once it's free again.
+			So whichever of `time_received` and `date_sent` is earlier is used.
+
+		Parameters:
+			time_received: `time.perf_counter()` when the request was received.
+				_When `None`, the request is taken to have been received just now._
+			date_sent: When the client sent the request, from the `date` of its header.
+				_Dates in the future, ex. due to an unsynchronized clock, are ignored._
+		"""
+		self.time_started = time.perf_counter()
+		self.time_received = (
+			self.time_started if time_received is None else time_received
+		)
+		if date_sent is not None:
+			sent_sec = time.time() - date_sent.timestamp()
+			self.time_received = min(
+				self.time_received, self.time_started - max(sent_sec, 0.0)
+			)
+		self.cpu_sec = 0.0
+		self.blocking_sec = 0.0
+		self.max_blocking_sec = 0.0
+		self._step: tuple[float, float] | None = None
+
+	def timed(self, coro: cabc.Coroutine[typ.Any, typ.Any, typ.Any]) -> typ.Any:
+		"""Wrap a coroutine, such that the time of each of its steps is measured when it's awaited."""
+		return _TimedAwaitable(self, coro)
+
+	def finish(
+		self,
+		*,
+		msg_id: str,
+		execution_count: int | None,
+		code: str,
+		status: str,
+	) -> CellTiming:
+		"""Stop the clock, and summarize how long the request took.
+
+		Notes:
+			May be called from within a timed step, ex. just before the reply is sent, in which case the step so far is included.
+		"""
+		time_now = time.perf_counter()
+		cpu_sec, blocking_sec, max_blocking_sec = (
+			self.cpu_sec,
+			self.blocking_sec,
+			self.max_blocking_sec,
+		)
+		if self._step is not None:
+			step_sec = time_now - self._step[0]
+			cpu_sec += time.thread_time() - self._step[1]
+			blocking_sec += step_sec
+			max_blocking_sec = max(max_blocking_sec, step_sec)
+
+		first_line = next((line for line in code.splitlines() if line.strip()), '')
+		return CellTiming(
+			msg_id=msg_id,
+			execution_count=execution_count,
+			code=first_line.strip()[:CODE_PREVIEW_CHARS],
+			status=status,
+			queue_sec=max(self.time_started - self.time_received, 0.0),
+			wall_sec=time_now - self.time_started,
+			cpu_sec=cpu_sec,
+			blocking_sec=blocking_sec,
+			max_blocking_sec=max_blocking_sec,
+		)
+
+	def _begin_step(self) -> bool:
+		"""Mark the start of a step, unless one has already begun.
+
+		Returns:
+			Whether a step was begun, which must then be ended with `_end_step()`.
+		"""
+		if self._step is not None:
+			return False
+		self._step = (time.perf_counter(), time.thread_time())
+		return True
+
+	def _end_step(self) -> None:
+		"""Mark the end of a step, adding up its time."""
+		if self._step is not None:
+			step_sec = time.perf_counter() - self._step[0]
+			self.cpu_sec += time.thread_time() - self._step[1]
+			self.blocking_sec += step_sec
+			self.max_blocking_sec = max(self.max_blocking_sec, step_sec)
+			self._step = None
+
+
+class _TimedAwaitable:
+	"""Awaits a coroutine step by step, timing each step with a `CellClock`."""
+
+	def __init__(
+		self, clock: CellClock, coro: cabc.Coroutine[typ.Any, typ.Any, typ.Any]
+	) -> None:
+		"""Wrap a coroutine."""
+		self._clock = clock
+		self._coro = coro
+
+	def __await__(self) -> cabc.Generator[typ.Any, typ.Any, typ.Any]:
+		"""Drive the coroutine, forwarding what it yields to the awaiting task, and what the task sends back to it."""
+		send_value: typ.Any = None
+		throw_value: BaseException | None = None
+		while True:
+			began_step = self._clock._begin_step()  # noqa: SLF001
+			try:
+				if throw_value is None:
+					yielded = self._coro.send(send_value)
+				else:
+					yielded = self._coro.throw(throw_value)
+			except StopIteration as ex:
+				return ex.value
+			finally:
+				if began_step:
+					self._clock._end_step()  # noqa: SLF001
+
+			try:
+				send_value, throw_value = (yield yielded), None
+			except BaseException as ex:
+				send_value, throw_value = None, ex
+
+
+####################
+# - Magic: %blender_stats
+####################
+def format_summary(summary: CellTimingSummary, *, count: int = 10) -> str:
+	"""Format timings as a plain-text table, for showing in a notebook.
+
+	Parameters:
+		summary: Timings to format.
+		count: Number of most recent cells to list individually.
+	"""
+	lines = [
+		f'{"#":>5} | {"queue":>9} | {"wall":>9} | {"cpu":>9} | {"blocking":>9} | {"longest":>9} | code',
+	]
+	for timing in summary.cells[-count:] if count > 0 else ():
+		lines.append(
+			f'{"-" if timing.execution_count is None else timing.execution_count:>5}'
+			+ ''.join(
+				f' | {1000 * value_sec:>6.1f} ms'
+				for value_sec in (
+					timing.queue_sec,
+					timing.wall_sec,
+					timing.cpu_sec,
+					timing.blocking_sec,
+					timing.max_blocking_sec,
+				)
+			)
+			+ f' | {timing.code}'
+			+ ('' if timing.status == 'ok' else f' [{timing.status}]')
+		)
+
+	lines.append('')
+	lines.append(f'Over the last {len(summary.cells)} cells (p50 / p95 / max):')
+	for label, series in [
+		('Queue Wait', summary.queue_sec),
+		('Wall Time', summary.wall_sec),
+		('Blocking Time', summary.blocking_sec),
+		('Longest Block', summary.max_blocking_sec),
+	]:
+		lines.append(
+			f'  {label + ":":<15}'
+			f'{1000 * series.p50:.1f} / {1000 * series.p95:.1f} / {1000 * series.max:.1f} ms'
+		)
+	return '\n'.join(lines)
+
+
+def blender_stats_magic(store: CellTimingStore, line: str) -> None:
+	"""Implementation of the `%blender_stats` line magic, for a given store.
+
+	Examples:
+		```python
+		%blender_stats        # The last 10 cells, and a summary of all recorded cells.
+		%blender_stats 50     # The last 50 cells.
+		%blender_stats clear  # Forget all recorded cells.
+		```
+
+	Raises:
+		ValueError: If the argument is neither a number, nor `clear`.
+	"""
+	argument = line.strip()
+	if argument == 'clear':
+		store.clear()
+		return
+	if argument and not argument.isdigit():
+		msg = f"%blender_stats takes a number of cells, or 'clear'; not {argument!r}."
+		raise ValueError(msg)
+
+	print(format_summary(store.summary(), count=int(argument) if argument else 10))  # noqa: T201
@@ -16,6 +16,23 @@
 
 """Utilities making it easy to embed an `ipykernel` inside of another Python process.
 
+Notes:
+	Several `IPyKernel`s may run at once, each with their own sockets, connection file and shell namespace.
+	They all share the `asyncio` event loop of the thread that started them.
+
+	`ipykernel` and `IPython` assume that there is only one kernel per process.
+	They store the running `IPKernelApp`, `IPythonKernel` and `InteractiveShell` as singletons, and redirect the process-wide `sys.stdout`, `sys.stderr` and `sys.displayhook`.
+	Therefore, embedded kernels aren't singletons, and a kernel is made **active** just before it handles each shell request.
+	This points all singletons, `sys.std*`, `sys.displayhook` and `sys.modules['__main__']` at it.
+
+	Shell requests are handled one at a time across all kernels, so that a cell which `await`s can't have another kernel activated underneath it.
+	Other `asyncio` tasks keep running while a cell `await`s; their output goes to the kernel that was most recently active.
+
+Attributes:
+	MAX_IPC_PREFIX_LEN: Longest path prefix of `ipc` sockets, to which ex. `-1` is appended per socket.
+		Most platforms limit Unix domain socket paths to 104-108 bytes.
+	PORT_NAMES: Names of the ports in a connection file.
+
 References:
 	- IPyKernel Options: <https://ipython.readthedocs.io/en/stable/config/options/kernel.html#configtrait-IPKernelApp.kernel_class>
 
@@ -24,19 +41,491 @@ See Also:
 	- Jupyter Lab w/Existing Kernels: <https://github.com/jupyterlab/jupyterlab/issues/2044>
 """
 
+import asyncio
+import atexit
+import collections.abc as cabc
 import contextlib
+import datetime
 import functools
 import gc
+import hashlib
+import io
 import ipaddress
 import json
+import logging
+import os
+import socket
+import sqlite3
 import sys
+import tempfile
 import threading
+import time
+import types
 import typing as typ
+import weakref
 from pathlib import Path
 
 import pydantic as pyd
+import traitlets
+import typing_extensions as typ_ext
 import zmq
+from ipykernel.ipkernel import IPythonKernel
 from ipykernel.kernelapp import IPKernelApp
+from ipykernel.zmqshell import ZMQInteractiveShell
+from traitlets.config import SingletonConfigurable
+
+from ..standalone import import_standalone
+from .bulk_data import BulkData
+from .cell_timings import (
+	METADATA_KEY,
+	CellClock,
+	CellTimingStore,
+	CellTimingSummary,
+	blender_stats_magic,
+)
+from .memory_reclaim import MemoryReclaim, ReclaimStats
+from .output_history import BoundedDisplayHook, memory_magic
+from .output_policy import (
+	CellOutputStats,
+	CoalescingOutStream,
+	OutputLimiter,
+	OutputPolicy,
+)
+from .scene_batching import batch, batch_magic
+from .shared_array_comm import COMM_TARGET, SharedArrayExchange
+from .shared_array_comm import open_comm as open_shared_array_comm
+from .time_slicing import sliced
+
+P = typ.ParamSpec('P')
+R = typ.TypeVar('R')
+
+####################
+# - Singletons
+####################
+_DISPATCH_LOCKS: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]' = weakref.WeakKeyDictionary()
+
+MAX_IPC_PREFIX_LEN: int = 96
+PORT_NAMES: tuple[str, ...] = (
+	'shell_port',
+	'iopub_port',
+	'stdin_port',
+	'control_port',
+	'hb_port',
+)
+
+_HOOKS_LOCK = threading.Lock()
+_NUM_HOOKED_KERNELS: int = 0
+_THREAD_METHODS: tuple[typ.Any, typ.Any] | None = None
+_MAIN_MODULE: types.ModuleType | None = None
+_EXCEPTHOOK: typ.Any = None
+_FD_CAPTURE_OWNER: 'IPyKernel | None' = None
+
+
+def _make_current(instance: SingletonConfigurable) -> None:
+	"""Make `instance` the singleton of its class, and of all singleton classes that it inherits from.
+
+	Notes:
+		Mirrors what `SingletonConfigurable.instance()` does when first creating an instance.
+	"""
+	for cls in type(instance)._walk_mro():  # noqa: SLF001
+		cls._instance = instance
+
+
+def _clear_current(instance: SingletonConfigurable) -> None:
+	"""Stop `instance` from being the singleton of any class.
+
+	Notes:
+		Unlike `SingletonConfigurable.clear_instance()`, singletons of other embedded kernels are left alone.
+	"""
+	for cls in type(instance)._walk_mro():  # noqa: SLF001
+		if cls._instance is instance:
+			cls._instance = None
+
+
+def _hook_interpreter() -> None:
+	"""Prepare for a kernel that is about to be started.
+
+	Notes:
+		Every `IPythonKernel` wraps `threading.Thread.run` and `threading.Thread.__init__`, including those wrapped by earlier kernels.
+		Every shell also replaces `sys.modules['__main__']` with its own namespace, and every `IPKernelApp` replaces `sys.excepthook`.
+		The originals are saved when the first of several coexisting kernels is started.
+	"""
+	global _NUM_HOOKED_KERNELS, _THREAD_METHODS, _MAIN_MODULE, _EXCEPTHOOK  # noqa: PLW0603
+
+	with _HOOKS_LOCK:
+		if _NUM_HOOKED_KERNELS == 0:
+			_THREAD_METHODS = (threading.Thread.run, threading.Thread.__init__)
+			_MAIN_MODULE = sys.modules.get('__main__')
+			_EXCEPTHOOK = sys.excepthook
+		_NUM_HOOKED_KERNELS += 1
+
+
+def _unhook_interpreter(kernel_app: IPKernelApp) -> None:
+	"""Remove all references, that the interpreter holds, to a kernel that was stopped.
+
+	Notes:
+		The original `threading.Thread` methods and `__main__` module are restored once the last of several coexisting kernels is stopped.
+		The original `sys.excepthook` is restored as soon as it no longer points at the stopped kernel.
+
+		`ipykernel` registers the `IPKernelApp` and its `iopub` thread with `atexit`, which would keep them alive until Blender exits.
+	"""
+	global _NUM_HOOKED_KERNELS, _THREAD_METHODS, _MAIN_MODULE, _EXCEPTHOOK  # noqa: PLW0603
+
+	## No kernel was made when '.initialize()' failed.
+	if kernel_app.kernel is not None:
+		with contextlib.suppress(ValueError):
+			gc.callbacks.remove(kernel_app.kernel._clean_thread_parent_frames)  # noqa: SLF001
+
+	atexit.unregister(kernel_app.close)
+	atexit.unregister(kernel_app.cleanup_connection_file)
+	if kernel_app.iopub_thread is not None:
+		atexit.unregister(kernel_app.iopub_thread.stop)
+
+	with _HOOKS_LOCK:
+		if sys.excepthook == kernel_app.excepthook and _EXCEPTHOOK is not None:
+			sys.excepthook = _EXCEPTHOOK
+
+		_NUM_HOOKED_KERNELS -= 1
+		if _NUM_HOOKED_KERNELS == 0 and _THREAD_METHODS is not None:
+			threading.Thread.run, threading.Thread.__init__ = _THREAD_METHODS
+			_THREAD_METHODS = None
+		if _NUM_HOOKED_KERNELS == 0 and _MAIN_MODULE is not None:
+			sys.modules['__main__'] = _MAIN_MODULE
+			_MAIN_MODULE = None
+		if _NUM_HOOKED_KERNELS == 0:
+			_EXCEPTHOOK = None
+
+
+def _claim_fd_capture(kernel: 'IPyKernel') -> bool:
+	"""Let `kernel` capture the `stdout`/`stderr` file descriptors, unless another running kernel already does.
+
+	Notes:
+		Each capturing kernel redirects the same file descriptors into its own pipe, and echoes to wherever they pointed before.
+		A second one would thus echo into the pipe of the first, which forwards (and echoes) the output of both.
+
+	Returns:
+		Whether `kernel` now captures the file descriptors, and echoes their output.
+	"""
+	global _FD_CAPTURE_OWNER  # noqa: PLW0603
+
+	with _HOOKS_LOCK:
+		if _FD_CAPTURE_OWNER is None:
+			_FD_CAPTURE_OWNER = kernel
+		return _FD_CAPTURE_OWNER is kernel
+
+
+def _release_fd_capture(kernel: 'IPyKernel') -> None:
+	"""Let the next kernel to start capture the `stdout`/`stderr` file descriptors, if `kernel` captured them."""
+	global _FD_CAPTURE_OWNER  # noqa: PLW0603
+
+	with _HOOKS_LOCK:
+		if _FD_CAPTURE_OWNER is kernel:
+			_FD_CAPTURE_OWNER = None
+
+
+def _cancel_thread_tasks(
+	thread: threading.Thread | None, io_loop: typ.Any, *, timeout_sec: float = 1.0
+) -> None:
+	"""Cancel all tasks of the event loop of another thread, waiting until they're done.
+
+	Notes:
+		`ipykernel` stops the event loops of its `control` and `iopub` threads, without finishing their tasks.
+		Otherwise, each of those tasks would warn that it "was destroyed but it is pending", once the stopped kernel is freed.
+
+	Parameters:
+		thread: The thread that runs the event loop.
+			_Nothing is done when it isn't running._
+		io_loop: The `tornado` event loop of the thread.
+		timeout_sec: Longest time to wait for the tasks to finish.
+	"""
+	if thread is None or not thread.is_alive():
+		return
+
+	async def cancel_all() -> None:
+		tasks = [
+			task for task in asyncio.all_tasks() if task is not asyncio.current_task()
+		]
+		for task in tasks:
+			_ = task.cancel()
+		_ = await asyncio.gather(*tasks, return_exceptions=True)
+
+	## A thread that stops by itself meanwhile just leaves its tasks pending.
+	with contextlib.suppress(TimeoutError, RuntimeError):
+		asyncio.run_coroutine_threadsafe(cancel_all(), io_loop.asyncio_loop).result(
+			timeout=timeout_sec
+		)
+
+
+def _close_shell(shell: ZMQInteractiveShell) -> None:
+	"""Close the history of a stopped kernel's shell, stop its background scripts, and forget its `atexit` hooks.
+
+	Notes:
+		Like IPython does at exit, except that the namespaces are left alone, for `MemoryReclaim` to empty.
+		Otherwise, every stopped kernel leaks a history-saving thread and two `sqlite` connections.
+		The shell and thread would also be kept alive by `atexit`, until Blender exits.
+	"""
+	atexit.unregister(shell.atexit_operations)
+
+	## Scripts started by ex. '%%bash --bg' would otherwise only be stopped when Blender exits.
+	script_magics = shell.magics_manager.registry.get('ScriptMagics')
+	if script_magics is not None:
+		atexit.unregister(script_magics.kill_bg_processes)
+		script_magics.kill_bg_processes()
+
+	history_manager = shell.history_manager
+	if history_manager is None:
+		return
+
+	## History is a convenience; failing to write it never prevents a kernel from stopping.
+	with contextlib.suppress(sqlite3.Error):
+		history_manager.end_session()
+
+	save_thread = history_manager.save_thread
+	if save_thread is not None:
+		atexit.unregister(save_thread.stop)
+		save_thread.stop()
+
+	## Without 'sqlite3', the history database is a 'DummyDB', which can't be closed.
+	close_db = getattr(history_manager.db, 'close', None)
+	if close_db is not None:
+		close_db()
+
+
+def _dispatch_lock() -> asyncio.Lock:
+	"""Lock held while any embedded kernel handles a shell request on the running event loop."""
+	return _DISPATCH_LOCKS.setdefault(asyncio.get_running_loop(), asyncio.Lock())
+
+
+class _EmbeddedShell(ZMQInteractiveShell):
+	"""A `ZMQInteractiveShell` that isn't a singleton, so that several may coexist.
+
+	Notes:
+		Its output history is bounded by size, with `BoundedDisplayHook`.
+	"""
+
+	displayhook_class = traitlets.Type(BoundedDisplayHook)
+
+	@typ_ext.override
+	def init_user_ns(self) -> None:
+		"""Initialize the user namespace, including helpers for cells that run in Blender.
+
+		Notes:
+			Also run by `reset()`, so helpers survive warm restarts, while the buffers of `bulk` are freed.
+			Helpers are hidden from ex. `%who`, like IPython's own names.
+		"""
+		super().init_user_ns()
+		self.push(
+			{'batch': batch, 'bulk': BulkData(), 'sliced': sliced}, interactive=False
+		)
+
+	@typ_ext.override
+	async def run_cell_async(self, *args: typ.Any, **kwargs: typ.Any) -> typ.Any:
+		"""Run a cell, timing it with the clock of the request that runs it.
+
+		Notes:
+			`ipykernel` runs cells that use top-level `await` in their own task, whose steps would otherwise go untimed.
+		"""
+		coro = super().run_cell_async(*args, **kwargs)
+		cell_clock = getattr(self.kernel, '_cell_clock', None)
+		if cell_clock is None:
+			return await coro
+		return await cell_clock.timed(coro)
+
+	@classmethod
+	def instance(cls, *args: typ.Any, **kwargs: typ.Any) -> typ.Self:  # pyright: ignore[reportIncompatibleMethodOverride]
+		"""Create a new shell, and make it current."""
+		shell = cls(*args, **kwargs)
+		_make_current(shell)
+		return shell
+
+
+class _EmbeddedKernel(IPythonKernel):
+	"""An `IPythonKernel` that isn't a singleton, so that several may coexist."""
+
+	shell_class = traitlets.Type(_EmbeddedShell)
+	shared_arrays = traitlets.Instance(SharedArrayExchange, args=())
+	cell_timings = traitlets.Instance(CellTimingStore, args=())
+
+	_time_received: float | None = None
+	_cell_clock: CellClock | None = None
+	_dispatch_task: 'asyncio.Task[None] | None' = None
+	_dispatch_stopped: bool = False
+
+	@typ_ext.override
+	def start(self) -> None:
+		"""Start handling requests, serve shared arrays to clients that ask for them, and add this extension's magics.
+
+		Notes:
+			The comm manager is shared by all kernels of the process, so registering the same target again is harmless.
+		"""
+		super().start()
+		self.comm_manager.register_target(COMM_TARGET, open_shared_array_comm)
+		if self.shell is not None:
+			self.shell.register_magic_function(
+				functools.partial(blender_stats_magic, self.cell_timings),
+				magic_kind='line',
+				magic_name='blender_stats',
+			)
+			self.shell.register_magic_function(
+				batch_magic, magic_kind='cell', magic_name='batch'
+			)
+			self.shell.register_magic_function(
+				memory_magic, magic_kind='line', magic_name='memory'
+			)
+
+	@classmethod
+	def instance(cls, *args: typ.Any, **kwargs: typ.Any) -> typ.Self:  # pyright: ignore[reportIncompatibleMethodOverride]
+		"""Create a new kernel, and make it current."""
+		kernel = cls(*args, **kwargs)
+		_make_current(kernel)
+		return kernel
+
+	def activate(self) -> None:
+		"""Point all process-wide state, that `ipykernel` and `IPython` assume to be theirs, at this kernel."""
+		sys.stdout = self._stdout
+		sys.stderr = self._stderr
+		sys.displayhook = self.parent.displayhook
+		if self.shell is not None:
+			sys.modules[self.shell.user_module.__name__] = self.shell.user_module
+			_make_current(self.shell)
+
+		_make_current(self.parent)
+		_make_current(self)
+
+	@typ_ext.override
+	async def dispatch_queue(self) -> None:
+		"""Handle queued requests one at a time, until `stop_dispatch()` is called."""
+		## Scheduled by 'start()', so the kernel may have stopped before this first runs.
+		if self._dispatch_stopped:
+			return
+		self._dispatch_task = asyncio.current_task()
+		await super().dispatch_queue()
+
+	def stop_dispatch(self) -> None:
+		"""Stop handling queued requests, once the kernel's streams are closed.
+
+		Notes:
+			`ipykernel` never stops `dispatch_queue()`, whose task waits for requests forever.
+			`tornado` keeps a reference to all pending tasks, so each stopped kernel would otherwise stay alive.
+		"""
+		self._dispatch_stopped = True
+		if self._dispatch_task is not None:
+			_ = self._dispatch_task.cancel()
+			self._dispatch_task = None
+
+	@typ_ext.override
+	def schedule_dispatch(self, dispatch: typ.Any, *args: typ.Any) -> None:
+		"""Queue a request for handling, noting when shell requests were received."""
+		if dispatch == self.dispatch_shell:
+			args = (*args, time.perf_counter())
+		super().schedule_dispatch(dispatch, *args)
+
+	@typ_ext.override
+	async def dispatch_shell(
+		self, msg: typ.Any, time_received: float | None = None
+	) -> None:
+		"""Activate this kernel, then handle a shell request.
+
+		Notes:
+			Holds the dispatch lock shared by all embedded kernels, so that no other kernel is activated until the request has been fully handled.
+
+		Parameters:
+			msg: The shell request, as received.
+			time_received: `time.perf_counter()` when the request was received.
+		"""
+		async with _dispatch_lock():
+			self.activate()
+			self._time_received = time_received
+			await super().dispatch_shell(msg)
+
+	@typ_ext.override
+	async def execute_request(
+		self, stream: typ.Any, ident: typ.Any, parent: typ.Any
+	) -> None:
+		"""Run a cell, timing how long it takes, and how long it blocks the main thread."""
+		date_sent = parent.get('header', {}).get('date')
+		self._cell_clock = CellClock(
+			self._time_received,
+			date_sent=date_sent if isinstance(date_sent, datetime.datetime) else None,
+		)
+		try:
+			await self._cell_clock.timed(super().execute_request(stream, ident, parent))
+		finally:
+			self._cell_clock = None
+
+	@typ_ext.override
+	def finish_metadata(
+		self, parent: typ.Any, metadata: typ.Any, reply_content: typ.Any
+	) -> typ.Any:
+		"""Record the timing of a cell just before its `execute_reply` is sent, and add it to the reply's metadata."""
+		metadata = super().finish_metadata(parent, metadata, reply_content)
+		if self._cell_clock is not None:
+			content = parent.get('content', {})
+			timing = self._cell_clock.finish(
+				msg_id=parent['header']['msg_id'],
+				execution_count=None
+				if content.get('silent', False)
+				else self.execution_count,
+				code=content.get('code', ''),
+				status=reply_content.get('status', ''),
+			)
+			self.cell_timings.record(timing)
+			metadata[METADATA_KEY] = timing.metadata
+		return metadata
+
+
+def _is_stderr(stream: typ.Any) -> bool:
+	"""Whether a stream writes to the file descriptor of `stderr`."""
+	with contextlib.suppress(AttributeError, OSError, ValueError):
+		return stream.fileno() == sys.__stderr__.fileno()
+	return False
+
+
+class _EmbeddedKernelApp(IPKernelApp):
+	"""An `IPKernelApp` whose log handlers don't close the copy of `stderr` that its output stream made.
+
+	Notes:
+		When capturing file descriptors, `IPKernelApp` reroutes log handlers of `stderr` to a file wrapping that copy, so that logging isn't captured.
+		That file would close the copy once garbage collected, ex. after the next kernel replaced the (shared) log handlers.
+		Then, the output stream closes it again, by which time the number may refer to another file (ex. a `zmq` socket).
+	"""
+
+	_log_streams: tuple[typ.TextIO, ...] = ()
+
+	@typ_ext.override
+	def init_io(self) -> None:
+		"""Redirect the output streams, and reroute log handlers of `stderr` to a file that leaves the copy of `stderr` open."""
+		handlers = [
+			handler
+			for handler in self.log.handlers
+			if isinstance(handler, logging.StreamHandler)
+		]
+		for handler in handlers:
+			self.log.removeHandler(handler)
+		try:
+			super().init_io()
+		finally:
+			for handler in handlers:
+				self.log.addHandler(handler)
+
+		fd_copy = getattr(sys.stderr, '_original_stdstream_copy', None)
+		if fd_copy is None:
+			return
+		for handler in handlers:
+			if _is_stderr(handler.stream):
+				log_stream = io.TextIOWrapper(io.FileIO(fd_copy, 'w', closefd=False))
+				_ = handler.setStream(log_stream)
+				self._log_streams = (*self._log_streams, log_stream)
+
+	def restore_log_streams(self) -> None:
+		"""Point log handlers that were rerouted by `init_io()` back at `sys.__stderr__`."""
+		for handler in self.log.handlers:
+			if (
+				isinstance(handler, logging.StreamHandler)
+				and handler.stream in self._log_streams
+			):
+				_ = handler.setStream(sys.__stderr__)
+		self._log_streams = ()
 
 
 ####################
@@ -51,7 +540,9 @@ class JupyterKernelConnectionInfo(pyd.BaseModel, frozen=True):
 	Attributes:
 		kernel_name: Name of the kernel.
 		ip: The IP address that the kernel binds ports to.
+			_With `ipc` transport, this is instead the path prefix of the kernel's Unix domain sockets._
 		shell_port: Port of the kernel shell socket.
+			_With `ipc` transport, ports are instead suffixes of socket paths, ex. `{ip}-{shell_port}`._
 		iopub_port: Port of the kernel iopub socket.
 		stdin_port: Port of the kernel stdin socket.
 		control_port: Port of the kernel control socket.
@@ -62,7 +553,7 @@ class JupyterKernelConnectionInfo(pyd.BaseModel, frozen=True):
 
 	"""
 
-	ip: ipaddress.IPv4Address | ipaddress.IPv4Address
+	ip: ipaddress.IPv4Address | ipaddress.IPv6Address | Path
 
 	shell_port: int
 	iopub_port: int
@@ -71,7 +562,7 @@ class JupyterKernelConnectionInfo(pyd.BaseModel, frozen=True):
 	hb_port: int
 
 	key: pyd.SecretStr
-	transport: typ.Literal['tcp']
+	transport: typ.Literal['tcp', 'ipc']
 	signature_scheme: typ.Literal['hmac-sha256']
 
 	kernel_name: str
@@ -106,28 +597,125 @@ class JupyterKernelConnectionInfo(pyd.BaseModel, frozen=True):
 			return cls(**json.load(f))
 
 
+####################
+# - Stable Connections
+####################
+def _is_port_free(transport: str, ip: str, port: int) -> bool:
+	"""Whether a socket of the given transport could be bound to `port` right now.
+
+	Notes:
+		Like `zmq`, `SO_REUSEADDR` is set outside of Windows, so that ports of a just-stopped kernel count as free.
+	"""
+	if port <= 0:
+		return False
+	if transport == 'ipc':
+		return not Path(f'{ip}-{port}').exists()
+
+	family = socket.AF_INET6 if ':' in ip else socket.AF_INET
+	with socket.socket(family, socket.SOCK_STREAM) as sock:
+		if os.name != 'nt':
+			sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+		try:
+			sock.bind((ip, port))
+		except OSError:
+			return False
+	return True
+
+
+def _write_private(path: Path, text: str) -> None:
+	"""Write a file that only the current user may read, since it contains a kernel's key."""
+	path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+	fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+	with os.fdopen(fd, 'w', encoding='utf-8') as f:
+		_ = f.write(text)
+
+
+####################
+# - Class: Lifecycle Timings
+####################
+class IPyKernelTimings(pyd.BaseModel, frozen=True):
+	"""How long the most recent lifecycle operations of an `IPyKernel` took.
+
+	Attributes:
+		start_sec: Seconds taken by the most recent `IPyKernel.start()`.
+		stop_sec: Seconds taken by the most recent `IPyKernel.stop()`, to close the kernel.
+			_Excludes reclaiming its memory, which is usually deferred._
+		restart_sec: Seconds taken by the most recent `IPyKernel.restart()`.
+		restart_warm: Whether the most recent `IPyKernel.restart()` was warm.
+		reclaim: What reclaiming the memory of the most recently stopped kernel did, once it's done.
+	"""
+
+	start_sec: float | None = None
+	stop_sec: float | None = None
+	restart_sec: float | None = None
+	restart_warm: bool | None = None
+	reclaim: ReclaimStats | None = None
+
+
 ####################
 # - Class: IPyKernel
 ####################
+def _notifies_lifecycle(
+	method: 'cabc.Callable[typ.Concatenate[IPyKernel, P], R]',
+) -> 'cabc.Callable[typ.Concatenate[IPyKernel, P], R]':
+	"""Call `IPyKernel.on_lifecycle` after the decorated lifecycle method, even if it failed."""
+
+	@functools.wraps(method)
+	def wrapper(self: 'IPyKernel', *args: P.args, **kwargs: P.kwargs) -> R:
+		try:
+			return method(self, *args, **kwargs)
+		finally:
+			if self.on_lifecycle is not None:
+				self.on_lifecycle()
+
+	return wrapper
+
+
 class IPyKernel(pyd.BaseModel):
 	"""An embeddable `ipykernel`, which wraps `ipykernel.kernelapp.IPKernelApp` in a clean, friendly interface.
 
 	Attributes:
 		path_connection_file: Path to the connection file to create
 			_`.start()` will overwrite this file._
+		capture_fd_output: Whether to also forward output written directly to the process' `stdout`/`stderr` file descriptors, ex. by C extensions.
+			_Only one running kernel does this, since each would redirect the same file descriptors._
+			_Kernels started while another one does this neither capture nor echo, until they are restarted after it stopped._
+		transport: How clients connect to the kernel.
+			`tcp` binds five ports on the loopback interface.
+			`ipc` instead binds five Unix domain sockets next to the connection file, which is faster, and needs no ports.
+			_`ipc` is only for clients on the same machine, and isn't available on all platforms._
+		output_policy: How `stdout`/`stderr` output of cells is coalesced and limited.
+		on_lifecycle: Called after each `.start()`, `.stop()` and `.restart()`, even if it failed, ex. to publish the kernel's new state.
+			_Called without holding `_lock`, so it may use the kernel's properties._
+		stable_connection_file: Where to keep the ports and key of the most recent run, so that `.start()` reuses them.
+			Clients that were connected before then reconnect by themselves, within their usual heartbeat retries.
+			_The file is locked to the process that saved it, while that process is alive; other processes neither reuse nor overwrite it._
+			_Should any port be taken by then, or while the kernel binds it, all ports and the key are replaced._
+			_When `None`, each start uses new ports and a new key._
 
 		_lock: Blocks the use of `_is_running` while `.start()` or `.stop()` are working.
 		_kernel_app: Running embedded `IPKernelApp`, if any is running.
+		_timings: How long the most recent lifecycle operations took.
+		_output_limiter: Applies `output_policy` to the output of the running kernel, if any is running.
+		_reclaim: Reclaims the memory of the most recently stopped kernel, if it was ever stopped.
 
 	"""
 
 	path_connection_file: Path
+	capture_fd_output: bool = True
+	transport: typ.Literal['tcp', 'ipc'] = 'tcp'
+	output_policy: OutputPolicy = OutputPolicy()
+	on_lifecycle: cabc.Callable[[], None] | None = None
+	stable_connection_file: Path | None = None
 
 	####################
 	# - Internal State
 	####################
 	_lock: threading.Lock = pyd.PrivateAttr(default_factory=lambda: threading.Lock())
 	_kernel_app: IPKernelApp | None = pyd.PrivateAttr(default=None)
+	_timings: IPyKernelTimings = pyd.PrivateAttr(default_factory=IPyKernelTimings)
+	_output_limiter: OutputLimiter | None = pyd.PrivateAttr(default=None)
+	_reclaim: MemoryReclaim | None = pyd.PrivateAttr(default=None)
 
 	####################
 	# - Properties: Locked
@@ -149,9 +737,191 @@ class IPyKernel(pyd.BaseModel):
 			msg = "Connection information can't be parsed for IPyKernel, since it's not running."
 			raise ValueError(msg)
 
+	####################
+	# - Properties: Unlocked
+	####################
+	@property
+	def timings(self) -> IPyKernelTimings:
+		"""How long the most recent lifecycle operations took."""
+		return self._timings
+
+	@property
+	def output_stats(self) -> list[CellOutputStats]:
+		"""How the output of the most recent cells was coalesced and limited, from oldest to newest.
+
+		Notes:
+			Empty when the kernel isn't running.
+		"""
+		if self._output_limiter is None:
+			return []
+		return self._output_limiter.stats()
+
+	@property
+	def cell_timings(self) -> CellTimingSummary:
+		"""How long the most recent cells took, and how long they blocked the main thread.
+
+		Notes:
+			Summarizing sorts the timings, so avoid calling this very often (ex. more than once per redraw).
+			Empty when the kernel isn't running.
+		"""
+		if self._kernel_app is None:
+			return CellTimingSummary()
+		return self._kernel_app.kernel.cell_timings.summary()
+
+	@property
+	def pending_reclaim(self) -> 'asyncio.Future[ReclaimStats] | None':
+		"""Completes once the memory of the most recently stopped kernel is reclaimed, if that's still in progress."""
+		if self._reclaim is None or self._reclaim.done:
+			return None
+		return self._reclaim.schedule()
+
+	@property
+	def ipc_prefix(self) -> Path:
+		"""Path prefix of this kernel's sockets, when using `ipc` transport.
+
+		Notes:
+			Sockets are placed next to the connection file, like `ipykernel` does.
+			When that path is too long for a socket path, a short path in the temporary directory is used instead.
+		"""
+		ipc_prefix = self.path_connection_file.with_name(
+			self.path_connection_file.stem + '-ipc'
+		)
+		if len(str(ipc_prefix)) <= MAX_IPC_PREFIX_LEN:
+			return ipc_prefix
+
+		path_hash = hashlib.sha256(str(self.path_connection_file).encode()).hexdigest()
+		return Path(tempfile.gettempdir()) / f'bpy_jupyter-{path_hash[:16]}-ipc'
+
+	####################
+	# - Methods: Stable Connection
+	####################
+	def _read_stable_connection(self) -> dict[str, typ.Any] | None:
+		"""Read the ports and key of the most recent run from `stable_connection_file`, unless another process owns it.
+
+		Notes:
+			The file is shared by all processes that use the same path, ex. several Blender processes of one user.
+			Only the process that saved it most recently may reuse or overwrite it, until that process is no longer alive.
+
+		Returns:
+			The contents of `stable_connection_file`, or `None` if it doesn't exist, can't be read, or is owned by another live process.
+		"""
+		if self.stable_connection_file is None:
+			return None
+
+		try:
+			previous = json.loads(
+				self.stable_connection_file.read_text(encoding='utf-8')
+			)
+		except (OSError, ValueError):
+			return None
+		if not isinstance(previous, dict):
+			return None
+
+		pid = previous.get('pid')
+		if (
+			isinstance(pid, int)
+			and pid != os.getpid()
+			and import_standalone('bpy_jupyter_registry').pid_alive(pid)
+		):
+			return None
+		return previous
+
+	def _reuse_stable_connection(self) -> None:
+		"""Write the ports and key of the most recent run to the connection file, which `IPKernelApp` then loads instead of choosing new ones.
+
+		Notes:
+			Nothing is reused when there was no previous run, its transport differs, `stable_connection_file` can't be read or has no key, or another live process owns it.
+			Nothing is reused either when any of its ports is taken, since whoever took it may be a client holding the key.
+		"""
+		previous = self._read_stable_connection()
+		## Never reuse an empty key, which would disable message authentication.
+		if (
+			previous is None
+			or previous.get('transport') != self.transport
+			or not previous.get('key')
+		):
+			return
+
+		ip = str(self.ipc_prefix) if self.transport == 'ipc' else previous.get('ip')
+		ports = {name: previous.get(name) for name in PORT_NAMES}
+		if not all(
+			isinstance(port, int) and _is_port_free(self.transport, str(ip), port)
+			for port in ports.values()
+		):
+			return
+
+		info: dict[str, typ.Any] = {
+			'ip': ip,
+			'transport': self.transport,
+			'key': previous['key'],
+			'signature_scheme': previous.get('signature_scheme', 'hmac-sha256'),
+			'kernel_name': previous.get('kernel_name', ''),
+			**ports,
+		}
+		_write_private(self.path_connection_file, json.dumps(info, indent=1))
+
+	def _save_stable_connection(self) -> None:
+		"""Keep the ports and key of this run in `stable_connection_file`, so that the next `.start()` reuses them.
+
+		Notes:
+			The file also records this process's ID, which locks it to this process while it's alive.
+			_A file owned by another live process is left alone._
+		"""
+		if self.stable_connection_file is None:
+			return
+		if (
+			self.stable_connection_file.exists()
+			and self._read_stable_connection() is None
+		):
+			return
+
+		with contextlib.suppress(OSError, ValueError):
+			info = json.loads(self.path_connection_file.read_text(encoding='utf-8'))
+			_write_private(
+				self.stable_connection_file,
+				json.dumps({**info, 'pid': os.getpid()}, indent=1),
+			)
+
 	####################
 	# - Methods: Lifecycle
 	####################
+	def _initialize_app(self, *, captures_fd: bool) -> IPKernelApp:
+		"""Make and initialize the embedded `IPKernelApp`, which binds its sockets.
+
+		Notes:
+			Not `IPKernelApp.instance()`, so that several kernels can coexist.
+			Each kernel makes itself current when it handles a request.
+
+		Parameters:
+			captures_fd: Whether the kernel captures (and echoes) output written to the `stdout`/`stderr` file descriptors.
+
+		Raises:
+			zmq.ZMQError: If a socket couldn't be bound.
+				_Whatever the `IPKernelApp` made until then is closed, and unhooked from the interpreter._
+		"""
+		_hook_interpreter()
+		kernel_app = _EmbeddedKernelApp(
+			connection_file=str(self.path_connection_file),
+			quiet=not captures_fd,
+			capture_fd_output=captures_fd,
+			kernel_class=_EmbeddedKernel,
+			outstream_class=f'{CoalescingOutStream.__module__}.{CoalescingOutStream.__qualname__}',
+			transport=self.transport,
+			**({'ip': str(self.ipc_prefix)} if self.transport == 'ipc' else {}),
+		)
+		_make_current(kernel_app)
+		try:
+			kernel_app.initialize([sys.executable])
+		except zmq.ZMQError:
+			## Sockets are bound before the 'iopub' thread, heartbeat or output streams are started.
+			if kernel_app.context is not None:
+				kernel_app.context.destroy(linger=0)
+			_clear_current(kernel_app)
+			_unhook_interpreter(kernel_app)
+			raise
+		return kernel_app
+
+	@_notifies_lifecycle
 	def start(self) -> None:
 		"""Start this Jupyter kernel.
 
@@ -159,37 +929,85 @@ class IPyKernel(pyd.BaseModel):
 			An `asyncio` event loop **must be available** before kernel requests can be handled, since the embedded `IPKernelApp` uses this to `await` client requests.
 
 		Raises:
-			ValueError: If an `IPyKernel` is already running.
+			ValueError: If an `IPyKernel` is already running, or `ipc` transport was requested on a platform without it.
+			zmq.ZMQError: If the sockets couldn't be bound, even to new ports.
 		"""
+		if self.transport == 'ipc' and not zmq.has('ipc'):
+			msg = "IPyKernel can't use 'ipc' transport, since it isn't supported by ZeroMQ on this platform."
+			raise ValueError(msg)
+
 		with self._lock:
 			if self._kernel_app is None:
+				time_start = time.perf_counter()
+
 				# Reset the Cached Property
 				# - First new use will wait for the lock we currently hold.
+				## Each separately, since either may not be cached.
 				with contextlib.suppress(AttributeError):
 					del self.is_running
+				with contextlib.suppress(AttributeError):
 					del self.connection_info
 
 				####################
 				# - Start the Kernel w/o sys.stdout Suppression
 				####################
-				self._kernel_app = IPKernelApp.instance(
-					connection_file=str(self.path_connection_file),
-					quiet=False,
-				)
-				self._kernel_app.initialize([sys.executable])
+				self._reuse_stable_connection()
+				captures_fd = self.capture_fd_output and _claim_fd_capture(self)
+				try:
+					self._kernel_app = self._initialize_app(captures_fd=captures_fd)
+				except zmq.ZMQError:
+					# Retry w/New Ports and Key
+					## Reason: Reused ports may be taken between checking and binding them.
+					## Without a connection file, 'IPKernelApp' chooses random ports, and a new key.
+					self.path_connection_file.unlink(missing_ok=True)
+					try:
+						self._kernel_app = self._initialize_app(captures_fd=captures_fd)
+					except zmq.ZMQError:
+						_release_fd_capture(self)
+						raise
+
+				# Coalesce and Limit Output
+				## The kernel captured the streams made by 'outstream_class' while initializing.
+				self._output_limiter = OutputLimiter(self.output_policy)
+				for stream in (
+					self._kernel_app.kernel._stdout,  # noqa: SLF001
+					self._kernel_app.kernel._stderr,  # noqa: SLF001
+				):
+					if isinstance(stream, CoalescingOutStream):
+						stream.set_limiter(self._output_limiter)
+
+				# Bound the Output History
+				displayhook = self._kernel_app.kernel.shell.displayhook
+				if isinstance(displayhook, BoundedDisplayHook):
+					displayhook.max_bytes = self.output_policy.max_history_bytes
+
 				self._kernel_app.kernel.start()
+				self._save_stable_connection()
+
+				self._timings = self._timings.model_copy(
+					update={'start_sec': time.perf_counter() - time_start}
+				)
 
 			else:
 				msg = "IPyKernel can't be started, since it's already running."
 				raise ValueError(msg)
 
-	def stop(self) -> None:
+	@_notifies_lifecycle
+	def stop(self, *, defer_reclaim: bool = True) -> None:  # noqa: PLR0915
 		"""Stop this Jupyter kernel.
 
 		Notes:
 			Unfortunately, `IPKernelApp` doesn't provide any kind of `stop()` function.
 			Therefore, this method involves a LOT of manual hijinks and hacks used in order to cleanly stop and vacuum the running kernel.
 
+			Sockets are closed right away, while the kernel's namespace and output history are only emptied afterwards, by a `MemoryReclaim`.
+			By default, it runs in small steps on the current `asyncio` event loop, which must keep running until `pending_reclaim` completes.
+			_How long each phase took, and what it reclaimed, is recorded in `timings`._
+
+		Parameters:
+			defer_reclaim: Whether to reclaim memory in steps on the event loop.
+				_When `False`, memory is reclaimed before returning, ex. when no event loop will run anymore._
+
 		Raises:
 			ValueError: If an `IPyKernel` is not already running.
 			RuntimeErorr: If the `IPKernelApp` doesn't shut down before the timeout.
@@ -212,10 +1030,14 @@ class IPyKernel(pyd.BaseModel):
 		## That doesn't mean it isn't nice!
 		with self._lock:
 			if self._kernel_app is not None:
+				time_start = time.perf_counter()
+
 				# Reset the Cached Property
 				# - First new use will wait for the lock we currently hold.
+				## Each separately, since either may not be cached.
 				with contextlib.suppress(AttributeError):
 					del self.is_running
+				with contextlib.suppress(AttributeError):
 					del self.connection_info
 
 				####################
@@ -225,6 +1047,30 @@ class IPyKernel(pyd.BaseModel):
 				# Then getting eaten by an oversized frog.
 				# Who lived on that lillypad. Ergo the irritation.
 
+				# Activate the Kernel
+				## Reason: The rest of this method assumes that sys.std* are ours.
+				## With several embedded kernels, another one may be active.
+				self._kernel_app.kernel.activate()
+
+				# Collect the Namespaces to Reclaim
+				## Reason: Emptying them is what frees the user's data, which may take long.
+				shell = self._kernel_app.kernel.shell
+				namespaces = [
+					shell.user_ns,
+					shell.user_ns_hidden,
+					shell.history_manager.output_hist,
+				]
+
+				# Close the Shell
+				## Reason: Otherwise, its history thread, database connections and 'atexit' hooks outlive the kernel.
+				_close_shell(shell)
+				del shell
+
+				# Destroy Shared Arrays
+				## Reason: Otherwise, shared memory segments outlive the kernel, which is the only one that may destroy them.
+				## Clients are told by closing their comms, while 'iopub' is still open.
+				self._kernel_app.kernel.shared_arrays.close()
+
 				# Don't delete this print.
 				## Things break if one deletes this print.
 				## Yes, things are otherwise robust (so far)!
@@ -263,7 +1109,8 @@ class IPyKernel(pyd.BaseModel):
 				## Reason: Otherwise, kernel stop/start retains state ex. set variables.
 				## Singletons are, after all, magically resurrected.
 				## OOP was a mistake.
-				self._kernel_app.kernel.shell_class.clear_instance()
+				## Only if it's ours: Other embedded kernels may still be running.
+				_clear_current(self._kernel_app.kernel.shell)
 
 				# Flush and close all the ZMQ streams manually.
 				## Reason: Otherwise, ZMQSocket file descriptors don't close.
@@ -276,6 +1123,21 @@ class IPyKernel(pyd.BaseModel):
 				self._kernel_app.kernel.debugpy_stream.flush()
 				self._kernel_app.kernel.debugpy_stream.close(linger=0)
 
+				# Stop Handling Requests
+				## Reason: Otherwise, the task that waits for requests keeps the whole kernel alive.
+				self._kernel_app.kernel.stop_dispatch()
+
+				# Cancel the Tasks of the 'control' and 'iopub' Threads
+				## Reason: Otherwise, .close() stops their event loops with tasks still pending.
+				_cancel_thread_tasks(
+					self._kernel_app.control_thread,
+					getattr(self._kernel_app.control_thread, 'io_loop', None),
+				)
+				_cancel_thread_tasks(
+					self._kernel_app.iopub_thread.thread,
+					self._kernel_app.iopub_thread.io_loop,
+				)
+
 				# Trigger the Official close(). It does a lot. It is not sufficient.
 				## It does a lot. It is far from sufficient.
 				## The ordering of when this is called was determined by brute-force testing.
@@ -286,31 +1148,140 @@ class IPyKernel(pyd.BaseModel):
 				## "Just" flushing stdout/stderr wasn't good enough.
 				## So the print() remains.
 
+				# Restore the Log Streams
+				## Reason: Log handlers may still write to the copy of 'stderr', which is closed with the output streams.
+				self._kernel_app.restore_log_streams()
+
+				# Close the Output Streams
+				## Reason: .reset_io() only restores sys.std*, not the stdout/stderr file descriptors.
+				## With 'capture_fd_output', these otherwise stay redirected into a pipe, watched by a thread.
+				## Every later kernel would then capture the pipe of the previous one, echoing output ever more often.
+				for stream in (
+					self._kernel_app.kernel._stdout,  # noqa: SLF001
+					self._kernel_app.kernel._stderr,  # noqa: SLF001
+				):
+					if isinstance(stream, CoalescingOutStream):
+						stream.close()
+
+				# Release the File Descriptors
+				## Reason: Otherwise, no later kernel captures them, even once this one stopped.
+				_release_fd_capture(self)
+
 				# Manual: Close Connection File
 				## Reason: Otherwise, the connection.json file just sticks around forever.
 				## Best to delete it so nobody can use it, since its claims are no longer valid.
+				## With 'ipc' transport, this also deletes the socket files.
 				self._kernel_app.cleanup_connection_file()
 
 				# Clear Singleton Instances
 				## Reason: Otherwise, the now-defunct IPKernel and IPKernelApp are resurrected.
 				## Singletons are, after all, magically resurrected.
 				## OOP was a mistake.
-				self._kernel_app.kernel.clear_instance()
-				self._kernel_app.clear_instance()
+				_clear_current(self._kernel_app.kernel)
+				_clear_current(self._kernel_app)
+
+				# Unhook the Kernel from the Interpreter
+				## Reason: Otherwise, every stopped kernel stays referenced forever.
+				_unhook_interpreter(self._kernel_app)
 
 				# Delete the KernelApp
 				## Reason: The semantics of `del` w/0 refs can often be more concrete.
 				## Another example of defensive coding.
 				_kernel = self._kernel_app
 				self._kernel_app = None
+				self._output_limiter = None
 				del _kernel
 
-				# Force a Global GC
+				# Reclaim Memory
 				## Reason: We just orphaned a bunch of refs which may monopolize system resources.
 				## Examples: Lingering FDs. Whatever the user executed in `shell_class`.
-				## "Delete whenever" feels insufficient. Whatever ought to go should go now.
-				_ = gc.collect()
+				## Freeing it all at once (ex. with a full GC) can freeze Blender for seconds.
+				## So it's done in steps, unless nothing will run them.
+				self._reclaim = MemoryReclaim(namespaces)
+				del namespaces
+				self._timings = self._timings.model_copy(
+					update={
+						'stop_sec': time.perf_counter() - time_start,
+						'reclaim': None,
+					}
+				)
+				if defer_reclaim:
+					self._reclaim.schedule().add_done_callback(self._record_reclaim)
+				else:
+					self._timings = self._timings.model_copy(
+						update={'reclaim': self._reclaim.run()}
+					)
 
 			else:
 				msg = "IPyKernel can't be stopped, since it's not running."
 				raise ValueError(msg)
+
+	async def stop_async(self) -> ReclaimStats:
+		"""Stop this Jupyter kernel, then wait until its memory is reclaimed.
+
+		Notes:
+			Must be awaited on the event loop that runs the kernel.
+
+		Returns:
+			What reclaiming the kernel's memory did, and how long it took.
+
+		Raises:
+			ValueError: If an `IPyKernel` is not already running.
+		"""
+		self.stop()
+		if self._reclaim is None:
+			return ReclaimStats(done=True)
+		return await self._reclaim.schedule()
+
+	def _record_reclaim(self, future: 'asyncio.Future[ReclaimStats]') -> None:
+		"""Record the statistics of a deferred reclaim, once it's done."""
+		if not future.cancelled() and future.exception() is None:
+			self._timings = self._timings.model_copy(
+				update={'reclaim': future.result()}
+			)
+
+	@_notifies_lifecycle
+	def restart(self, *, warm: bool = True) -> None:
+		"""Restart this Jupyter kernel, giving clients a fresh namespace.
+
+		Notes:
+			A **warm** restart keeps the `IPKernelApp`, its sockets, its ports and its connection file.
+			Only the shell is reset, which clears the user namespace, output history and execution count.
+			Connected clients therefore stay connected, and the restart takes milliseconds.
+
+			A **cold** restart is exactly `.stop()` followed by `.start()`.
+			All sockets are rebuilt with new ports, so all clients must re-read the connection file.
+			_With `stable_connection_file`, the ports and key are reused instead, so clients reconnect by themselves._
+
+		Parameters:
+			warm: Whether to do a warm restart.
+
+		Raises:
+			ValueError: If an `IPyKernel` is not already running.
+
+		References:
+			- `InteractiveShell.reset()`: <https://ipython.readthedocs.io/en/stable/api/generated/IPython.core.interactiveshell.html#IPython.core.interactiveshell.InteractiveShell.reset>
+		"""
+		time_start = time.perf_counter()
+		if warm:
+			with self._lock:
+				if self._kernel_app is None:
+					msg = "IPyKernel can't be restarted, since it's not running."
+					raise ValueError(msg)
+
+				# Reset the Shell Environment
+				## The shell_class singleton remains; its namespaces are re-initialized.
+				## This also resets history, 'Out', and the execution count.
+				self._kernel_app.kernel.activate()
+				self._kernel_app.kernel.shell.reset(new_session=True, aggressive=False)
+
+		else:
+			self.stop()
+			self.start()
+
+		self._timings = self._timings.model_copy(
+			update={
+				'restart_sec': time.perf_counter() - time_start,
+				'restart_warm': warm,
+			}
+		)
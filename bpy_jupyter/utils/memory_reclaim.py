@@ -0,0 +1,284 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Reclaims the memory of a stopped kernel in small steps, so that Blender's main thread is never blocked for long.
+
+## Motivation
+When a kernel stops, its namespace (ex. large `numpy` arrays), output history and shell all become garbage at once.
+Freeing all of it, followed by a full `gc.collect()`, can freeze Blender for seconds.
+
+`MemoryReclaim` instead runs in two phases, each split into steps:
+
+- **`drop`**: Removes the entries of the namespaces one by one, for at most `budget_ms` per step.
+	Most objects are freed right away by reference counting, without any garbage collection.
+- **`gc`**: Collects each generation of the garbage collector in its own step, from youngest to oldest.
+	_The final, full collection can't be split: It scans every tracked object of the process, including Blender's own, which takes ex. ~20 ms._
+
+When scheduled on an `asyncio` event loop, each step is a timer that's due right away, instead of a ready callback.
+So, with `bpy_jupyter.services.async_event_loop`, whose ticks only keep iterating while callbacks are ready, one step runs per tick, in between which Blender stays responsive.
+
+Attributes:
+	DEFAULT_BUDGET_MS: Default milliseconds that each step of the `drop` phase may take.
+	MAX_SAMPLED_ITEMS: Default number of elements per container, that `estimate_nbytes()` counts.
+"""
+
+import asyncio
+import collections.abc as cabc
+import contextlib
+import dataclasses
+import gc
+import itertools
+import sys
+import time
+import typing as typ
+
+DEFAULT_BUDGET_MS = 4.0
+MAX_SAMPLED_ITEMS = 256
+
+
+####################
+# - Statistics
+####################
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class ReclaimStats:
+	"""What reclaiming the memory of a stopped kernel did, and how long it took.
+
+	Attributes:
+		dropped_names: Number of namespace entries that were removed.
+		dropped_bytes: Estimated bytes of the removed values.
+			_See `estimate_nbytes()`._
+		collected_objects: Number of unreachable objects found by the garbage collector.
+		drop_sec: Seconds spent in the `drop` phase, summed over its steps.
+		gc_sec: Seconds spent in the `gc` phase, summed over its steps.
+		max_step_sec: Seconds taken by the longest step.
+		steps: Number of steps that ran.
+		done: Whether all memory was reclaimed.
+	"""
+
+	dropped_names: int = 0
+	dropped_bytes: int = 0
+	collected_objects: int = 0
+	drop_sec: float = 0.0
+	gc_sec: float = 0.0
+	max_step_sec: float = 0.0
+	steps: int = 0
+	done: bool = False
+
+
+def estimate_nbytes(
+	value: typ.Any, *, max_depth: int = 2, max_items: int = MAX_SAMPLED_ITEMS
+) -> int:
+	"""Estimate the memory used by a value, including that of the values it contains.
+
+	Notes:
+		Uses `.nbytes` where available (ex. `numpy` arrays, `memoryview`s), and `.memory_usage()` of ex. `pandas` objects.
+		Otherwise, `sys.getsizeof()` is used, to which the elements of lists, tuples, sets and dicts are added.
+
+		Large containers are estimated from their first `max_items` elements, and nesting is followed for `max_depth` levels.
+		So, the result is an estimate: Shared elements are counted each time, while references beyond `max_depth` aren't counted.
+
+	Parameters:
+		value: The value to estimate.
+		max_depth: Levels of nested containers whose elements are counted.
+		max_items: Elements of each container that are counted, from which the rest are extrapolated.
+	"""
+	nbytes = getattr(value, 'nbytes', None)
+	if isinstance(nbytes, int):
+		return nbytes
+
+	memory_usage = getattr(value, 'memory_usage', None)
+	if callable(memory_usage) and not isinstance(value, type):
+		with contextlib.suppress(Exception):
+			usage = memory_usage()
+			return int(usage.sum() if hasattr(usage, 'sum') else usage)
+
+	try:
+		size = sys.getsizeof(value)
+	except TypeError:
+		return 0
+	if max_depth <= 0 or not isinstance(value, list | tuple | set | frozenset | dict):
+		return size
+
+	elements = value.items() if isinstance(value, dict) else value
+	sampled_bytes = 0
+	sampled_items = 0
+	for element in itertools.islice(elements, max_items):
+		sampled_bytes += estimate_nbytes(
+			element, max_depth=max_depth - 1, max_items=max_items
+		)
+		sampled_items += 1
+
+	if sampled_items == 0:
+		return size
+	return size + sampled_bytes * len(value) // sampled_items
+
+
+####################
+# - Class: Memory Reclaim
+####################
+class MemoryReclaim:
+	"""Empties namespaces, then collects garbage, in steps that each take little time.
+
+	Notes:
+		The namespaces are emptied in place.
+		So, they must no longer be used by anything else, ex. by a running shell.
+	"""
+
+	def __init__(
+		self,
+		namespaces: cabc.Iterable[cabc.MutableMapping[typ.Any, typ.Any]],
+		*,
+		budget_ms: float = DEFAULT_BUDGET_MS,
+	) -> None:
+		"""Prepare to reclaim the memory held by the given namespaces.
+
+		Parameters:
+			namespaces: Mappings to empty, ex. a shell's `user_ns` and output history.
+				_Mappings that appear more than once are only emptied once._
+			budget_ms: Milliseconds that each step of the `drop` phase may take.
+		"""
+		self.budget_ms = budget_ms
+		self._namespaces = list({id(ns): ns for ns in namespaces}.values())
+		self._generations = list(range(len(gc.get_count())))
+		self._stats = ReclaimStats()
+		self._future: asyncio.Future[ReclaimStats] | None = None
+
+	@property
+	def stats(self) -> ReclaimStats:
+		"""What was reclaimed so far."""
+		return self._stats
+
+	@property
+	def done(self) -> bool:
+		"""Whether all memory was reclaimed."""
+		return self._stats.done
+
+	####################
+	# - Steps
+	####################
+	def step(self) -> bool:
+		"""Run one step of reclaiming memory.
+
+		Returns:
+			Whether all memory was reclaimed.
+		"""
+		if self._stats.done:
+			return True
+
+		time_start = time.perf_counter()
+		if self._namespaces:
+			dropped_names, dropped_bytes = self._drop(
+				deadline=time_start + self.budget_ms / 1000
+			)
+			step_sec = time.perf_counter() - time_start
+			self._stats = dataclasses.replace(
+				self._stats,
+				dropped_names=self._stats.dropped_names + dropped_names,
+				dropped_bytes=self._stats.dropped_bytes + dropped_bytes,
+				drop_sec=self._stats.drop_sec + step_sec,
+			)
+		else:
+			collected_objects = gc.collect(self._generations.pop(0))
+			step_sec = time.perf_counter() - time_start
+			self._stats = dataclasses.replace(
+				self._stats,
+				collected_objects=self._stats.collected_objects + collected_objects,
+				gc_sec=self._stats.gc_sec + step_sec,
+			)
+
+		self._stats = dataclasses.replace(
+			self._stats,
+			max_step_sec=max(self._stats.max_step_sec, step_sec),
+			steps=self._stats.steps + 1,
+			done=not self._namespaces and not self._generations,
+		)
+		return self._stats.done
+
+	def _drop(self, *, deadline: float) -> tuple[int, int]:
+		"""Remove namespace entries until the deadline, returning how many were removed and their estimated bytes.
+
+		Notes:
+			At least one entry is removed per call, so that every step makes progress.
+		"""
+		dropped_names = 0
+		dropped_bytes = 0
+		while self._namespaces:
+			namespace = self._namespaces[0]
+			if not namespace:
+				_ = self._namespaces.pop(0)
+				continue
+
+			## Checked after emptied namespaces are removed, so that no step is left with nothing to drop.
+			if dropped_names > 0 and time.perf_counter() >= deadline:
+				break
+
+			_, value = namespace.popitem()
+			dropped_names += 1
+			dropped_bytes += estimate_nbytes(value)
+			## Frees the value right away, unless something else still refers to it.
+			del value
+
+		return dropped_names, dropped_bytes
+
+	def run(self) -> ReclaimStats:
+		"""Run all remaining steps right away, ex. when no event loop will run them."""
+		while not self.step():
+			pass
+		if self._future is not None and not self._future.done():
+			self._future.set_result(self._stats)
+		return self._stats
+
+	####################
+	# - Scheduling
+	####################
+	def schedule(
+		self, loop: asyncio.AbstractEventLoop | None = None
+	) -> 'asyncio.Future[ReclaimStats]':
+		"""Run one step per iteration of an event loop, until all memory is reclaimed.
+
+		Notes:
+			Steps are scheduled with `loop.call_later(0, ...)`, which isn't ready until the next iteration.
+			_With `loop.call_soon()`, one pump tick would keep running steps for its whole `drain_budget_sec`._
+
+		Parameters:
+			loop: The event loop to run steps on.
+				_When `None`, the current event loop is used._
+
+		Returns:
+			A future of the final statistics, which may be awaited or given callbacks.
+		"""
+		if self._future is None:
+			loop = asyncio.get_event_loop() if loop is None else loop
+			self._future = loop.create_future()
+			_ = loop.call_later(0, self._scheduled_step)
+		return self._future
+
+	def _scheduled_step(self) -> None:
+		"""Run one step, then schedule the next one, unless all memory was reclaimed."""
+		future = self._future
+		if future is None or future.done():
+			return
+
+		try:
+			done = self.step()
+		except Exception as ex:
+			future.set_exception(ex)
+			return
+
+		if done:
+			future.set_result(self._stats)
+		else:
+			_ = future.get_loop().call_later(0, self._scheduled_step)
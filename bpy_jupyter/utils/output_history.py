@@ -0,0 +1,244 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Bounds the memory held by the output history of an embedded shell, and reports the memory held by its namespace.
+
+## Motivation
+IPython keeps every displayed result of a cell in `Out`, as well as in `_<n>` and `_`, `__` and `___`.
+Only the number of results is limited, so a few displayed arrays can pin gigabytes for as long as the kernel runs.
+In Blender sessions that run for days, this grows without bound.
+
+## Eviction
+`BoundedDisplayHook` estimates the size of each result, with `estimate_nbytes()`.
+Once all results together exceed `max_bytes`, the least recently displayed results are evicted, until they fit again.
+Evicting a result removes it from `Out`, `_<n>`, and from `_`, `__` and `___` where they refer to it.
+
+Results that are displayed again (ex. by evaluating `Out[3]`) count as recently used, and are only counted once.
+The most recent result is never evicted, so that `_` always works.
+
+## Reporting
+The `%memory` magic lists the variables of the namespace by their estimated size, followed by the size of the output history:
+
+```python
+%memory      # The 20 largest variables.
+%memory 50   # The 50 largest variables.
+```
+
+Notes:
+	Evicted results are only freed when nothing else refers to them, ex. a variable they were assigned to.
+
+Attributes:
+	DEFAULT_MAX_BYTES: Default bytes of results that the output history may hold.
+"""
+
+import dataclasses
+import typing as typ
+
+import traitlets
+import typing_extensions as typ_ext
+from ipykernel.displayhook import ZMQShellDisplayHook
+
+from .memory_reclaim import estimate_nbytes
+
+DEFAULT_MAX_BYTES = 512 * 1024**2
+_UNDERSCORES = ('_', '__', '___')
+_UNITS = ('B', 'KiB', 'MiB', 'GiB', 'TiB')
+
+
+####################
+# - Statistics
+####################
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class OutputHistoryStats:
+	"""How much memory the output history holds, and how much was evicted.
+
+	Attributes:
+		entries: Number of results in `Out`.
+		nbytes: Estimated bytes of all results in `Out`.
+		max_bytes: Bytes of results that `Out` may hold.
+			_When `None`, the output history isn't bounded by size._
+		evicted_entries: Number of results that were evicted so far.
+		evicted_bytes: Estimated bytes of all results that were evicted so far.
+	"""
+
+	entries: int = 0
+	nbytes: int = 0
+	max_bytes: int | None = None
+	evicted_entries: int = 0
+	evicted_bytes: int = 0
+
+
+####################
+# - Class: Bounded Display Hook
+####################
+class BoundedDisplayHook(ZMQShellDisplayHook):
+	"""A display hook whose output history is evicted by size, least recently displayed first.
+
+	Attributes:
+		max_bytes: Bytes of results that the output history may hold.
+			_When `None`, only IPython's own limit on the number of results applies._
+	"""
+
+	max_bytes = traitlets.Integer(DEFAULT_MAX_BYTES, allow_none=True)
+
+	def __init__(self, *args: typ.Any, **kwargs: typ.Any) -> None:
+		"""Initialize the display hook, with an empty output history."""
+		super().__init__(*args, **kwargs)
+		self._sizes: dict[int, int] = {}
+		self._evicted_entries = 0
+		self._evicted_bytes = 0
+
+	def stats(self) -> OutputHistoryStats:
+		"""How much memory the output history holds, and how much was evicted."""
+		history = self._history()
+		return OutputHistoryStats(
+			entries=len(history),
+			nbytes=sum(self._sizes.get(n, 0) for n in history),
+			max_bytes=self.max_bytes,
+			evicted_entries=self._evicted_entries,
+			evicted_bytes=self._evicted_bytes,
+		)
+
+	def _history(self) -> dict[int, typ.Any]:
+		"""The output history, aka. `Out`."""
+		return self.shell.user_ns.get('_oh', {})
+
+	####################
+	# - Overrides
+	####################
+	@typ_ext.override
+	def update_user_ns(self, result: typ.Any) -> None:
+		"""Add a result to the output history, then evict the least recently displayed results that don't fit."""
+		super().update_user_ns(result)
+
+		history = self._history()
+		if history.get(self.prompt_count) is not result:
+			return
+
+		## A result that's displayed again is only counted for its most recent display.
+		for n in self._sizes:
+			if n in history and history[n] is result:
+				self._sizes[n] = 0
+		self._sizes[self.prompt_count] = estimate_nbytes(result)
+		self.evict()
+
+	@typ_ext.override
+	def flush(self) -> None:
+		"""Clear the output history, ex. on `%reset` or warm restarts."""
+		super().flush()
+		self._sizes.clear()
+
+	####################
+	# - Eviction
+	####################
+	def evict(self) -> None:
+		"""Evict the least recently displayed results, until the output history fits in `max_bytes`."""
+		history = self._history()
+		for n in [n for n in self._sizes if n not in history]:
+			## Removed by IPython, ex. when culling by number of results.
+			del self._sizes[n]
+
+		if self.max_bytes is None:
+			return
+
+		nbytes = sum(self._sizes.values())
+		while nbytes > self.max_bytes and len(self._sizes) > 1:
+			n = min(self._sizes)
+			size = self._sizes.pop(n)
+			self._evict_entry(n)
+			nbytes -= size
+			self._evicted_entries += 1
+			self._evicted_bytes += size
+
+	def _evict_entry(self, n: int) -> None:
+		"""Remove a result from `Out`, `_<n>`, and `_`, `__` and `___` where they refer to it."""
+		user_ns = self.shell.user_ns
+		history = self._history()
+		result = history.pop(n, None)
+		if user_ns.get(f'_{n}') is result:
+			_ = user_ns.pop(f'_{n}', None)
+
+		## Results that were displayed again are still referred to by their newer entry.
+		if any(value is result for value in history.values()):
+			return
+		for underscores in _UNDERSCORES:
+			if getattr(self, underscores) is result:
+				setattr(self, underscores, '')
+				if user_ns.get(underscores) is result:
+					user_ns[underscores] = ''
+
+
+####################
+# - Magic
+####################
+def format_nbytes(nbytes: int) -> str:
+	"""Format a number of bytes with a binary unit, ex. `1.5 MiB`."""
+	exponent = min((max(nbytes, 1).bit_length() - 1) // 10, len(_UNITS) - 1)
+	if exponent == 0:
+		return f'{nbytes} B'
+	return f'{nbytes / 1024**exponent:.1f} {_UNITS[exponent]}'
+
+
+def memory_magic(line: str) -> None:
+	"""Implementation of the `%memory` line magic.
+
+	Examples:
+		```python
+		%memory      # The 20 largest variables, and the size of the output history.
+		%memory 50   # The 50 largest variables.
+		```
+
+	Raises:
+		ValueError: If the argument isn't a number.
+	"""
+	from IPython.core.getipython import get_ipython
+
+	argument = line.strip()
+	if argument and not argument.isdigit():
+		msg = f'%memory takes a number of variables; not {argument!r}.'
+		raise ValueError(msg)
+	count = int(argument) if argument else 20
+
+	shell = get_ipython()
+	sizes = sorted(
+		(
+			(estimate_nbytes(value), name, type(value).__name__)
+			for name, value in shell.user_ns.items()
+			if not name.startswith('_') and name not in shell.user_ns_hidden
+		),
+		reverse=True,
+	)
+
+	lines = [f'{"variable":<24} | {"type":<16} | {"size":>10}']
+	lines.extend(
+		f'{name:<24} | {type_name:<16} | {format_nbytes(nbytes):>10}'
+		for nbytes, name, type_name in sizes[:count]
+	)
+	lines.append('')
+	lines.append(
+		f'{len(sizes)} variables: {format_nbytes(sum(nbytes for nbytes, _, _ in sizes))}'
+	)
+
+	if isinstance(shell.displayhook, BoundedDisplayHook):
+		stats = shell.displayhook.stats()
+		budget = (
+			'unbounded' if stats.max_bytes is None else format_nbytes(stats.max_bytes)
+		)
+		lines.append(
+			f'Output history: {stats.entries} results, {format_nbytes(stats.nbytes)} of {budget}'
+			f' ({stats.evicted_entries} evicted, {format_nbytes(stats.evicted_bytes)})'
+		)
+	print('\n'.join(lines))  # noqa: T201
@@ -0,0 +1,333 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Coalesces and limits the `stdout`/`stderr` output that an embedded kernel sends over `iopub`.
+
+## Motivation
+A cell that prints in a tight loop can freeze Blender and its notebook frontend alike.
+Every write is buffered, every flush is signed, and every resulting `stream` message must be rendered by the frontend.
+
+Therefore, embedded kernels replace `ipykernel`'s `OutStream` with `CoalescingOutStream`, which follows an `OutputPolicy`:
+
+- **Batching**: Writes are merged into one message per `flush_interval_sec`, or sooner once `max_batch_chars` are buffered.
+- **Rate Limiting**: Output beyond `max_chars_per_sec` is dropped, until the rate falls again.
+- **Truncation**: Output of a cell beyond `max_cell_chars` is dropped.
+
+Whenever output is dropped, a short marker is written in its place, once per cell and reason.
+How many writes were merged, and how much output was dropped, is counted per cell in `CellOutputStats`.
+
+Notes:
+	Sizes are counted in characters, which equal bytes for ASCII output.
+
+Attributes:
+	STATS_WINDOW: Number of most recent cells whose output statistics are retained.
+"""
+
+import collections
+import dataclasses
+import io
+import os
+import sys
+import threading
+import time
+import typing as typ
+
+import pydantic as pyd
+import typing_extensions as typ_ext
+from ipykernel.iostream import OutStream
+
+from .output_history import DEFAULT_MAX_BYTES as DEFAULT_MAX_HISTORY_BYTES
+
+STATS_WINDOW = 64
+
+
+####################
+# - Class: Output Policy
+####################
+class OutputPolicy(pyd.BaseModel, frozen=True):
+	"""How the output of an embedded kernel is coalesced and limited.
+
+	Attributes:
+		flush_interval_sec: Longest time that written output is buffered, before it's sent as one message.
+		max_batch_chars: Buffered characters per stream, beyond which output is sent without waiting for `flush_interval_sec`.
+		max_chars_per_sec: Sustained output rate, beyond which output is dropped.
+			_Bursts of up to one second's worth are allowed._
+			_When `None`, the output rate isn't limited._
+		max_cell_chars: Characters of output per cell, beyond which further output of that cell is dropped.
+			_When `None`, output isn't truncated._
+		max_history_bytes: Estimated bytes of displayed results kept in `Out`, beyond which the least recently displayed are evicted.
+			See `bpy_jupyter.utils.output_history.BoundedDisplayHook`.
+			_When `None`, results are only limited by their number._
+	"""
+
+	flush_interval_sec: pyd.PositiveFloat = 0.1
+	max_batch_chars: pyd.PositiveInt = 64 * 1024
+	max_chars_per_sec: pyd.PositiveInt | None = 1_000_000
+	max_cell_chars: pyd.PositiveInt | None = 10_000_000
+	max_history_bytes: pyd.PositiveInt | None = DEFAULT_MAX_HISTORY_BYTES
+
+
+class CellOutputStats(pyd.BaseModel, frozen=True):
+	"""How the output of one cell was coalesced and limited.
+
+	Attributes:
+		msg_id: ID of the request that ran the cell.
+		writes: Number of writes to `stdout` or `stderr`.
+		messages: Number of `stream` messages sent.
+		sent_chars: Characters of output that were kept, and sent.
+		dropped_chars: Characters of output that were dropped.
+		rate_limited: Whether output was dropped by the rate limit.
+		truncated: Whether output was dropped, since the cell exceeded `max_cell_chars`.
+	"""
+
+	msg_id: str
+	writes: int = 0
+	messages: int = 0
+	sent_chars: int = 0
+	dropped_chars: int = 0
+	rate_limited: bool = False
+	truncated: bool = False
+
+	@property
+	def merged(self) -> int:
+		"""Number of writes that were merged into another write's message."""
+		return max(self.writes - self.messages, 0)
+
+
+####################
+# - Class: Output Limiter
+####################
+@dataclasses.dataclass(kw_only=True, slots=True)
+class _CellCounters:
+	"""Mutable counterpart of `CellOutputStats`."""
+
+	writes: int = 0
+	messages: int = 0
+	sent_chars: int = 0
+	dropped_chars: int = 0
+	rate_limited: bool = False
+	truncated: bool = False
+
+
+class OutputLimiter:
+	"""Applies an `OutputPolicy` to all output streams of one kernel, counting what happens to each cell's output.
+
+	Notes:
+		Writes may come from any thread, while messages are counted on the `iopub` thread.
+		All state is therefore guarded by a lock.
+	"""
+
+	def __init__(self, policy: OutputPolicy) -> None:
+		"""Initialize the limiter, with a full rate limit budget."""
+		self.policy = policy
+		self._lock = threading.Lock()
+		self._cells: collections.OrderedDict[str, _CellCounters] = (
+			collections.OrderedDict()
+		)
+		self._budget_chars = float(policy.max_chars_per_sec or 0)
+		self._budget_time = time.monotonic()
+
+	def _cell(self, msg_id: str) -> _CellCounters:
+		"""Counters of a cell, retaining only the `STATS_WINDOW` most recent cells."""
+		cell = self._cells.get(msg_id)
+		if cell is None:
+			cell = self._cells[msg_id] = _CellCounters()
+			while len(self._cells) > STATS_WINDOW:
+				_ = self._cells.popitem(last=False)
+		return cell
+
+	def admit(self, msg_id: str, string: str) -> str:
+		"""Decide how much of a write to keep.
+
+		Parameters:
+			msg_id: ID of the request that ran the cell which is writing.
+			string: What was written.
+
+		Returns:
+			What to actually write, which may be truncated, empty, or include a marker explaining why output was dropped.
+		"""
+		with self._lock:
+			cell = self._cell(msg_id)
+			cell.writes += 1
+			if cell.truncated:
+				cell.dropped_chars += len(string)
+				return ''
+
+			# Truncation
+			marker = ''
+			max_cell_chars = self.policy.max_cell_chars
+			if (
+				max_cell_chars is not None
+				and cell.sent_chars + len(string) > max_cell_chars
+			):
+				kept = string[: max(max_cell_chars - cell.sent_chars, 0)]
+				cell.dropped_chars += len(string) - len(kept)
+				cell.truncated = True
+				string = kept
+				marker = f'\n[Output truncated after {max_cell_chars} characters. Further output of this cell is dropped.]\n'
+
+			# Rate Limiting
+			## Token bucket, which may go into debt for writes larger than what's left.
+			max_chars_per_sec = self.policy.max_chars_per_sec
+			if max_chars_per_sec is not None and string:
+				now = time.monotonic()
+				self._budget_chars = min(
+					self._budget_chars + (now - self._budget_time) * max_chars_per_sec,
+					float(max_chars_per_sec),
+				)
+				self._budget_time = now
+
+				if self._budget_chars > 0:
+					self._budget_chars -= len(string)
+				else:
+					cell.dropped_chars += len(string)
+					string = ''
+					if not cell.rate_limited:
+						cell.rate_limited = True
+						marker += f'\n[Output exceeds {max_chars_per_sec} characters per second. Some output of this cell is dropped.]\n'
+
+			cell.sent_chars += len(string)
+			return string + marker
+
+	def count_message(self, msg_id: str) -> None:
+		"""Count a `stream` message sent for a cell."""
+		with self._lock:
+			self._cell(msg_id).messages += 1
+
+	def stats(self) -> list[CellOutputStats]:
+		"""Output statistics of the most recent cells, from oldest to newest."""
+		with self._lock:
+			return [
+				CellOutputStats(msg_id=msg_id, **dataclasses.asdict(cell))
+				for msg_id, cell in self._cells.items()
+			]
+
+
+####################
+# - Class: Coalescing OutStream
+####################
+class CoalescingOutStream(OutStream):
+	"""An `OutStream` that coalesces and limits its output, according to the `OutputLimiter` of its kernel.
+
+	Notes:
+		Until `limiter` is set, this behaves exactly like `OutStream`.
+		Set `IPKernelApp.outstream_class` to the dotted name of this class to use it.
+		Unlike `OutStream`, closing it also closes the pipe that captures output written to file descriptors.
+
+	Attributes:
+		limiter: Limiter shared by the `stdout` and `stderr` of one kernel.
+	"""
+
+	limiter: OutputLimiter | None = None
+	_batch_chars: int = 0
+	_batch_flush_pending: bool = False
+
+	def set_limiter(self, limiter: OutputLimiter) -> None:
+		"""Start coalescing and limiting output according to a limiter."""
+		self.limiter = limiter
+		self.flush_interval = limiter.policy.flush_interval_sec
+
+	@typ_ext.override
+	def write(self, string: str) -> int | None:
+		"""Write to the stream, keeping only what the limiter admits.
+
+		Notes:
+			Once `max_batch_chars` are buffered, a flush is scheduled on the `iopub` thread right away.
+			Once the `iopub` thread has stopped, ex. after the kernel was stopped, flushing is left to `OutStream`.
+			_Otherwise, the flush would run in the writing thread, and fail on the closed socket._
+		"""
+		if self.limiter is None or not isinstance(string, str):
+			return super().write(string)
+
+		## Empty writes are passed on too, since OutStream relies on them to schedule flushes.
+		admitted = self.limiter.admit(self.parent_header.get('msg_id', ''), string)
+		_ = super().write(admitted)
+		if admitted:
+			pub_thread = self.pub_thread
+			if pub_thread is None or not pub_thread.thread.is_alive():
+				return len(string)
+
+			with self._buffer_lock:
+				self._batch_chars += len(admitted)
+				flush_now = (
+					self._batch_chars >= self.limiter.policy.max_batch_chars
+					and not self._batch_flush_pending
+				)
+				if flush_now:
+					self._batch_flush_pending = True
+
+			if flush_now:
+				pub_thread.schedule(self._flush)
+
+		return len(string)
+
+	@typ_ext.override
+	def _flush_buffers(self) -> typ.Iterator[tuple[dict[str, typ.Any], str]]:
+		"""Clear the buffers, yielding their data by parent, and counting a message per parent."""
+		with self._buffer_lock:
+			self._batch_chars = 0
+			self._batch_flush_pending = False
+
+		for parent, data in super()._flush_buffers():
+			if data and self.limiter is not None:
+				self.limiter.count_message(parent.get('msg_id', ''))
+			yield parent, data
+
+	@typ_ext.override
+	def _setup_stream_redirects(self, name: str) -> None:
+		"""Redirect the file descriptor of `sys.<name>` into a pipe, which a thread watches for output.
+
+		Notes:
+			Like `OutStream`, except that the write end of the pipe is closed right away, since the redirected file descriptor now refers to it.
+			`OutStream` never closes either end of the pipe, which would leak both each time a kernel stops.
+		"""
+		pipe_read, pipe_write = os.pipe()
+		fd = self._original_stdstream_fd = getattr(sys, name).fileno()
+		self._original_stdstream_copy = os.dup(fd)
+		os.dup2(pipe_write, fd)
+		os.close(pipe_write)
+
+		self._fid = pipe_read
+		self._exc = None
+		self.watch_fd_thread = threading.Thread(target=self._watch_pipe_fd, daemon=True)
+		self.watch_fd_thread.start()
+
+	@typ_ext.override
+	def close(self) -> None:
+		"""Close the stream, restoring the file descriptor that it redirected, and closing the read end of its pipe.
+
+		Notes:
+			When echoing to the redirected stream, `OutStream` echoes to a file wrapping its copy of the original file descriptor.
+			Both would close that copy, the file only once it's garbage collected, by which time the number may refer to another file (ex. a `zmq` socket).
+			Therefore, the file is closed here instead, while `OutStream` closes a duplicate of the copy.
+		"""
+		watched = self._should_watch
+		echo = self.echo
+		owns_echo = (
+			watched
+			and isinstance(echo, io.TextIOWrapper)
+			and not echo.closed
+			and echo.fileno() == self._original_stdstream_copy
+		)
+		if owns_echo:
+			self._original_stdstream_copy = os.dup(self._original_stdstream_copy)
+
+		super().close()
+		if owns_echo:
+			echo.close()
+			self.echo = None
+		if watched:
+			os.close(self._fid)
@@ -0,0 +1,216 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Batches bulk scene edits from notebook cells, deferring depsgraph evaluation and redraws until they're done.
+
+## Motivation
+Cells that edit thousands of objects spend much of their time on work that's only needed once, at the end:
+
+- **Depsgraph Evaluation**: Each `bpy.ops` call evaluates the view layer before and after running its operator.
+- **Redraws**: Cells that `await` return control to Blender between steps, which then evaluates the depsgraph and redraws.
+
+Within a `batch()`, both are deferred until the batch ends, after which the view layer is evaluated once:
+
+```python
+with batch(undo='Scatter Cubes'):
+	for i in range(1000):
+		bpy.ops.mesh.primitive_cube_add(location=(i, 0, 0))
+```
+
+The same can be done for a whole cell with the `%%batch` cell magic, whose line is the optional undo message:
+
+```python
+%%batch Scatter Cubes
+for i in range(1000):
+	bpy.ops.mesh.primitive_cube_add(location=(i, 0, 0))
+```
+
+## Deferring Evaluation
+`bpy.ops` evaluates the view layer around each call using `bpy.ops._BPyOpsSubModOp._view_layer_update`.
+A batch replaces it with a function that only counts the deferred evaluations, and restores it when the batch ends.
+
+Operators that rely on evaluated data of earlier edits (ex. of modifiers, or constraints) may therefore behave differently within a batch.
+Evaluation can still be forced within a batch, with `bpy.context.view_layer.update()`.
+
+## Deferring Redraws
+While a batch is active, `bpy_jupyter.services.async_event_loop` keeps running the event loop instead of returning control to Blender.
+So, Blender neither evaluates the depsgraph nor redraws between the steps of a cell that `await`s within a batch.
+_Blender's UI is unresponsive meanwhile, for at most `PumpPolicy.max_batch_hold_sec` at a time._
+
+## Undo
+Edits made from Python only become undoable with the next undo step.
+When `undo` is given, a single undo step with that message is pushed when the batch ends, so that all edits of the batch are undone together.
+
+Notes:
+	Batches may be nested, in which case only the outermost batch defers and evaluates.
+	Undo steps are only pushed by the outermost batch, with its own message, or else that of the first nested batch that has one.
+
+	`bpy` is imported lazily, so that this module can be imported (ex. by `bpy_jupyter.utils.ipykernel`) outside of Blender.
+
+Attributes:
+	_ACTIVE: The outermost active batch, if any.
+"""
+
+import time
+import typing as typ
+
+####################
+# - Globals
+####################
+_ACTIVE: 'SceneBatch | None' = None
+
+
+####################
+# - Class: Scene Batch
+####################
+class SceneBatch:
+	"""Defers depsgraph evaluation and redraws while active, then evaluates once, and optionally pushes one undo step.
+
+	Attributes:
+		undo: Message of the undo step to push when the batch ends.
+			_When `None`, no undo step is pushed._
+		update: Whether to evaluate the view layer when the batch ends.
+		deferred_updates: Number of view layer evaluations that were deferred.
+		duration_sec: Seconds from entering the batch, to the end of its final evaluation.
+	"""
+
+	def __init__(self, *, undo: str | None = None, update: bool = True) -> None:
+		"""Prepare a batch, which is only started once entered."""
+		self.undo = undo
+		self.update = update
+		self.deferred_updates = 0
+		self.duration_sec = 0.0
+
+		self._outer: SceneBatch | None = None
+		self._time_start = 0.0
+		self._view_layer_update: staticmethod[..., None] | None = None
+
+	def __enter__(self) -> typ.Self:
+		"""Start deferring, unless an outer batch already does."""
+		global _ACTIVE  # noqa: PLW0603
+
+		self._time_start = time.perf_counter()
+		self._outer = _ACTIVE
+		if self._outer is not None:
+			if self._outer.undo is None:
+				self._outer.undo = self.undo
+			return self
+
+		import bpy
+
+		## The descriptor itself is kept, so that exactly it can be restored.
+		ops_call = getattr(bpy.ops, '_BPyOpsSubModOp', None)
+		view_layer_update = (
+			vars(ops_call).get('_view_layer_update') if ops_call else None
+		)
+		if isinstance(view_layer_update, staticmethod):
+			self._view_layer_update = view_layer_update
+			ops_call._view_layer_update = staticmethod(self._defer_update)  # pyright: ignore[reportOptionalMemberAccess]  # noqa: SLF001
+
+		_ACTIVE = self
+		return self
+
+	def __exit__(self, *_: object) -> None:
+		"""Stop deferring, then evaluate once and push an undo step; unless an outer batch is still active."""
+		global _ACTIVE  # noqa: PLW0603
+
+		if self._outer is not None:
+			self.duration_sec = time.perf_counter() - self._time_start
+			return
+
+		import bpy
+
+		_ACTIVE = None
+		view_layer_update = self._view_layer_update
+		self._view_layer_update = None
+		try:
+			if view_layer_update is not None:
+				bpy.ops._BPyOpsSubModOp._view_layer_update = view_layer_update  # noqa: SLF001
+
+			## Evaluate like 'bpy.ops' would have, which handles a missing view layer in background mode.
+			if self.update:
+				if view_layer_update is not None:
+					view_layer_update.__func__(bpy.context)
+				elif bpy.context.view_layer is not None:
+					bpy.context.view_layer.update()
+
+			## Undo steps can't be pushed without a window, ex. in background mode.
+			if self.undo is not None and bpy.ops.ed.undo_push.poll():
+				_ = bpy.ops.ed.undo_push(message=self.undo)
+		finally:
+			self.duration_sec = time.perf_counter() - self._time_start
+
+	def _defer_update(self, _context: typ.Any) -> None:
+		"""Count a view layer evaluation of `bpy.ops`, instead of doing it."""
+		self.deferred_updates += 1
+
+
+####################
+# - Batching
+####################
+def batch(*, undo: str | None = None, update: bool = True) -> SceneBatch:
+	"""Batch the scene edits within a `with` block, deferring depsgraph evaluation and redraws until it ends.
+
+	Examples:
+		```python
+		with batch(undo='Move Objects') as scene_batch:
+			for obj in bpy.data.objects:
+				obj.location.z += 1
+		print(scene_batch.deferred_updates, scene_batch.duration_sec)
+		```
+
+	Parameters:
+		undo: Message of a single undo step, which is pushed when the batch ends.
+			_When `None`, no undo step is pushed._
+		update: Whether to evaluate the view layer once, when the batch ends.
+	"""
+	return SceneBatch(undo=undo, update=update)
+
+
+def is_batching() -> bool:
+	"""Whether a batch is active."""
+	return _ACTIVE is not None
+
+
+####################
+# - Magic
+####################
+def batch_magic(line: str, cell: str) -> None:
+	"""Run a cell within a `batch()`, whose undo message is the magic's line.
+
+	Notes:
+		The cell runs synchronously, so it can't use top-level `await`.
+		For cells that do, use `with batch():` instead.
+
+	Examples:
+		```python
+		%%batch Move Objects
+		for obj in bpy.data.objects:
+			obj.location.z += 1
+		```
+
+	Parameters:
+		line: Message of the undo step to push when the batch ends.
+			_When empty, no undo step is pushed._
+		cell: Code of the cell, without the magic's line.
+	"""
+	from IPython.core.getipython import get_ipython
+
+	shell = get_ipython()
+	code = shell.transform_cell(cell)
+	filename = shell.compile.cache(code, shell.execution_count, raw_code=cell)
+	with batch(undo=line.strip() or None), shell.builtin_trap:
+		exec(compile(code, filename, 'exec'), shell.user_global_ns, shell.user_ns)
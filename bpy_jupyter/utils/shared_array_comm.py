@@ -0,0 +1,353 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Exchanges shared-memory arrays between the embedded kernel and notebook clients on the same host.
+
+## Motivation
+Even as raw message buffers (see `bpy_jupyter.utils.binary_buffers`), array data is copied through ZeroMQ at least twice.
+When the client runs on the same machine, this isn't necessary: Both processes can map the same `multiprocessing.shared_memory` segment.
+
+Each embedded kernel therefore has a `SharedArrayExchange`, which clients reach through the `COMM_TARGET` comm target.
+Only the name, shape and dtype of a segment (a `SharedArraySpec`) are ever sent; never its data.
+
+- **Read Direction**: Kernel code publishes an array under a key, ex. with `publish_foreach(mesh.vertices, 'co', key='co', components=3)`, which fills shared memory directly with `foreach_get`.
+	Clients then `acquire` the key, and map the very same memory.
+- **Write Direction**: Clients `allocate` a segment under a key, and write into it.
+	Kernel code then uses it, ex. with `foreach_set(mesh.vertices, 'co', key='positions')`, which reads shared memory directly with `foreach_set`.
+
+## Lifetime
+Segments are reference-counted.
+Binding a segment to a key holds one reference, until the key is rebound or removed.
+Each client `acquire` or `allocate` holds another, until the client `release`s it, or closes its comm.
+Segments are destroyed once no references remain, and all segments are destroyed by `IPyKernel.stop()`.
+
+## Protocol
+Clients send `comm_msg`s whose data is `{'request_id': ..., 'op': ..., **arguments}`, to which the kernel replies with `{'request_id': ..., 'spec': ..., 'error': ...}`:
+
+- `{'op': 'acquire', 'key': ...}`: Reference the segment bound to `key`, replying with its `spec`.
+- `{'op': 'allocate', 'key': ..., 'shape': ..., 'dtype': ...}`: Allocate a zero-initialized segment, bind it to `key`, and reference it, replying with its `spec`.
+- `{'op': 'release', 'name': ...}`: Drop a reference to the segment with name `name`.
+- `{'op': 'list'}`: Reply with `specs`, the specs of all keys.
+
+The standalone `bpy_jupyter_shared` module implements the client side of this protocol.
+
+Attributes:
+	COMM_TARGET: Name of the comm target, which is registered by every embedded kernel.
+		_Must match `bpy_jupyter_shared.COMM_TARGET`._
+"""
+
+import collections
+import collections.abc as cabc
+import dataclasses
+import typing as typ
+
+from .binary_buffers import foreach_get
+from .shared_arrays import SharedArray, SharedArraySpec
+
+if typ.TYPE_CHECKING:
+	import numpy.typing as npt
+
+COMM_TARGET = 'bpy_jupyter.shared_arrays'
+
+
+####################
+# - Class: Shared Array Exchange
+####################
+@dataclasses.dataclass(kw_only=True, slots=True)
+class _Segment:
+	"""A shared array, and the number of references to it."""
+
+	shared: SharedArray
+	refs: int = 0
+
+
+class SharedArrayExchange:
+	"""Shared arrays that one kernel exchanges with its clients, by key.
+
+	Notes:
+		Everything runs on the thread of the kernel's event loop, so no locking is needed.
+	"""
+
+	def __init__(self) -> None:
+		"""Initialize an empty exchange."""
+		self._segments: dict[str, _Segment] = {}
+		self._keys: dict[str, str] = {}
+		self._comms: dict[str, typ.Any] = {}
+		self._comm_refs: dict[str, collections.Counter[str]] = {}
+
+	####################
+	# - Kernel: Publish
+	####################
+	def allocate(
+		self, key: str, shape: cabc.Sequence[int], dtype: 'npt.DTypeLike'
+	) -> SharedArray:
+		"""Allocate a zero-initialized shared array, and bind it to `key`.
+
+		Notes:
+			A segment previously bound to `key` loses that reference, but stays alive for clients that still reference it.
+
+		Parameters:
+			key: Key that clients use to find the array.
+			shape: Shape of the array.
+			dtype: Data type of the array.
+		"""
+		shared = SharedArray(shape, dtype)
+		self._segments[shared.spec.name] = _Segment(shared=shared)
+		self._bind(key, shared.spec.name)
+		return shared
+
+	def publish(self, key: str, array: 'npt.ArrayLike') -> SharedArraySpec:
+		"""Copy an array into a new shared array, and bind it to `key`.
+
+		Notes:
+			Prefer `allocate()` followed by in-place filling, or `publish_foreach()`, which avoid this copy.
+		"""
+		import numpy as np
+
+		source = np.asarray(array)
+		shared = self.allocate(key, source.shape, source.dtype)
+		shared.array[...] = source
+		return shared.spec
+
+	def publish_foreach(
+		self,
+		source: typ.Any,
+		attr: str | None = None,
+		*,
+		key: str | None = None,
+		components: int = 1,
+		dtype: 'npt.DTypeLike' = '<f4',
+	) -> SharedArraySpec:
+		"""Fill a new shared array directly with `foreach_get`, and bind it to `key`.
+
+		Parameters:
+			source: A `bpy` collection or property array; see `binary_buffers.foreach_get()`.
+			attr: Name of the property to get from each element of a collection.
+			key: Key that clients use to find the array.
+				_When `None`, `attr` is used._
+			components: Number of values per element, ex. `3` for vertex coordinates.
+			dtype: Data type of the array.
+		"""
+		shape = (len(source),) if components == 1 else (len(source), components)
+		shared = self.allocate((attr or '') if key is None else key, shape, dtype)
+		_ = foreach_get(source, attr, components=components, out=shared.array)
+		return shared.spec
+
+	####################
+	# - Kernel: Consume
+	####################
+	def array(self, key: str) -> 'npt.NDArray[typ.Any]':
+		"""The shared array bound to `key`, ex. after a client has written into it.
+
+		Notes:
+			The array **must not** be used after `key` is rebound or removed.
+
+		Raises:
+			ValueError: If no array is bound to `key`.
+		"""
+		if key not in self._keys:
+			msg = f'No shared array is bound to key {key!r}.'
+			raise ValueError(msg)
+		return self._segments[self._keys[key]].shared.array
+
+	def foreach_set(
+		self, target: typ.Any, attr: str | None = None, *, key: str
+	) -> None:
+		"""Write the shared array bound to `key` into `bpy` data, directly with `foreach_set`.
+
+		Examples:
+			```python
+			exchange.foreach_set(mesh.vertices, 'co', key='positions')
+			mesh.update()
+			```
+
+		Parameters:
+			target: A `bpy` collection (ex. `mesh.vertices`), or a `bpy` property array (ex. `image.pixels`).
+			attr: Name of the property to set on each element of a collection.
+				_Must be `None` when `target` is a property array._
+			key: Key of the shared array to write.
+		"""
+		array = self.array(key).ravel()
+		if attr is None:
+			target.foreach_set(array)
+		else:
+			target.foreach_set(attr, array)
+
+	def remove(self, key: str) -> None:
+		"""Unbind `key`, destroying its segment unless clients still reference it."""
+		name = self._keys.pop(key, None)
+		if name is not None:
+			self._unref(name)
+
+	def specs(self) -> dict[str, SharedArraySpec]:
+		"""Specs of all bound shared arrays, by key."""
+		return {
+			key: self._segments[name].shared.spec for key, name in self._keys.items()
+		}
+
+	@property
+	def nbytes(self) -> int:
+		"""Total size of all segments that haven't yet been destroyed."""
+		return sum(segment.shared.spec.nbytes for segment in self._segments.values())
+
+	####################
+	# - Lifecycle
+	####################
+	def close(self) -> None:
+		"""Close all comms, and destroy all segments, no matter who references them.
+
+		Notes:
+			Clients that still map a segment keep their mapping, but can no longer attach to it.
+		"""
+		for comm in list(self._comms.values()):
+			comm.close()
+		self._comms.clear()
+		self._comm_refs.clear()
+		self._keys.clear()
+
+		for segment in self._segments.values():
+			segment.shared.unlink()
+		self._segments.clear()
+
+	####################
+	# - Comms
+	####################
+	def open_comm(self, comm: typ.Any, _msg: dict[str, typ.Any]) -> None:
+		"""Serve a client that opened a comm to `COMM_TARGET`."""
+		self._comms[comm.comm_id] = comm
+		self._comm_refs[comm.comm_id] = collections.Counter()
+		comm.on_msg(self._on_comm_msg)
+		comm.on_close(self._on_comm_close)
+
+	def _on_comm_msg(self, msg: dict[str, typ.Any]) -> None:
+		"""Handle a request from a client, and reply to it."""
+		comm_id = msg['content']['comm_id']
+		data = msg['content']['data']
+		reply: dict[str, typ.Any] = {'request_id': data.get('request_id')}
+		try:
+			reply |= self._handle_request(comm_id, data)
+		except (ValueError, TypeError, KeyError) as ex:
+			reply['error'] = str(ex)
+
+		comm = self._comms.get(comm_id)
+		if comm is not None:
+			comm.send(reply)
+
+	def _handle_request(
+		self, comm_id: str, data: dict[str, typ.Any]
+	) -> dict[str, typ.Any]:
+		"""Perform one operation requested by a client.
+
+		Raises:
+			ValueError: If the operation is unknown, or its arguments are invalid.
+		"""
+		refs = self._comm_refs[comm_id]
+		match data.get('op'):
+			case 'acquire':
+				spec = self.specs().get(data['key'])
+				if spec is None:
+					msg = f'No shared array is bound to key {data["key"]!r}.'
+					raise ValueError(msg)
+				self._ref(spec.name)
+				refs[spec.name] += 1
+				return {'spec': dataclasses.asdict(spec)}
+
+			case 'allocate':
+				shared = self.allocate(data['key'], data['shape'], data['dtype'])
+				self._ref(shared.spec.name)
+				refs[shared.spec.name] += 1
+				return {'spec': dataclasses.asdict(shared.spec)}
+
+			case 'release':
+				if refs[data['name']] > 0:
+					refs[data['name']] -= 1
+					self._unref(data['name'])
+				return {}
+
+			case 'list':
+				return {
+					'specs': {
+						key: dataclasses.asdict(spec)
+						for key, spec in self.specs().items()
+					}
+				}
+
+			case op:
+				msg = f'Unknown shared array operation {op!r}.'
+				raise ValueError(msg)
+
+	def _on_comm_close(self, msg: dict[str, typ.Any]) -> None:
+		"""Drop all references held by a client whose comm was closed."""
+		comm_id = msg['content']['comm_id']
+		_ = self._comms.pop(comm_id, None)
+		for name, count in self._comm_refs.pop(comm_id, collections.Counter()).items():
+			for _ in range(count):
+				self._unref(name)
+
+	####################
+	# - Reference Counting
+	####################
+	def _bind(self, key: str, name: str) -> None:
+		"""Bind `key` to a segment, referencing it, and dropping the reference of a previous binding."""
+		self._ref(name)
+		self.remove(key)
+		self._keys[key] = name
+
+	def _ref(self, name: str) -> None:
+		"""Add a reference to a segment."""
+		self._segments[name].refs += 1
+
+	def _unref(self, name: str) -> None:
+		"""Drop a reference to a segment, destroying it when none remain."""
+		segment = self._segments.get(name)
+		if segment is not None:
+			segment.refs -= 1
+			if segment.refs <= 0:
+				del self._segments[name]
+				segment.shared.unlink()
+
+
+####################
+# - Comm Target
+####################
+def open_comm(comm: typ.Any, msg: dict[str, typ.Any]) -> None:
+	"""Comm target handler, which passes new comms to the exchange of the kernel that received them.
+
+	Notes:
+		`ipykernel` has one comm manager per process, which is shared by all embedded kernels.
+		The kernel that received the `comm_open` request is the one that's currently active.
+	"""
+	from ipykernel.kernelbase import Kernel
+
+	kernel = Kernel.instance()
+	comm.kernel = kernel
+	kernel.shared_arrays.open_comm(comm, msg)
+
+
+def current_exchange() -> SharedArrayExchange:
+	"""The exchange of the kernel running this code, ex. a notebook cell.
+
+	Raises:
+		RuntimeError: If not called from code run by an embedded kernel.
+	"""
+	from IPython.core.getipython import get_ipython
+
+	shell = get_ipython()
+	exchange = getattr(getattr(shell, 'kernel', None), 'shared_arrays', None)
+	if exchange is None:
+		msg = "Can't exchange shared arrays, since no embedded Jupyter kernel is running this code."
+		raise RuntimeError(msg)
+	return exchange
@@ -0,0 +1,123 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Arrays backed by `multiprocessing.shared_memory`, which can be handed to other processes without copying or pickling their data.
+
+Notes:
+	Only a small, picklable `SharedArraySpec` (name, shape and dtype) ever crosses process boundaries.
+	It's defined in the standalone `bpy_jupyter_arrays` module (and re-exported here), so that any process can unpickle it.
+	Every process that attaches to the segment gets a `numpy` view of the very same memory.
+
+	`numpy` is imported lazily, so that importing this module stays cheap.
+
+References:
+	- `multiprocessing.shared_memory`: <https://docs.python.org/3/library/multiprocessing.shared_memory.html>
+"""
+
+import collections.abc as cabc
+import contextlib
+import math
+import typing as typ
+from multiprocessing import shared_memory
+
+from ..standalone import import_standalone
+
+if typ.TYPE_CHECKING:
+	import numpy.typing as npt
+	from bpy_jupyter_arrays import SharedArraySpec
+else:
+	## Loaded by its standalone name, so that specs unpickle in processes without 'bpy'.
+	SharedArraySpec = import_standalone('bpy_jupyter_arrays').SharedArraySpec
+
+
+####################
+# - Class: Shared Array
+####################
+class SharedArray:
+	"""A `numpy` array that lives in a shared memory segment owned by this process.
+
+	Notes:
+		The owner is responsible for eventually calling `unlink()`, which destroys the segment for all processes.
+		Use as a context manager to do so automatically.
+
+	Attributes:
+		spec: Picklable description of this array, to send to other processes.
+		array: `numpy` view of the shared memory segment.
+	"""
+
+	def __init__(self, shape: cabc.Sequence[int], dtype: 'npt.DTypeLike') -> None:
+		"""Allocate a new, zero-initialized shared memory array.
+
+		Notes:
+			To fill the array without intermediate copies, write into `self.array` directly, ex. with `collection.foreach_get('co', shared.array.ravel())`.
+
+		Parameters:
+			shape: Shape of the array.
+			dtype: Data type of the array.
+		"""
+		import numpy as np
+
+		np_dtype = np.dtype(dtype)
+		nbytes = math.prod(shape) * np_dtype.itemsize
+
+		self._shm: shared_memory.SharedMemory | None = shared_memory.SharedMemory(
+			create=True, size=max(nbytes, 1)
+		)
+		self.spec: SharedArraySpec = SharedArraySpec(
+			name=self._shm.name, shape=tuple(shape), dtype=np_dtype.str
+		)
+		self.array: np.ndarray[typ.Any, typ.Any] = np.ndarray(
+			self.spec.shape, dtype=np_dtype, buffer=self._shm.buf
+		)
+
+	@classmethod
+	def from_array(cls, array: 'npt.ArrayLike') -> typ.Self:
+		"""Copy an existing array into a new shared memory array."""
+		import numpy as np
+
+		source = np.asarray(array)
+		shared = cls(source.shape, source.dtype)
+		shared.array[...] = source
+		return shared
+
+	@property
+	def is_unlinked(self) -> bool:
+		"""Whether `unlink()` has already been called."""
+		return self._shm is None
+
+	def unlink(self) -> None:
+		"""Release this array, and destroy its shared memory segment for all processes.
+
+		Notes:
+			Calling `unlink()` more than once is a no-op.
+
+			Afterwards, `self.array` is no longer available.
+			Views of it that are still referenced elsewhere remain valid, until they are garbage collected.
+		"""
+		if self._shm is not None:
+			del self.array
+			with contextlib.suppress(BufferError):
+				self._shm.close()
+			self._shm.unlink()
+			self._shm = None
+
+	def __enter__(self) -> typ.Self:
+		"""Use this shared array within a `with` block, which unlinks it at the end."""
+		return self
+
+	def __exit__(self, *_: object) -> None:
+		"""Unlink this shared array."""
+		self.unlink()
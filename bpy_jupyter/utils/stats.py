@@ -0,0 +1,75 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Lightweight summary statistics over bounded series of measurements.
+
+Notes:
+	Measurements are meant to be collected in a `collections.deque(maxlen=...)`, which acts as a fixed-size ring buffer.
+	Summaries are only computed when requested, so that collecting a measurement costs no more than an `append`.
+"""
+
+import collections.abc as cabc
+import dataclasses
+import math
+import typing as typ
+
+
+####################
+# - Class: Series Summary
+####################
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class SeriesSummary:
+	"""Summary statistics of a series of measurements.
+
+	Attributes:
+		count: Number of measurements.
+		mean: Arithmetic mean of the measurements.
+		p50: Median of the measurements.
+		p95: 95th percentile of the measurements.
+		max: Largest measurement.
+	"""
+
+	count: int = 0
+	mean: float = 0.0
+	p50: float = 0.0
+	p95: float = 0.0
+	max: float = 0.0
+
+	@classmethod
+	def from_samples(cls, samples: cabc.Iterable[float]) -> typ.Self:
+		"""Summarize a series of measurements.
+
+		Notes:
+			Percentiles use the nearest-rank method, which never interpolates between measurements.
+
+		Parameters:
+			samples: The measurements to summarize.
+				_May be empty, in which case all statistics are `0`._
+		"""
+		ordered = sorted(samples)
+		if not ordered:
+			return cls()
+
+		def nearest_rank(percentile: float) -> float:
+			return ordered[max(math.ceil(percentile * len(ordered)) - 1, 0)]
+
+		return cls(
+			count=len(ordered),
+			mean=math.fsum(ordered) / len(ordered),
+			p50=nearest_rank(0.50),
+			p95=nearest_rank(0.95),
+			max=ordered[-1],
+		)
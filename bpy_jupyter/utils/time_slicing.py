@@ -0,0 +1,174 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Lets long-running cells process many items, without freezing Blender.
+
+## Motivation
+A cell that processes every object of a large scene holds Blender's main thread until it's done, during which Blender's UI is frozen.
+Yet the work often can't be moved to another thread, since `bpy` must be used from the main thread.
+
+Instead, `sliced()` hands out items one by one, but returns control to the event loop whenever the cell has run for `budget_ms`:
+
+```python
+async for obj in sliced(bpy.data.objects, progress=True):
+	obj.location.z += 1
+```
+
+Since the event loop is pumped by Blender (see `bpy_jupyter.services.async_event_loop`), Blender redraws between slices.
+Only the time spent returning control is lost, so throughput stays close to that of a plain `for` loop.
+
+Notes:
+	Embedded kernels add `sliced` to the namespace of every cell.
+
+	Slices should be longer than `PumpPolicy.drain_budget_sec`, since the pump otherwise runs several slices before Blender may redraw.
+
+## Cancellation
+Control is returned to the event loop with `await`, which is also where the loop may be cancelled:
+
+- **Interrupting the Kernel**: Cancels a cell that uses top-level `await`, which `ipykernel` does by cancelling its task.
+- **Cancelling a Task**: Cancels a loop running in a task, ex. one made with `asyncio.create_task()`.
+
+Either way, `asyncio.CancelledError` is raised from the `async for`, after the progress shows how far the loop got.
+
+Attributes:
+	DEFAULT_BUDGET_MS: Default milliseconds that a cell may run, before control is returned to the event loop.
+"""
+
+import asyncio
+import collections.abc as cabc
+import html
+import time
+import typing as typ
+
+DEFAULT_BUDGET_MS = 8.0
+
+T = typ.TypeVar('T')
+
+
+####################
+# - Progress
+####################
+class _Progress:
+	"""A progress bar sent to notebook clients, which is updated in place.
+
+	Notes:
+		Updates are sent as `update_display_data` messages on `iopub`.
+		Frontends without HTML support show a line of text instead.
+	"""
+
+	def __init__(self, *, total: int | None, description: str) -> None:
+		"""Display an empty progress bar."""
+		from IPython.display import display
+
+		self.total = total
+		self.description = description
+		self._handle = display(self._bundle(0, 'running'), raw=True, display_id=True)
+
+	def update(self, done: int, status: str = 'running') -> None:
+		"""Show that `done` items have been processed."""
+		if self._handle is not None:
+			self._handle.update(self._bundle(done, status), raw=True)
+
+	def _bundle(self, done: int, status: str) -> dict[str, str]:
+		"""MIME bundle showing the progress."""
+		label = f'{self.description}: ' if self.description else ''
+		count = f'{done}' if self.total is None else f'{done} / {self.total}'
+		if self.total:
+			count += f' ({100 * done / self.total:.0f}%)'
+		if status != 'running':
+			count += f' [{status}]'
+
+		bar = (
+			f'<progress value="{done}" max="{self.total}"></progress>'
+			if self.total
+			else '<progress></progress>'
+			if status == 'running'
+			else ''
+		)
+		return {
+			'text/plain': label + count,
+			'text/html': f'<div>{bar} {html.escape(label + count)}</div>',
+		}
+
+
+####################
+# - Sliced Iteration
+####################
+async def sliced(
+	iterable: cabc.Iterable[T],
+	*,
+	budget_ms: float = DEFAULT_BUDGET_MS,
+	progress: bool = False,
+	total: int | None = None,
+	description: str = '',
+) -> cabc.AsyncIterator[T]:
+	"""Iterate over `iterable`, returning control to the event loop whenever `budget_ms` have passed.
+
+	Notes:
+		The time that the `async for` body spends on each item counts towards the budget.
+		So, a slice is however many items fit into `budget_ms`, no matter how long each item takes.
+
+	Examples:
+		In a notebook cell:
+
+		```python
+		async for obj in sliced(bpy.data.objects, progress=True, description='Objects'):
+			obj.location.z += 1
+		```
+
+	Parameters:
+		iterable: Items to iterate over.
+		budget_ms: Milliseconds that each slice may take, before control is returned to the event loop.
+		progress: Whether to show a progress bar in notebook clients, which is updated after each slice.
+		total: Number of items, shown by the progress bar.
+			_When `None`, `len(iterable)` is used if possible._
+		description: Label shown by the progress bar.
+
+	Raises:
+		ValueError: If `budget_ms` isn't positive.
+		asyncio.CancelledError: If the task running the loop was cancelled, ex. by interrupting the kernel.
+	"""
+	if budget_ms <= 0:
+		msg = f'Time slices must have a positive `budget_ms` (got {budget_ms}).'
+		raise ValueError(msg)
+
+	if total is None and isinstance(iterable, cabc.Sized):
+		total = len(iterable)
+	progress_bar = _Progress(total=total, description=description) if progress else None
+
+	budget_sec = budget_ms / 1000
+	done = 0
+	status = 'stopped'
+	try:
+		deadline = time.perf_counter() + budget_sec
+		for item in iterable:
+			yield item
+			done += 1
+
+			if time.perf_counter() >= deadline:
+				if progress_bar is not None:
+					progress_bar.update(done)
+				await asyncio.sleep(0)
+				deadline = time.perf_counter() + budget_sec
+		status = 'done'
+
+	except asyncio.CancelledError:
+		status = 'cancelled'
+		raise
+
+	finally:
+		if progress_bar is not None:
+			progress_bar.update(done, status)
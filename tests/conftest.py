@@ -0,0 +1,61 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Makes the modules of `bpy_jupyter` importable by tests, without Blender.
+
+Notes:
+	The package's `__init__` registers operators and panels, which would need the real `bpy`.
+	So, like `benchmarks/kernel_soak.py`, a stand-in `bpy` is installed, and the package is created empty.
+	Its modules are then imported from `PATH_PACKAGE` as usual, ex. `from bpy_jupyter.utils import stats`.
+
+Attributes:
+	PATH_PACKAGE: Path to the `bpy_jupyter` package.
+"""
+
+import sys
+import types
+import typing as typ
+from pathlib import Path
+
+PATH_PACKAGE = Path(__file__).resolve().parent.parent / 'bpy_jupyter'
+
+
+def _stand_in_bpy() -> types.ModuleType:
+	"""A module with just those attributes of `bpy`, that the tested modules use."""
+	timers: set[typ.Callable[..., typ.Any]] = set()
+
+	bpy = types.ModuleType('bpy')
+	bpy.app = types.SimpleNamespace(  # pyright: ignore[reportAttributeAccessIssue]
+		background=True,
+		online_access=True,
+		version=(4, 4, 0),
+		handlers=types.SimpleNamespace(persistent=lambda function: function),
+		timers=types.SimpleNamespace(
+			register=lambda function, **_: timers.add(function),
+			unregister=timers.discard,
+			is_registered=lambda function: function in timers,
+		),
+	)
+	bpy.context = types.SimpleNamespace(window_manager=None, view_layer=None)  # pyright: ignore[reportAttributeAccessIssue]
+	bpy.data = types.SimpleNamespace(filepath='', objects=[])  # pyright: ignore[reportAttributeAccessIssue]
+	return bpy
+
+
+_ = sys.modules.setdefault('bpy', _stand_in_bpy())
+if 'bpy_jupyter' not in sys.modules:
+	_package = types.ModuleType('bpy_jupyter')
+	_package.__path__ = [str(PATH_PACKAGE)]
+	sys.modules['bpy_jupyter'] = _package
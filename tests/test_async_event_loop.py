@@ -0,0 +1,270 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests of the adaptive pump of `bpy_jupyter.services.async_event_loop`."""
+
+import asyncio
+import dataclasses
+import socket
+import time
+import typing as typ
+
+import pytest
+
+from bpy_jupyter.services import async_event_loop
+from bpy_jupyter.services.async_event_loop import PumpPolicy
+
+
+####################
+# - Fixtures
+####################
+@pytest.fixture
+def loop() -> typ.Iterator[asyncio.AbstractEventLoop]:
+	"""A fresh event loop, which is closed after the test."""
+	loop = asyncio.new_event_loop()
+	yield loop
+	loop.close()
+
+
+@pytest.fixture
+def current_loop(
+	loop: asyncio.AbstractEventLoop, monkeypatch: pytest.MonkeyPatch
+) -> typ.Iterator[list[None]]:
+	"""Make `loop` the current event loop, which `increment_event_loop` runs, returning a list that grows by one whenever it's run."""
+	runs: list[None] = []
+	run_forever = loop.run_forever
+
+	def counted_run_forever() -> None:
+		runs.append(None)
+		run_forever()
+
+	monkeypatch.setattr(loop, 'run_forever', counted_run_forever)
+	asyncio.set_event_loop(loop)
+	yield runs
+	asyncio.set_event_loop(None)
+
+
+@pytest.fixture
+def policy() -> typ.Iterator[PumpPolicy]:
+	"""A pump policy with round numbers, which is replaced by the default policy after the test."""
+	policy = PumpPolicy(min_interval_sec=0.001, max_interval_sec=0.01, backoff_factor=2)
+	async_event_loop.set_pump_policy(policy)
+	yield policy
+	async_event_loop.set_pump_policy(PumpPolicy())
+
+
+####################
+# - Pump Policy
+####################
+@pytest.mark.parametrize(
+	'kwargs',
+	[
+		{'min_interval_sec': 0},
+		{'min_interval_sec': 0.1, 'max_interval_sec': 0.01},
+		{'backoff_factor': 0.5},
+		{'drain_budget_sec': -1},
+		{'max_batch_hold_sec': -1},
+	],
+)
+def test_inconsistent_policy_is_rejected(kwargs: dict[str, float]) -> None:
+	with pytest.raises(ValueError, match='Pump'):
+		_ = PumpPolicy(**kwargs)
+
+
+####################
+# - Backoff
+####################
+def test_idle_ticks_back_off_until_max_interval(
+	loop: asyncio.AbstractEventLoop, policy: PumpPolicy
+) -> None:
+	intervals = [
+		async_event_loop._next_interval_sec(loop, had_work=False) for _ in range(5)
+	]
+
+	assert intervals == pytest.approx([0.002, 0.004, 0.008, 0.01, 0.01])
+	assert async_event_loop.pump_state().idle_ticks == 5
+	assert policy.max_interval_sec == intervals[-1]
+
+
+def test_work_snaps_back_to_min_interval(
+	loop: asyncio.AbstractEventLoop, policy: PumpPolicy
+) -> None:
+	for _ in range(5):
+		_ = async_event_loop._next_interval_sec(loop, had_work=False)
+
+	interval_sec = async_event_loop._next_interval_sec(loop, had_work=True)
+
+	assert interval_sec == policy.min_interval_sec
+	assert async_event_loop.pump_state().idle_ticks == 0
+
+
+def test_ready_callbacks_count_as_work(
+	loop: asyncio.AbstractEventLoop, policy: PumpPolicy
+) -> None:
+	_ = async_event_loop._next_interval_sec(loop, had_work=False)
+	_ = loop.call_soon(lambda: None)
+
+	interval_sec = async_event_loop._next_interval_sec(loop, had_work=False)
+
+	assert interval_sec == policy.min_interval_sec
+
+
+def test_backoff_does_not_oversleep_timers(
+	loop: asyncio.AbstractEventLoop, policy: PumpPolicy
+) -> None:
+	for _ in range(5):
+		_ = async_event_loop._next_interval_sec(loop, had_work=False)
+	_ = loop.call_later(0.003, lambda: None)
+
+	interval_sec = async_event_loop._next_interval_sec(loop, had_work=False)
+
+	assert policy.min_interval_sec <= interval_sec <= 0.003
+
+
+####################
+# - Pending Work
+####################
+def test_idle_loop_has_no_pending_work(loop: asyncio.AbstractEventLoop) -> None:
+	_ = loop.call_later(60, lambda: None)
+
+	assert not async_event_loop._has_pending_work(loop)
+
+
+def test_due_timer_is_pending_work(loop: asyncio.AbstractEventLoop) -> None:
+	_ = loop.call_at(loop.time() - 1, lambda: None)
+
+	assert async_event_loop._has_pending_work(loop)
+
+
+def test_ready_callback_is_pending_work(loop: asyncio.AbstractEventLoop) -> None:
+	_ = loop.call_soon(lambda: None)
+
+	assert async_event_loop._has_pending_work(loop)
+
+
+def test_readable_socket_is_pending_work(loop: asyncio.AbstractEventLoop) -> None:
+	reader, writer = socket.socketpair()
+	with reader, writer:
+		loop.add_reader(reader.fileno(), lambda: None)
+		try:
+			assert not async_event_loop._has_pending_work(loop)
+
+			_ = writer.send(b'x')
+			assert async_event_loop._has_pending_work(loop)
+		finally:
+			_ = loop.remove_reader(reader.fileno())
+
+
+####################
+# - Idle Tick Gating
+####################
+def test_gated_idle_ticks_skip_the_loop_but_back_off(
+	current_loop: list[None], policy: PumpPolicy
+) -> None:
+	assert policy.gate_idle_ticks
+	skipped_ticks = async_event_loop.pump_state().skipped_ticks
+
+	intervals = [async_event_loop.increment_event_loop() for _ in range(5)]
+
+	assert current_loop == []
+	assert intervals == pytest.approx([0.002, 0.004, 0.008, 0.01, 0.01])
+	state = async_event_loop.pump_state()
+	assert state.skipped_ticks == skipped_ticks + 5
+	assert state.iterations == 0
+
+
+def test_gated_tick_with_work_runs_the_loop(
+	loop: asyncio.AbstractEventLoop, current_loop: list[None], policy: PumpPolicy
+) -> None:
+	for _ in range(5):
+		_ = async_event_loop.increment_event_loop()
+	ran: list[None] = []
+	_ = loop.call_soon(ran.append, None)
+
+	interval_sec = async_event_loop.increment_event_loop()
+
+	assert ran == [None]
+	assert len(current_loop) == 1
+	assert interval_sec == policy.min_interval_sec
+
+
+def test_ungated_idle_ticks_run_the_loop_and_back_off(
+	current_loop: list[None], policy: PumpPolicy
+) -> None:
+	async_event_loop.set_pump_policy(dataclasses.replace(policy, gate_idle_ticks=False))
+	skipped_ticks = async_event_loop.pump_state().skipped_ticks
+
+	intervals = [async_event_loop.increment_event_loop() for _ in range(5)]
+
+	assert len(current_loop) == 5
+	assert intervals == pytest.approx([0.002, 0.004, 0.008, 0.01, 0.01])
+	state = async_event_loop.pump_state()
+	assert state.skipped_ticks == skipped_ticks
+	assert state.iterations == 1
+
+
+####################
+# - Draining
+####################
+def _chain(
+	loop: asyncio.AbstractEventLoop, length: int, *, sleep_sec: float = 0
+) -> list[int]:
+	"""Schedule a chain of callbacks, each of which schedules the next, returning the list that each appends to when run."""
+	ran: list[int] = []
+
+	def step(i: int) -> None:
+		ran.append(i)
+		if sleep_sec:
+			time.sleep(sleep_sec)
+		if i + 1 < length:
+			_ = loop.call_soon(step, i + 1)
+
+	_ = loop.call_soon(step, 0)
+	return ran
+
+
+def test_drain_runs_chained_callbacks_in_one_tick(
+	loop: asyncio.AbstractEventLoop,
+) -> None:
+	ran = _chain(loop, 10)
+
+	iterations = async_event_loop._drain(loop, budget_sec=1.0)
+
+	assert ran == list(range(10))
+	assert iterations == 10
+
+
+def test_drain_without_budget_runs_one_iteration(
+	loop: asyncio.AbstractEventLoop,
+) -> None:
+	ran = _chain(loop, 10)
+
+	iterations = async_event_loop._drain(loop, budget_sec=0)
+
+	assert ran == [0]
+	assert iterations == 1
+
+
+def test_drain_stops_starting_iterations_after_budget(
+	loop: asyncio.AbstractEventLoop,
+) -> None:
+	ran = _chain(loop, 100, sleep_sec=0.002)
+
+	iterations = async_event_loop._drain(loop, budget_sec=0.02)
+
+	## The iteration that is running when the budget runs out is finished, but no more.
+	assert 1 < iterations < 100
+	assert len(ran) == iterations
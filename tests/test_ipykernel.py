@@ -0,0 +1,240 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests of `bpy_jupyter.utils.ipykernel`, running embedded kernels in this process."""
+
+import asyncio
+import concurrent.futures
+import contextlib
+import json
+import os
+import queue
+import socket
+import subprocess
+import sys
+import typing as typ
+from pathlib import Path
+
+import jupyter_client
+import pytest
+
+from bpy_jupyter.utils import ipykernel
+from bpy_jupyter.utils.ipykernel import IPyKernel
+
+CLIENT_TIMEOUT_SEC = 10.0
+STRAY_OUTPUT_SEC = 0.5
+
+
+@pytest.fixture
+def loop() -> typ.Iterator[asyncio.AbstractEventLoop]:
+	"""A fresh event loop, which drives the kernels while clients wait for them."""
+	loop = asyncio.new_event_loop()
+	asyncio.set_event_loop(loop)
+	yield loop
+	asyncio.set_event_loop(None)
+	loop.close()
+
+
+def _connect(path_connection_file: Path) -> jupyter_client.BlockingKernelClient:
+	"""Connect a client to a kernel, once it is ready."""
+	client = jupyter_client.BlockingKernelClient(
+		connection_file=str(path_connection_file)
+	)
+	client.load_connection_file()
+	client.start_channels()
+	client.wait_for_ready(timeout=CLIENT_TIMEOUT_SEC)
+	return client
+
+
+def _run_cells(
+	clients: dict[str, jupyter_client.BlockingKernelClient],
+) -> tuple[dict[str, list[str]], dict[str, str]]:
+	"""Print the name of each kernel from a cell, returning the text of the `stream` messages of each kernel, and the status of each reply."""
+	streams: dict[str, list[str]] = {name: [] for name in clients}
+	statuses: dict[str, str] = {}
+
+	def collect(name: str, msg: dict[str, typ.Any]) -> None:
+		if msg['msg_type'] == 'stream':
+			streams[name].append(msg['content']['text'])
+
+	for name, client in clients.items():
+		reply = client.execute_interactive(
+			f'print({name!r})',
+			output_hook=lambda msg, name=name: collect(name, msg),
+			timeout=CLIENT_TIMEOUT_SEC,
+		)
+		statuses[name] = reply['content']['status']
+
+	# Collect Output Sent to Other Kernels' Clients
+	for name, client in clients.items():
+		with contextlib.suppress(queue.Empty):
+			while True:
+				collect(name, client.get_iopub_msg(timeout=STRAY_OUTPUT_SEC))
+
+	return streams, statuses
+
+
+def test_coexisting_kernels_each_output_once(
+	monkeypatch: pytest.MonkeyPatch, tmp_path: Path, loop: asyncio.AbstractEventLoop
+) -> None:
+	## 'ipykernel' never captures file descriptors while this is set, unlike in Blender.
+	monkeypatch.delenv('PYTEST_CURRENT_TEST')
+	kernels = {
+		name: IPyKernel(path_connection_file=tmp_path / f'kernel-{name}.json')
+		for name in ('first', 'second')
+	}
+	for kernel in kernels.values():
+		kernel.start()
+
+	clients: dict[str, jupyter_client.BlockingKernelClient] = {}
+	try:
+		with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+			for name, kernel in kernels.items():
+				clients[name] = loop.run_until_complete(
+					loop.run_in_executor(
+						executor, _connect, kernel.path_connection_file
+					)
+				)
+			streams, statuses = loop.run_until_complete(
+				loop.run_in_executor(executor, _run_cells, clients)
+			)
+
+		assert statuses == dict.fromkeys(kernels, 'ok')
+		assert streams == {name: [f'{name}\n'] for name in kernels}
+	finally:
+		for client in clients.values():
+			client.stop_channels()
+		for kernel in kernels.values():
+			kernel.stop(defer_reclaim=False)
+
+
+def test_fd_capture_passes_on_once_its_kernel_stops(tmp_path: Path) -> None:
+	first, second, third = (
+		IPyKernel(path_connection_file=tmp_path / f'kernel-{i}.json') for i in range(3)
+	)
+	first.start()
+	second.start()
+	try:
+		assert first._kernel_app.capture_fd_output
+		assert not second._kernel_app.capture_fd_output
+
+		first.stop(defer_reclaim=False)
+		third.start()
+		assert third._kernel_app.capture_fd_output
+	finally:
+		for kernel in (first, second, third):
+			if kernel.is_running:
+				kernel.stop(defer_reclaim=False)
+
+
+def test_start_replaces_stable_ports_taken_while_binding(
+	monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+	path_stable = tmp_path / 'stable.json'
+	kernel = IPyKernel(
+		path_connection_file=tmp_path / 'kernel.json',
+		stable_connection_file=path_stable,
+	)
+	kernel.start()
+	previous = kernel.connection_info
+	kernel.stop(defer_reclaim=False)
+
+	## Taken after the ports were checked, yet before the kernel binds them.
+	monkeypatch.setattr(ipykernel, '_is_port_free', lambda *_: True)
+	with socket.socket() as sock:
+		sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+		sock.bind((str(previous.ip), previous.shell_port))
+		sock.listen()
+
+		kernel.start()
+		try:
+			assert kernel.connection_info.shell_port != previous.shell_port
+			assert (
+				kernel.connection_info.key.get_secret_value()
+				!= previous.key.get_secret_value()
+			)
+		finally:
+			kernel.stop(defer_reclaim=False)
+
+
+def test_start_replaces_key_when_a_stable_port_is_taken(tmp_path: Path) -> None:
+	kernel = IPyKernel(
+		path_connection_file=tmp_path / 'kernel.json',
+		stable_connection_file=tmp_path / 'stable.json',
+	)
+	kernel.start()
+	previous = kernel.connection_info
+	kernel.stop(defer_reclaim=False)
+
+	## Whoever took a port may be a client of the previous run, which holds its key.
+	with socket.socket() as sock:
+		sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+		sock.bind((str(previous.ip), previous.hb_port))
+		sock.listen()
+
+		kernel.start()
+		try:
+			assert kernel.connection_info.shell_port != previous.shell_port
+			assert (
+				kernel.connection_info.key.get_secret_value()
+				!= previous.key.get_secret_value()
+			)
+		finally:
+			kernel.stop(defer_reclaim=False)
+
+
+def test_stable_connection_is_locked_to_its_process(tmp_path: Path) -> None:
+	path_stable = tmp_path / 'stable.json'
+	kernel = IPyKernel(
+		path_connection_file=tmp_path / 'kernel.json',
+		stable_connection_file=path_stable,
+	)
+	kernel.start()
+	previous = kernel.connection_info
+	kernel.stop(defer_reclaim=False)
+
+	## As if another Blender process, which is still alive, had saved it.
+	stable = json.loads(path_stable.read_text(encoding='utf-8'))
+	assert stable['pid'] == os.getpid()
+	stable['pid'] = os.getppid()
+	path_stable.write_text(json.dumps(stable), encoding='utf-8')
+
+	kernel.start()
+	try:
+		assert (
+			kernel.connection_info.key.get_secret_value()
+			!= previous.key.get_secret_value()
+		)
+	finally:
+		kernel.stop(defer_reclaim=False)
+	assert json.loads(path_stable.read_text(encoding='utf-8')) == stable
+
+	## Once that process is gone, its ports and key are reused.
+	dead = subprocess.Popen([sys.executable, '-c', ''])
+	_ = dead.wait()
+	stable['pid'] = dead.pid
+	path_stable.write_text(json.dumps(stable), encoding='utf-8')
+
+	kernel.start()
+	try:
+		assert kernel.connection_info.shell_port == previous.shell_port
+		assert (
+			kernel.connection_info.key.get_secret_value()
+			== previous.key.get_secret_value()
+		)
+	finally:
+		kernel.stop(defer_reclaim=False)
+	assert json.loads(path_stable.read_text(encoding='utf-8'))['pid'] == os.getpid()
@@ -0,0 +1,152 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests of the standalone `bpy_jupyter_registry`, which `bpy_jupyter.services.kernel_registry` writes to."""
+
+import concurrent.futures
+import os
+import subprocess
+import sys
+import time
+import types
+from pathlib import Path
+
+import pytest
+
+from bpy_jupyter.services import kernel_registry
+from bpy_jupyter.standalone import import_standalone
+
+
+@pytest.fixture
+def registry() -> types.ModuleType:
+	"""The standalone registry module, as imported by clients."""
+	return import_standalone('bpy_jupyter_registry')
+
+
+@pytest.fixture
+def dead_pid() -> int:
+	"""ID of a process that already exited."""
+	process = subprocess.Popen([sys.executable, '-c', ''])
+	_ = process.wait()
+	return process.pid
+
+
+def _entry(registry: types.ModuleType, kernel_name: str, **fields: object) -> object:
+	return registry.RegistryEntry(
+		pid=fields.pop('pid', os.getpid()),
+		kernel_name=kernel_name,
+		heartbeat=fields.pop('heartbeat', time.time()),
+		**fields,
+	)
+
+
+def test_read_of_missing_registry_is_empty(
+	registry: types.ModuleType, tmp_path: Path
+) -> None:
+	assert registry.read(tmp_path / 'registry.json') == {}
+
+
+def test_update_puts_and_removes_entries(
+	registry: types.ModuleType, tmp_path: Path
+) -> None:
+	path = tmp_path / 'registry.json'
+	entry = _entry(registry, 'default', ports={'shell_port': 1234})
+
+	_ = registry.update(path, put=[entry])
+	assert registry.read(path) == {f'{os.getpid()}/default': entry}
+	assert registry.lookup(path, os.getpid()) == entry
+
+	_ = registry.update(path, remove=[entry.key])
+	assert registry.read(path) == {}
+
+
+def test_concurrent_updates_keep_every_entry(
+	registry: types.ModuleType, tmp_path: Path
+) -> None:
+	path = tmp_path / 'registry.json'
+
+	def put(i: int) -> None:
+		_ = registry.update(path, put=[_entry(registry, f'kernel-{i}')])
+
+	with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+		_ = list(executor.map(put, range(64)))
+
+	assert len(registry.read(path)) == 64
+
+
+def test_read_skips_stale_entries(
+	registry: types.ModuleType, tmp_path: Path, dead_pid: int
+) -> None:
+	path = tmp_path / 'registry.json'
+	fresh = _entry(registry, 'fresh')
+	## Entries are put after pruning, so stale ones are written as-is.
+	_ = registry.update(
+		path,
+		put=[
+			fresh,
+			_entry(registry, 'dead', pid=dead_pid),
+			_entry(registry, 'expired', heartbeat=0.0),
+		],
+	)
+
+	assert registry.read(path) == {fresh.key: fresh}
+	assert registry.lookup(path, dead_pid, 'dead') is None
+	assert registry.lookup(path, os.getpid(), 'expired') is None
+
+
+def test_stale_after_three_missed_heartbeats(registry: types.ModuleType) -> None:
+	assert registry.STALE_SEC == 3 * kernel_registry.HEARTBEAT_SEC
+
+
+def test_live_entry_goes_stale_without_heartbeats(
+	registry: types.ModuleType, tmp_path: Path
+) -> None:
+	path = tmp_path / 'registry.json'
+	now = time.time()
+	entry = _entry(registry, 'hung', heartbeat=now)
+	_ = registry.update(path, put=[entry])
+
+	assert not entry.is_stale(now + registry.STALE_SEC - 1)
+	assert entry.is_stale(now + registry.STALE_SEC + 1)
+
+	## The process is alive, but it stopped refreshing its entry.
+	hung = _entry(registry, 'hung', heartbeat=now - registry.STALE_SEC - 1)
+	_ = registry.update(path, put=[hung])
+	assert registry.read(path) == {}
+
+
+def test_update_prunes_stale_entries_and_connection_files_of_dead_processes(
+	registry: types.ModuleType, tmp_path: Path, dead_pid: int
+) -> None:
+	path = tmp_path / 'registry.json'
+	path_dead = tmp_path / str(dead_pid) / 'connection.json'
+	path_expired = tmp_path / str(os.getpid()) / 'connection.json'
+	for path_connection_file in (path_dead, path_expired):
+		path_connection_file.parent.mkdir()
+		_ = path_connection_file.write_text('{}')
+
+	dead = _entry(registry, 'default', pid=dead_pid, connection_file=str(path_dead))
+	expired = _entry(
+		registry, 'expired', heartbeat=0.0, connection_file=str(path_expired)
+	)
+	_ = registry.update(path, put=[dead, expired])
+
+	entries = registry.update(path)
+
+	assert entries == {}
+	assert not path_dead.parent.exists()
+	## Its process is alive, and refreshes the entry again.
+	assert path_expired.exists()
@@ -0,0 +1,193 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests of `bpy_jupyter.services.main_thread_dispatch`."""
+
+import asyncio
+import collections
+import threading
+import time
+import typing as typ
+
+import pytest
+
+from bpy_jupyter.services import async_event_loop, main_thread_dispatch
+
+
+@pytest.fixture
+def no_event_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+	"""Pretend that the event loop was never started."""
+	monkeypatch.setattr(async_event_loop, 'EVENT_LOOP', None)
+
+
+@pytest.fixture
+def event_loop(
+	monkeypatch: pytest.MonkeyPatch,
+) -> typ.Iterator[asyncio.AbstractEventLoop]:
+	"""A fresh event loop, used as if started by `async_event_loop.start()`."""
+	loop = asyncio.new_event_loop()
+	monkeypatch.setattr(async_event_loop, 'EVENT_LOOP', loop)
+	yield loop
+	loop.close()
+
+
+@pytest.fixture
+def fresh_dispatch(monkeypatch: pytest.MonkeyPatch) -> None:
+	"""An empty queue and no measurements, regardless of what earlier tests submitted."""
+	monkeypatch.setattr(main_thread_dispatch, '_QUEUE', collections.deque())
+	monkeypatch.setattr(main_thread_dispatch, '_BATCH_SCHEDULED', False)
+	monkeypatch.setattr(
+		main_thread_dispatch, '_SAMPLES', main_thread_dispatch._DispatchSamples()
+	)
+
+
+def _run_iteration(loop: asyncio.AbstractEventLoop) -> None:
+	"""Run exactly one iteration of the event loop, like one increment of `async_event_loop` does."""
+	_ = loop.call_soon(loop.stop)
+	loop.run_forever()
+
+
+@pytest.mark.usefixtures('no_event_loop')
+def test_submit_without_event_loop_queues_nothing() -> None:
+	submitted = main_thread_dispatch.metrics().submitted
+
+	with pytest.raises(RuntimeError, match='never started'):
+		_ = main_thread_dispatch.submit(print, 'never printed')
+
+	metrics = main_thread_dispatch.metrics()
+	assert metrics.queue_depth == 0
+	assert metrics.submitted == submitted
+
+
+def test_failed_submission_does_not_run_in_later_batch(
+	monkeypatch: pytest.MonkeyPatch, event_loop: asyncio.AbstractEventLoop
+) -> None:
+	ran: list[str] = []
+	monkeypatch.setattr(async_event_loop, 'EVENT_LOOP', None)
+	with pytest.raises(RuntimeError):
+		_ = main_thread_dispatch.submit(ran.append, 'failed')
+
+	monkeypatch.setattr(async_event_loop, 'EVENT_LOOP', event_loop)
+	future = main_thread_dispatch.submit(ran.append, 'submitted')
+	event_loop.run_until_complete(asyncio.wrap_future(future, loop=event_loop))
+
+	assert ran == ['submitted']
+
+
+@pytest.mark.usefixtures('fresh_dispatch')
+def test_submissions_from_threads_coalesce_into_one_batch(
+	monkeypatch: pytest.MonkeyPatch, event_loop: asyncio.AbstractEventLoop
+) -> None:
+	## Never spent by these submissions, however slow the machine.
+	monkeypatch.setattr(main_thread_dispatch, 'BATCH_BUDGET_SEC', 60.0)
+	ran_on: list[int] = []
+	threads = [
+		threading.Thread(
+			target=main_thread_dispatch.submit,
+			args=(lambda: ran_on.append(threading.get_ident()),),
+		)
+		for _ in range(8)
+	]
+	for thread in threads:
+		thread.start()
+	for thread in threads:
+		thread.join()
+
+	## Only the first submission into the empty queue scheduled a batch.
+	assert main_thread_dispatch.metrics().queue_depth == 8
+	assert len(event_loop._ready) == 1
+
+	_run_iteration(event_loop)
+
+	assert ran_on == [threading.get_ident()] * 8
+	assert list(main_thread_dispatch._SAMPLES.batch_size) == [8]
+	assert main_thread_dispatch.metrics().queue_depth == 0
+
+
+@pytest.mark.usefixtures('fresh_dispatch')
+def test_batch_stops_at_budget_and_leaves_the_rest_to_later_iterations(
+	monkeypatch: pytest.MonkeyPatch, event_loop: asyncio.AbstractEventLoop
+) -> None:
+	## Spent as soon as any submission has run.
+	monkeypatch.setattr(main_thread_dispatch, 'BATCH_BUDGET_SEC', 0.0)
+	ran: list[int] = []
+	futures = [main_thread_dispatch.submit(ran.append, i) for i in range(3)]
+
+	_run_iteration(event_loop)
+	assert ran == [0]
+	assert list(main_thread_dispatch._SAMPLES.batch_size) == [1]
+	assert [submission.args for submission in main_thread_dispatch._QUEUE] == [
+		(1,),
+		(2,),
+	]
+	assert not futures[1].done()
+
+	_run_iteration(event_loop)
+	_run_iteration(event_loop)
+	assert ran == [0, 1, 2]
+	assert list(main_thread_dispatch._SAMPLES.batch_size) == [1, 1, 1]
+	assert not main_thread_dispatch._QUEUE
+	assert all(future.done() for future in futures)
+
+
+@pytest.mark.usefixtures('fresh_dispatch')
+def test_cancelled_submission_never_runs(
+	event_loop: asyncio.AbstractEventLoop,
+) -> None:
+	ran: list[str] = []
+	cancelled = main_thread_dispatch.submit(ran.append, 'cancelled')
+	submitted = main_thread_dispatch.submit(ran.append, 'submitted')
+	assert cancelled.cancel()
+
+	_run_iteration(event_loop)
+
+	assert ran == ['submitted']
+	assert cancelled.cancelled()
+	assert submitted.result(timeout=0) is None
+
+	metrics = main_thread_dispatch.metrics()
+	assert metrics.completed == 2
+	assert metrics.batch_size.max == 2
+	## Only submissions that ran were measured.
+	assert metrics.wait_sec.count == 1
+	assert metrics.run_sec.count == 1
+
+
+@pytest.mark.usefixtures('fresh_dispatch')
+def test_metrics_measure_queue_depth_and_wait_time(
+	monkeypatch: pytest.MonkeyPatch, event_loop: asyncio.AbstractEventLoop
+) -> None:
+	monkeypatch.setattr(main_thread_dispatch, 'BATCH_BUDGET_SEC', 60.0)
+	wait_sec = 0.05
+	for i in range(3):
+		_ = main_thread_dispatch.submit(str, i)
+
+	metrics = main_thread_dispatch.metrics()
+	assert metrics.queue_depth == 3
+	assert metrics.submitted == 3
+	assert metrics.completed == 0
+	assert metrics.wait_sec.count == 0
+
+	time.sleep(wait_sec)
+	_run_iteration(event_loop)
+
+	metrics = main_thread_dispatch.metrics()
+	assert metrics.queue_depth == 0
+	assert metrics.completed == 3
+	assert metrics.wait_sec.count == 3
+	assert min(main_thread_dispatch._SAMPLES.wait_sec) >= wait_sec
+	assert metrics.batch_size.count == 1
+	assert metrics.batch_size.max == 3
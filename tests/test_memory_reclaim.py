@@ -0,0 +1,137 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests of `bpy_jupyter.utils.memory_reclaim`."""
+
+import asyncio
+import gc
+import sys
+import typing as typ
+
+import numpy as np
+import pytest
+
+from bpy_jupyter.services import async_event_loop
+from bpy_jupyter.utils.memory_reclaim import MemoryReclaim, estimate_nbytes
+
+NUM_GENERATIONS = len(gc.get_count())
+
+
+@pytest.fixture
+def loop() -> typ.Iterator[asyncio.AbstractEventLoop]:
+	loop = asyncio.new_event_loop()
+	yield loop
+	loop.close()
+
+
+####################
+# - estimate_nbytes
+####################
+def test_estimate_uses_nbytes_of_arrays() -> None:
+	assert estimate_nbytes(np.zeros(1000, dtype='<f8')) == 8000
+
+
+def test_estimate_adds_elements_of_containers() -> None:
+	values = [np.zeros(100, dtype='<f8') for _ in range(10)]
+
+	assert estimate_nbytes(values) == sys.getsizeof(values) + 10 * 800
+
+
+def test_estimate_extrapolates_from_sampled_elements() -> None:
+	values = [np.zeros(100, dtype='<f8') for _ in range(10)]
+
+	assert estimate_nbytes(values, max_items=2) == sys.getsizeof(values) + 10 * 800
+
+
+def test_estimate_stops_at_max_depth() -> None:
+	values = [[np.zeros(100, dtype='<f8')]]
+
+	assert estimate_nbytes(values, max_depth=1) == sys.getsizeof(values) + (
+		sys.getsizeof(values[0])
+	)
+
+
+def test_estimate_of_unsized_value_is_zero() -> None:
+	class Unsized:
+		def __sizeof__(self) -> int:
+			raise TypeError
+
+	assert estimate_nbytes(Unsized()) == 0
+
+
+####################
+# - MemoryReclaim
+####################
+def test_step_drops_at_least_one_entry_per_step() -> None:
+	namespace = {f'x{i}': i for i in range(10)}
+	reclaim = MemoryReclaim([namespace], budget_ms=0)
+
+	assert not reclaim.step()
+
+	assert len(namespace) == 9
+	assert reclaim.stats.dropped_names == 1
+	assert reclaim.stats.steps == 1
+
+
+def test_run_empties_namespaces_then_collects_each_generation() -> None:
+	namespaces = [{'a': 1, 'b': 2}, {'c': 3}]
+	reclaim = MemoryReclaim([*namespaces, namespaces[0]], budget_ms=0)
+
+	stats = reclaim.run()
+
+	assert namespaces == [{}, {}]
+	assert stats.done
+	assert stats.dropped_names == 3
+	## One step per entry, and one per generation.
+	assert stats.steps == 3 + NUM_GENERATIONS
+	assert reclaim.step()
+	assert reclaim.stats.steps == stats.steps
+
+
+def test_run_collects_unreachable_cycles() -> None:
+	cycle: list[typ.Any] = []
+	cycle.append(cycle)
+	namespace = {'cycle': cycle}
+	del cycle
+
+	stats = MemoryReclaim([namespace]).run()
+
+	assert stats.collected_objects >= 1
+
+
+def test_run_completes_scheduled_future(loop: asyncio.AbstractEventLoop) -> None:
+	reclaim = MemoryReclaim([{'a': 1}])
+	future = reclaim.schedule(loop)
+
+	stats = reclaim.run()
+
+	assert future.result() == stats
+
+
+def test_scheduled_steps_run_once_per_pump_tick(
+	loop: asyncio.AbstractEventLoop,
+) -> None:
+	namespace = {f'x{i}': i for i in range(5)}
+	reclaim = MemoryReclaim([namespace], budget_ms=0)
+	future = reclaim.schedule(loop)
+
+	ticks = 0
+	while not future.done():
+		_ = async_event_loop._drain(loop, budget_sec=1.0)
+		ticks += 1
+		assert reclaim.stats.steps == ticks
+
+	assert future.result().steps == 5 + NUM_GENERATIONS
@@ -0,0 +1,139 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests of `bpy_jupyter.utils.output_history`."""
+
+import typing as typ
+
+import numpy as np
+import pytest
+from IPython.core.interactiveshell import InteractiveShell
+from traitlets.config import Config
+
+from bpy_jupyter.utils.ipykernel import _close_shell
+from bpy_jupyter.utils.output_history import BoundedDisplayHook
+
+KIB = 1024
+
+
+@pytest.fixture
+def hook() -> typ.Iterator[BoundedDisplayHook]:
+	"""A display hook of a shell without history, whose output history holds `4 KiB`."""
+	shell = InteractiveShell(config=Config({'HistoryManager': {'enabled': False}}))
+	yield BoundedDisplayHook(shell=shell, max_bytes=4 * KIB)
+	_close_shell(shell)
+
+
+def _display(hook: BoundedDisplayHook, result: typ.Any) -> None:
+	"""Display a result as a new cell would."""
+	hook.shell.execution_count += 1
+	hook.update_user_ns(result)
+
+
+def _array(kib: int) -> np.ndarray:
+	return np.zeros(kib * KIB, dtype=np.uint8)
+
+
+def test_results_that_fit_are_kept(hook: BoundedDisplayHook) -> None:
+	results = [_array(1), _array(1)]
+	for result in results:
+		_display(hook, result)
+
+	stats = hook.stats()
+	assert stats.entries == 2
+	assert stats.nbytes == 2 * KIB
+	assert stats.evicted_entries == 0
+
+
+def test_least_recently_displayed_results_are_evicted(
+	hook: BoundedDisplayHook,
+) -> None:
+	for _ in range(3):
+		_display(hook, _array(2))
+
+	user_ns = hook.shell.user_ns
+	assert list(user_ns['_oh']) == [3, 4]
+	assert '_2' not in user_ns
+	assert '_3' in user_ns
+	assert '_4' in user_ns
+
+	stats = hook.stats()
+	assert stats.nbytes == 4 * KIB
+	assert stats.evicted_entries == 1
+	assert stats.evicted_bytes == 2 * KIB
+
+
+def test_most_recent_result_is_never_evicted(hook: BoundedDisplayHook) -> None:
+	_display(hook, _array(1))
+	result = _array(8)
+	_display(hook, result)
+
+	assert list(hook.shell.user_ns['_oh'].values()) == [result]
+	assert hook.shell.user_ns['_'] is result
+
+
+def test_evicted_results_are_removed_from_underscores(
+	hook: BoundedDisplayHook,
+) -> None:
+	first = _array(3)
+	_display(hook, first)
+	_display(hook, _array(3))
+
+	user_ns = hook.shell.user_ns
+	assert list(user_ns['_oh']) == [3]
+	assert user_ns['__'] == ''
+	assert hook.__ == ''
+
+
+def test_redisplayed_result_counts_once_as_recent(hook: BoundedDisplayHook) -> None:
+	first = _array(2)
+	_display(hook, first)
+	_display(hook, _array(1))
+	_display(hook, first)
+	_display(hook, _array(2))
+
+	## 'first' outlives the 1 KiB result, since it was displayed again after it.
+	history = hook.shell.user_ns['_oh']
+	assert list(history) == [4, 5]
+	assert history[4] is first
+	assert hook.stats().nbytes == 4 * KIB
+
+
+def test_lowering_max_bytes_then_evicting(hook: BoundedDisplayHook) -> None:
+	for _ in range(2):
+		_display(hook, _array(2))
+
+	hook.max_bytes = 2 * KIB
+	hook.evict()
+
+	assert list(hook.shell.user_ns['_oh']) == [3]
+
+
+def test_unbounded_history_evicts_nothing(hook: BoundedDisplayHook) -> None:
+	hook.max_bytes = None
+	for _ in range(4):
+		_display(hook, _array(2))
+
+	assert hook.stats().entries == 4
+	assert hook.stats().evicted_entries == 0
+
+
+def test_flush_forgets_sizes(hook: BoundedDisplayHook) -> None:
+	_display(hook, _array(2))
+
+	hook.flush()
+
+	assert hook.stats().nbytes == 0
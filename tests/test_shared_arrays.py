@@ -0,0 +1,62 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests of `bpy_jupyter.utils.shared_arrays`, and of sharing arrays with processes without `bpy`."""
+
+import asyncio
+import pickle
+
+import numpy as np
+
+from bpy_jupyter.services import process_pool
+from bpy_jupyter.utils.shared_arrays import SharedArray
+
+
+def test_spec_pickles_by_standalone_module() -> None:
+	with SharedArray((3,), '<f4') as shared:
+		assert type(shared.spec).__module__ == 'bpy_jupyter_arrays'
+		assert shared.spec.nbytes == 12
+
+
+def test_spec_attaches_in_same_process() -> None:
+	with SharedArray.from_array(np.arange(10, dtype='<f8')) as shared:
+		with shared.spec.attach() as array:
+			array[0] = 100
+
+		assert shared.array.sum() == 145
+
+
+def test_spec_unpickles_in_spawned_worker() -> None:
+	## Workers import nothing of 'bpy_jupyter', so they can only unpickle specs by their standalone module.
+	process_pool.start(max_workers=1)
+	try:
+		with SharedArray((3,), '<f4') as shared:
+			spec = asyncio.run(
+				process_pool.run(pickle.loads, pickle.dumps(shared.spec))
+			)
+			assert spec == shared.spec
+	finally:
+		process_pool.stop()
+
+
+def test_pool_reports_its_worker_count() -> None:
+	process_pool.start(max_workers=2)
+	try:
+		assert process_pool.metrics().max_workers == 2
+	finally:
+		process_pool.stop()
+
+	assert process_pool.metrics().max_workers == 0
@@ -0,0 +1,68 @@
+# bpy_jupyter
+# Copyright (C) 2025 bpy_jupyter Project Contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests of `bpy_jupyter.utils.stats`."""
+
+import collections
+
+import pytest
+
+from bpy_jupyter.utils.stats import SeriesSummary
+
+
+def test_empty_series_summarizes_to_zero() -> None:
+	assert SeriesSummary.from_samples([]) == SeriesSummary()
+
+
+def test_single_sample_is_every_statistic() -> None:
+	summary = SeriesSummary.from_samples([2.5])
+
+	assert summary == SeriesSummary(count=1, mean=2.5, p50=2.5, p95=2.5, max=2.5)
+
+
+def test_percentiles_use_nearest_rank() -> None:
+	summary = SeriesSummary.from_samples(range(1, 101))
+
+	assert summary.count == 100
+	assert summary.mean == pytest.approx(50.5)
+	assert summary.p50 == 50
+	assert summary.p95 == 95
+	assert summary.max == 100
+
+
+def test_percentiles_never_interpolate() -> None:
+	summary = SeriesSummary.from_samples([1.0, 10.0])
+
+	assert summary.p50 == 1.0
+	assert summary.p95 == 10.0
+
+
+def test_order_of_samples_does_not_matter() -> None:
+	samples = [5.0, 1.0, 4.0, 2.0, 3.0]
+
+	assert SeriesSummary.from_samples(samples) == SeriesSummary.from_samples(
+		sorted(samples)
+	)
+
+
+def test_ring_buffer_only_summarizes_retained_samples() -> None:
+	ring = collections.deque(range(1000), maxlen=10)
+
+	summary = SeriesSummary.from_samples(ring)
+
+	assert summary.count == 10
+	assert summary.p50 == 994
+	assert summary.max == 999